@@ -0,0 +1,72 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2021 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark loading a catalog split into one file per control against loading it as a single file."""
+import logging
+import os
+import pathlib
+import sys
+import tempfile
+import timeit
+
+from prune_ben import make_catalog
+
+from trestle.cli import Trestle
+from trestle.oscal import catalog as cat
+from trestle.utils.load_distributed import _LoadPlan, _load_distributed, load_distributed
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.StreamHandler())
+
+
+def run(n_groups: int, n_controls: int, n_enhancements: int) -> None:
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        trestle_root = pathlib.Path(tmp_dir).resolve()
+        os.chdir(trestle_root)
+        sys.argv = ['trestle', 'init']
+        Trestle().run()
+        catalog_dir = trestle_root / 'catalogs/big'
+        catalog_dir.mkdir(parents=True)
+        catalog_path = catalog_dir / 'catalog.json'
+        make_catalog(n_groups, n_controls, n_enhancements).oscal_write(catalog_path)
+
+        tick = timeit.default_timer()
+        cat.Catalog.oscal_read(catalog_path)
+        tock = timeit.default_timer()
+        time_single = tock - tick
+
+        os.chdir(catalog_dir)
+        sys.argv = ['trestle', 'split', '-f', 'catalog.json', '-e', 'catalog.groups.*.controls.*']
+        Trestle().run()
+        os.chdir(trestle_root)
+
+        tick = timeit.default_timer()
+        load_distributed(catalog_path, trestle_root)
+        tock = timeit.default_timer()
+        # a plan without a scan reads every file and lists every directory as it goes
+        _load_distributed(catalog_path, trestle_root, None, _LoadPlan(trestle_root))
+        tuck = timeit.default_timer()
+
+    logger.info('-----------------------------')
+    logger.info(f'Catalog with {n_groups * n_controls} control files')
+    logger.info(f'Time to read single file:             {time_single}')
+    logger.info(f'Time to load split with plan:         {tock - tick}')
+    logger.info(f'Time to load split file by file:      {tuck - tock}')
+
+
+if __name__ == '__main__':
+    run(20, 250, 2)
@@ -0,0 +1,89 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2021 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark profile resolver pruning on a large synthetic catalog."""
+import logging
+import timeit
+
+from trestle.core import generators as gens
+from trestle.core.profile_resolver import ProfileResolver
+from trestle.oscal import catalog as cat
+from trestle.oscal import profile as prof
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.StreamHandler())
+
+
+def make_catalog(n_groups: int, n_controls: int, n_enhancements: int) -> cat.Catalog:
+    """Make a catalog with groups of controls, each with enhancements."""
+    catalog = gens.generate_sample_model(cat.Catalog)
+    catalog.groups = []
+    for group_index in range(n_groups):
+        group_id = f'g{group_index}'
+        controls = []
+        for control_index in range(n_controls):
+            control_id = f'{group_id}-{control_index}'
+            sub_controls = [
+                cat.Control(id=f'{control_id}.{enh_index}', title=f'enhancement {enh_index}')
+                for enh_index in range(n_enhancements)
+            ]
+            controls.append(cat.Control(id=control_id, title=f'control {control_index}', controls=sub_controls))
+        catalog.groups.append(cat.Group(id=group_id, title=f'group {group_index}', controls=controls))
+    return catalog
+
+
+def make_profile(catalog: cat.Catalog) -> prof.Profile:
+    """Make a profile selecting every control with its children and excluding one enhancement of each."""
+    include_ids = []
+    exclude_ids = []
+    for group in catalog.groups:
+        for control in group.controls:
+            include_ids.append(prof.WithId(__root__=control.id))
+            exclude_ids.append(prof.WithId(__root__=control.controls[0].id))
+    profile = gens.generate_sample_model(prof.Profile)
+    profile.imports = [
+        prof.Import(
+            href='trestle://catalogs/synthetic/catalog.json',
+            include_controls=[
+                prof.SelectControlById(with_child_controls=prof.WithChildControls.yes, with_ids=include_ids)
+            ],
+            exclude_controls=[prof.SelectControlById(with_ids=exclude_ids)]
+        )
+    ]
+    return profile
+
+
+def run(n_groups: int, n_controls: int, n_enhancements: int) -> None:
+    """Run the benchmark."""
+    catalog = make_catalog(n_groups, n_controls, n_enhancements)
+    profile = make_profile(catalog)
+    n_total = n_groups * n_controls * (n_enhancements + 1)
+    prune = ProfileResolver.Prune(profile.imports[0], profile)
+    tick = timeit.default_timer()
+    prune._set_catalog(catalog)
+    tock = timeit.default_timer()
+    pruned = prune._prune_catalog()
+    tuck = timeit.default_timer()
+    n_kept = sum(len(group.controls) * (1 + len(group.controls[0].controls or [])) for group in pruned.groups)
+    logger.info('-----------------------------')
+    logger.info(f'Catalog with {n_total} controls pruned to {n_kept} controls')
+    logger.info(f'Time to index catalog:  {tock - tick}')
+    logger.info(f'Time to prune catalog:  {tuck - tock}')
+
+
+if __name__ == '__main__':
+    # 20 groups of 250 controls with 3 enhancements each gives 20k controls
+    run(20, 250, 3)
@@ -0,0 +1,48 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2021 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark building a model from trusted content without validation against parsing it with full validation."""
+import logging
+import timeit
+
+import orjson
+
+from prune_ben import make_catalog
+
+from trestle.oscal.catalog import Catalog
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.StreamHandler())
+
+
+def run(n_groups: int, n_controls: int, n_enhancements: int, repeat: int) -> None:
+    """Run the benchmark."""
+    catalog = make_catalog(n_groups, n_controls, n_enhancements)
+    n_total = n_groups * n_controls * (n_enhancements + 1)
+    obj = orjson.loads(catalog.oscal_serialize_json_bytes())['catalog']
+    assert Catalog.parse_obj_trusted(obj) == Catalog.parse_obj(obj)
+    validated_time = min(timeit.repeat(lambda: Catalog.parse_obj(obj), number=1, repeat=repeat))
+    trusted_time = min(timeit.repeat(lambda: Catalog.parse_obj_trusted(obj), number=1, repeat=repeat))
+    logger.info('-----------------------------')
+    logger.info(f'Catalog with {n_total} controls built from its dict')
+    logger.info(f'Time with full validation: {validated_time}')
+    logger.info(f'Time trusted:              {trusted_time}')
+    logger.info(f'Speedup:                   {validated_time / trusted_time:.1f}x')
+
+
+if __name__ == '__main__':
+    # 10 groups of 250 controls with 1 enhancement each gives 5k controls
+    run(10, 250, 1, 3)
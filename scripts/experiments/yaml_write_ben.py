@@ -0,0 +1,57 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2021 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark writing a model as yaml directly against the previous round trip through json."""
+import io
+import logging
+import timeit
+
+from prune_ben import make_catalog
+
+from ruamel.yaml import YAML
+
+from trestle.core.base_model import OscalBaseModel
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.StreamHandler())
+
+
+def json_round_trip_yaml(model: OscalBaseModel) -> str:
+    """Write the model as yaml the previous way, by loading its json with ruamel.yaml and dumping that."""
+    yaml = YAML(typ='safe')
+    string_stream = io.StringIO()
+    yaml.dump(yaml.load(model.oscal_serialize_json()), string_stream)
+    return string_stream.getvalue()
+
+
+def run(n_groups: int, n_controls: int, n_enhancements: int, repeat: int) -> None:
+    """Run the benchmark."""
+    catalog = make_catalog(n_groups, n_controls, n_enhancements)
+    n_total = n_groups * n_controls * (n_enhancements + 1)
+    assert json_round_trip_yaml(catalog) == catalog.oscal_serialize_yaml()
+    round_trip_time = min(timeit.repeat(lambda: json_round_trip_yaml(catalog), number=1, repeat=repeat))
+    direct_time = min(timeit.repeat(lambda: catalog.oscal_serialize_yaml(), number=1, repeat=repeat))
+    json_time = min(timeit.repeat(lambda: catalog.oscal_serialize_json_bytes(pretty=True), number=1, repeat=repeat))
+    logger.info('-----------------------------')
+    logger.info(f'Catalog with {n_total} controls written as yaml')
+    logger.info(f'Time via json round trip:  {round_trip_time}')
+    logger.info(f'Time direct from dict:     {direct_time}')
+    logger.info(f'Time for json for reference: {json_time}')
+
+
+if __name__ == '__main__':
+    # 10 groups of 250 controls with 1 enhancement each gives 5k controls
+    run(10, 250, 1, 3)
@@ -13,13 +13,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Testing of customization of pydantic base model."""
+import io
 import json
 import pathlib
 from datetime import datetime, timezone, tzinfo
+from typing import List
 from uuid import uuid4
 
 import pytest
 
+from ruamel.yaml import YAML
+
 import tests.test_utils as test_utils
 
 import trestle.core.base_model as ospydantic
@@ -30,6 +34,7 @@ import trestle.oscal.assessment_plan as ap
 import trestle.oscal.catalog as oscatalog
 import trestle.oscal.common as common
 import trestle.oscal.component as component
+import trestle.oscal.profile as prof
 import trestle.oscal.ssp as ssp
 from trestle.core.base_model import OscalBaseModel
 
@@ -180,6 +185,24 @@ def test_stripping_model_class() -> None:
         raise Exception('Test failure')
 
 
+def test_stripped_model_type_registry() -> None:
+    """Test stripped and collection wrapper types are created once and shared."""
+    stripped_by_name = oscatalog.Catalog.create_stripped_model_type(stripped_fields=['metadata', 'back_matter'])
+    stripped_by_alias = oscatalog.Catalog.create_stripped_model_type(
+        stripped_fields_aliases=['back-matter', 'metadata']
+    )
+    assert stripped_by_name is stripped_by_alias
+    assert oscatalog.Catalog.create_stripped_model_type(stripped_fields=['metadata']) is not stripped_by_name
+    assert oscatalog.Group.create_stripped_model_type(stripped_fields=['controls']) is not \
+        oscatalog.Catalog.create_stripped_model_type(stripped_fields=['controls'])
+
+    wrapper = ospydantic.get_collection_wrapper_type('Controls', List[oscatalog.Control])
+    assert wrapper is ospydantic.get_collection_wrapper_type('Controls', List[oscatalog.Control])
+    assert wrapper is not ospydantic.get_collection_wrapper_type('Groups', List[oscatalog.Group])
+    controls = wrapper.parse_obj([{'id': 'ac-1', 'title': 'control'}])
+    assert controls.__root__[0].id == 'ac-1'
+
+
 def test_stripped_model_type_failure() -> None:
     """Test for user failure conditions."""
     with pytest.raises(err.TrestleError):
@@ -351,3 +374,94 @@ def test_oscal_serialize_json() -> None:
     new_catalog = oscatalog.Catalog.parse_obj(jsoned['catalog'])
 
     assert simple_catalog_obj.metadata.title == new_catalog.metadata.title
+
+
+@pytest.mark.parametrize('default_flow_style', [None, False])
+def test_oscal_serialize_yaml(default_flow_style) -> None:
+    """Test yaml written directly from the dict matches yaml loaded from the json with ruamel.yaml and dumped."""
+    catalog = oscatalog.Catalog.oscal_read(test_utils.JSON_TEST_DATA_PATH / 'simplified_nist_catalog.json')
+    # include values such as yes that are quoted in yaml 1.1 but not in yaml 1.2
+    catalog.metadata.remarks = 'yes'
+    catalog.metadata.props = [common.Property(name='time', value='1:30', class_='on')]
+
+    yaml = YAML(typ='safe')
+    yaml.default_flow_style = default_flow_style
+    string_stream = io.StringIO()
+    yaml.dump(yaml.load(catalog.oscal_serialize_json()), string_stream)
+
+    assert catalog.oscal_serialize_yaml(default_flow_style=default_flow_style) == string_stream.getvalue()
+    assert oscatalog.Catalog.parse_obj(yaml.load(catalog.oscal_serialize_yaml(wrapped=False))) == catalog
+
+
+def test_yaml_load(tmp_path: pathlib.Path) -> None:
+    """Test yaml is loaded by the yaml 1.2 rules as with ruamel.yaml, keeping the timezone of timestamps."""
+    yaml_file = tmp_path / 'values.yaml'
+    yaml_file.write_text('a: yes\nb: 017\nc: 0o17\nd: 1:30\ne: true\nf: 2020-01-01T10:00:00+02:00\n')
+    loaded = ospydantic.yaml_load(yaml_file)
+    ruamel_loaded = YAML(typ='safe').load(yaml_file)
+    assert {
+        key: value
+        for key, value in loaded.items()
+        if key != 'f'
+    } == {
+        key: value
+        for key, value in ruamel_loaded.items()
+        if key != 'f'
+    }
+    assert loaded['b'] == 17
+    assert loaded['f'] == datetime(2020, 1, 1, 8, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize('mmap_min_file_size', [const.MMAP_MIN_FILE_SIZE, 1])
+def test_json_load(mmap_min_file_size: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test json files are loaded the same whether they are read into a buffer or mapped into memory."""
+    monkeypatch.setattr(const, 'MMAP_MIN_FILE_SIZE', mmap_min_file_size)
+    json_file = test_utils.JSON_TEST_DATA_PATH / 'simplified_nist_catalog.json'
+    expected = json.loads(json_file.read_text(encoding=const.FILE_ENCODING))
+    assert ospydantic.json_load(json_file) == expected
+    catalog = oscatalog.Catalog.oscal_read(json_file)
+    assert catalog == oscatalog.Catalog.parse_obj(expected['catalog'])
+
+
+@pytest.mark.parametrize(
+    'model_path',
+    [
+        test_utils.JSON_TEST_DATA_PATH / 'simplified_nist_catalog.json',
+        test_utils.JSON_TEST_DATA_PATH / 'simplified_nist_profile.json',
+        test_utils.YAML_TEST_DATA_PATH / 'good_component.yaml'
+    ]
+)
+def test_parse_obj_trusted(model_path: pathlib.Path) -> None:
+    """Test models built from trusted content are the same as those built with full validation."""
+    obj = OscalBaseModel.oscal_read_raw(model_path)
+    model_alias = list(obj.keys())[0]
+    model_types = {
+        'catalog': oscatalog.Catalog, 'profile': prof.Profile, 'component-definition': component.ComponentDefinition
+    }
+    model_type = model_types[model_alias]
+    validated = model_type.parse_obj(obj[model_alias])
+    trusted = model_type.parse_obj_trusted(obj[model_alias])
+    assert trusted == validated
+    assert trusted.dict(exclude_unset=True) == validated.dict(exclude_unset=True)
+    assert trusted.oscal_serialize_json_bytes() == validated.oscal_serialize_json_bytes()
+
+
+def test_oscal_read_trusted(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test trusted load is selected per call or by the environment variable, and can be forced off."""
+    catalog_path = tmp_path / 'catalog.json'
+    catalog_path.write_text('{"catalog": {"uuid": "not a uuid"}}', encoding=const.FILE_ENCODING)
+    monkeypatch.delenv(const.TRESTLE_TRUSTED_LOAD_ENV, raising=False)
+    with pytest.raises(err.TrestleError):
+        oscatalog.Catalog.oscal_read(catalog_path)
+    # the invalid content is accepted since it is not validated
+    assert oscatalog.Catalog.oscal_read(catalog_path, trusted=True).uuid == 'not a uuid'
+    monkeypatch.setenv(const.TRESTLE_TRUSTED_LOAD_ENV, 'true')
+    assert ospydantic.is_trusted_load_enabled()
+    assert oscatalog.Catalog.oscal_read(catalog_path).uuid == 'not a uuid'
+    with pytest.raises(err.TrestleError):
+        oscatalog.Catalog.oscal_read(catalog_path, trusted=False)
+    with ospydantic.trusted_load(False):
+        assert not ospydantic.is_trusted_load_enabled()
+        with pytest.raises(err.TrestleError):
+            oscatalog.Catalog.oscal_read(catalog_path)
+    assert ospydantic.is_trusted_load_enabled()
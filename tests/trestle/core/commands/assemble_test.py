@@ -22,6 +22,8 @@ import sys
 
 from _pytest.monkeypatch import MonkeyPatch
 
+import pytest
+
 import trestle.core.err as err
 from trestle.cli import Trestle
 from trestle.core import const
@@ -65,6 +67,29 @@ def test_assemble_catalog(testdata_dir: pathlib.Path, tmp_trestle_dir: pathlib.P
     assert actual_model == expected_model
 
 
+@pytest.mark.parametrize('validate', [True, False])
+def test_assemble_catalog_stream(
+    testdata_dir: pathlib.Path, tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch, validate: bool
+) -> None:
+    """Test assembling a catalog by streaming the split files."""
+    test_data_source = testdata_dir / 'split_merge/step4_split_groups_array/catalogs'
+    catalogs_dir = tmp_trestle_dir / 'catalogs'
+    shutil.rmtree(catalogs_dir)
+    shutil.rmtree(pathlib.Path('dist'))
+    shutil.copytree(test_data_source, catalogs_dir)
+
+    testargs = ['trestle', 'assemble', 'catalog', '-n', 'mycatalog', '-x', 'json', '--stream']
+    if not validate:
+        testargs.append('--no-validate')
+    monkeypatch.setattr(sys, 'argv', testargs)
+    rc = Trestle().run()
+    assert rc == 0
+
+    actual_model = Catalog.oscal_read(pathlib.Path('dist/catalogs/mycatalog.json'))
+    _, _, expected_model = load_distributed(catalogs_dir / 'mycatalog/catalog.json', tmp_trestle_dir)
+    assert actual_model == expected_model
+
+
 def test_assemble_not_trestle_project(tmp_empty_cwd: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
     """Test failure if not trestle project."""
     testargs = ['trestle', 'assemble', 'catalog', '-n', 'mycatalog', '-x', 'json']
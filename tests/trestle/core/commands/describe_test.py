@@ -28,7 +28,9 @@ from trestle.oscal import catalog as oscatalog
 from trestle.oscal.component import ComponentDefinition
 
 
-@pytest.mark.parametrize('element_path', ['', 'catalog.metadata.roles', 'catalog.metadata'])
+@pytest.mark.parametrize(
+    'element_path', ['', 'catalog.metadata.roles', 'catalog.metadata', 'catalog.groups.0.controls.1']
+)
 def test_describe_functionality(
     element_path: str, tmp_path: pathlib.Path, keep_cwd: pathlib.Path, simplified_nist_catalog: oscatalog.Catalog
 ) -> None:
@@ -90,3 +92,17 @@ def test_describe_failures(
     # no filename specified
     args = argparse.Namespace(verbose=1)
     assert DescribeCmd()._run(args) == 2
+
+
+def test_describe_missing_element(
+    tmp_path: pathlib.Path, keep_cwd: pathlib.Path, simplified_nist_catalog: oscatalog.Catalog
+) -> None:
+    """Test describe of an element path not present in the model."""
+    _, catalog_file = test_utils.prepare_trestle_project_dir(
+        tmp_path,
+        FileContentType.JSON,
+        simplified_nist_catalog,
+        test_utils.CATALOGS_DIR)
+    assert DescribeCmd.describe(catalog_file.resolve(), 'catalog.groups.0.nope', tmp_path) == []
+    results = DescribeCmd.describe(catalog_file.resolve(), 'catalog.groups.1', tmp_path)
+    assert 'catalog.Group' in results[0]
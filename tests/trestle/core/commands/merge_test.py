@@ -30,10 +30,11 @@ from tests.test_utils import execute_command_and_assert
 import trestle.oscal.common as common
 from trestle.core.commands.merge import MergeCmd
 from trestle.core.commands.split import SplitCmd
-from trestle.core.models.actions import CreatePathAction, RemovePathAction, WriteFileAction
+from trestle.core.models.actions import CreatePathAction, RemovePathAction, StreamWriteFileAction, WriteFileAction
 from trestle.core.models.elements import Element, ElementPath
 from trestle.core.models.file_content_type import FileContentType
 from trestle.core.models.plans import Plan
+from trestle.oscal.catalog import Catalog
 from trestle.utils import fs
 from trestle.utils.load_distributed import load_distributed
 
@@ -229,6 +230,45 @@ def test_merge_everything_into_catalog(testdata_dir, tmp_trestle_dir):
     assert generated_plan == expected_plan
 
 
+def test_merge_everything_into_catalog_stream(testdata_dir, tmp_trestle_dir):
+    """Test '$mycatalog$ trestle merge -e catalog.* --stream' writes the merged catalog from the split files."""
+    test_data_source = testdata_dir / 'split_merge/step4_split_groups_array/catalogs'
+    catalogs_dir = Path('catalogs/')
+    shutil.rmtree(catalogs_dir)
+    shutil.copytree(test_data_source, catalogs_dir)
+    os.chdir(catalogs_dir / 'mycatalog')
+    catalog_file = Path('catalog.json').resolve()
+    _, _, expected_catalog = load_distributed(catalog_file, tmp_trestle_dir)
+
+    rc = MergeCmd.perform_all_merges(['catalog.*'], Path.cwd(), tmp_trestle_dir, stream=True)
+    assert rc == 0
+    assert Catalog.oscal_read(catalog_file) == expected_catalog
+    assert not Path('catalog').exists()
+
+
+def test_merge_stream_plan_rollback(testdata_dir, tmp_trestle_dir):
+    """Test the streamed merge is only written when its plan is executed and is undone by a rollback."""
+    test_data_source = testdata_dir / 'split_merge/step4_split_groups_array/catalogs'
+    catalogs_dir = Path('catalogs/')
+    shutil.rmtree(catalogs_dir)
+    shutil.copytree(test_data_source, catalogs_dir)
+    os.chdir(catalogs_dir / 'mycatalog')
+    catalog_file = Path('catalog.json').resolve()
+    stripped_content = catalog_file.read_bytes()
+
+    plan = MergeCmd.merge(Path.cwd(), ElementPath('catalog.*'), tmp_trestle_dir, stream=True)
+    assert isinstance(plan.get_actions()[0], StreamWriteFileAction)
+    assert catalog_file.read_bytes() == stripped_content
+
+    plan.execute()
+    assert catalog_file.read_bytes() != stripped_content
+    assert not Path('catalog').exists()
+
+    plan.rollback()
+    assert catalog_file.read_bytes() == stripped_content
+    assert Path('catalog').exists()
+
+
 def test_merge_everything_into_catalog_with_hidden_files_in_folders(testdata_dir, tmp_trestle_dir):
     """Test trestle merge -e 'catalog.*' when metadata and catalog are split and hidden files are present."""
     # Assume we are running a command like below
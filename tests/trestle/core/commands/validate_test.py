@@ -17,6 +17,7 @@
 import argparse
 import pathlib
 import shutil
+import subprocess
 import sys
 from uuid import uuid4
 
@@ -26,7 +27,9 @@ import pytest
 
 from tests import test_utils
 
+import trestle.core.all_validator as all_validator
 import trestle.core.const as const
+import trestle.core.validator as validator_module
 import trestle.oscal.assessment_plan as ap
 from trestle import cli
 from trestle.cli import Trestle
@@ -124,6 +127,91 @@ def test_validation_unhappy(
     assert rc == status
 
 
+@pytest.mark.parametrize('bad_version, code', [(False, 0), (True, 4)])
+def test_validation_all_jobs(
+    bad_version: bool, code: int, tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch, capsys
+) -> None:
+    """Test validating all models in parallel reports every model."""
+    for name in ['my_test_model', 'my_test_model2', 'my_test_model3']:
+        (tmp_trestle_dir / test_utils.CATALOGS_DIR / name).mkdir(exist_ok=True, parents=True)
+        shutil.copyfile(
+            test_data_dir / 'json/minimal_catalog.json',
+            tmp_trestle_dir / test_utils.CATALOGS_DIR / name / 'catalog.json'
+        )
+    if bad_version:
+        shutil.copyfile(
+            test_data_dir / 'json/minimal_catalog_bad_oscal_version.json',
+            tmp_trestle_dir / test_utils.CATALOGS_DIR / 'my_test_model/catalog.json'
+        )
+
+    monkeypatch.setattr(sys, 'argv', 'trestle validate -a -j 2'.split())
+    rc = Trestle().run()
+    assert rc == code
+    out = capsys.readouterr().out
+    n_passed = 2 if bad_version else 3
+    assert f'{n_passed} of 3 models passed validation.' in out
+    for name in ['my_test_model', 'my_test_model2', 'my_test_model3']:
+        assert f'catalogs/{name}/catalog.json' in out
+
+
+def test_validation_incremental(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch, capsys) -> None:
+    """Test incremental validation skips models unchanged since they passed."""
+    catalog_paths = []
+    for name in ['my_test_model', 'my_test_model2']:
+        (tmp_trestle_dir / test_utils.CATALOGS_DIR / name).mkdir(exist_ok=True, parents=True)
+        catalog_path = tmp_trestle_dir / test_utils.CATALOGS_DIR / name / 'catalog.json'
+        shutil.copyfile(test_data_dir / 'json/minimal_catalog.json', catalog_path)
+        catalog_paths.append(catalog_path)
+
+    monkeypatch.setattr(sys, 'argv', 'trestle validate -a --incremental'.split())
+    assert Trestle().run() == 0
+    assert 'SKIPPED' not in capsys.readouterr().out
+
+    assert Trestle().run() == 0
+    out = capsys.readouterr().out
+    assert out.count('SKIPPED') == 2
+    assert 'VALID' not in out
+
+    # a model with a bad version is validated and stays invalid
+    shutil.copyfile(test_data_dir / 'json/minimal_catalog_bad_oscal_version.json', catalog_paths[0])
+    monkeypatch.setattr(sys, 'argv', 'trestle validate -t catalog --incremental'.split())
+    assert Trestle().run() == 4
+    assert Trestle().run() == 4
+
+    capsys.readouterr()
+    shutil.copyfile(test_data_dir / 'json/minimal_catalog.json', catalog_paths[0])
+    assert Trestle().run() == 0
+    out = capsys.readouterr().out
+    assert out.count('SKIPPED') == 1
+    assert 'VALID: Model' in out
+
+
+def test_validation_changed_since(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch, capsys) -> None:
+    """Test validating only the models changed since a git reference."""
+    for name in ['my_test_model', 'my_test_model2']:
+        (tmp_trestle_dir / test_utils.CATALOGS_DIR / name).mkdir(exist_ok=True, parents=True)
+        shutil.copyfile(
+            test_data_dir / 'json/minimal_catalog.json',
+            tmp_trestle_dir / test_utils.CATALOGS_DIR / name / 'catalog.json'
+        )
+    git_cmd = ['git', '-c', 'user.name=trestle', '-c', 'user.email=trestle@example.com']
+    subprocess.run(git_cmd + ['init', '-q'], cwd=tmp_trestle_dir, check=True)
+    subprocess.run(git_cmd + ['add', '.'], cwd=tmp_trestle_dir, check=True)
+    subprocess.run(git_cmd + ['commit', '-q', '-m', 'initial'], cwd=tmp_trestle_dir, check=True)
+    shutil.copyfile(
+        test_data_dir / 'json/minimal_catalog_bad_oscal_version.json',
+        tmp_trestle_dir / test_utils.CATALOGS_DIR / 'my_test_model2/catalog.json'
+    )
+
+    monkeypatch.setattr(sys, 'argv', 'trestle validate -t catalog --changed-since HEAD'.split())
+    assert Trestle().run() == 4
+    out = capsys.readouterr().out
+    assert 'SKIPPED: Model' in out and 'my_test_model has no changes since HEAD' in out
+
+    monkeypatch.setattr(sys, 'argv', 'trestle validate -a --changed-since no_such_ref'.split())
+    assert Trestle().run() == 1
+
+
 @pytest.mark.parametrize(
     'name, mode, parent, test_id, code',
     [
@@ -245,6 +333,56 @@ def test_validate_dup_uuids(sample_component_definition: ComponentDefinition) ->
     assert not validator.model_is_valid(sample_component_definition)
 
 
+def test_validate_all_single_pass(sample_component_definition: ComponentDefinition, monkeypatch: MonkeyPatch) -> None:
+    """Test the all validator walks the model once and reports every failed validation."""
+    args = argparse.Namespace(mode=const.VAL_MODE_ALL)
+    validator = validator_factory.get(args)
+
+    sample_component_definition.components[1].uuid = sample_component_definition.components[0].uuid
+    sample_component_definition.metadata.roles = [Role(id='id1', title='title1')]
+    sample_component_definition.metadata.responsible_parties = [
+        ResponsibleParty(role_id='bad_id', party_uuids=[PartyUuid(__root__=str(uuid4()))])
+    ]
+
+    orig_visit_model = all_validator.visit_model
+    calls = []
+
+    def count_visit_model(*args, **kwargs):
+        calls.append(1)
+        orig_visit_model(*args, **kwargs)
+
+    monkeypatch.setattr(all_validator, 'visit_model', count_visit_model)
+    assert not validator.model_is_valid(sample_component_definition)
+    assert len(calls) == 1
+    msg = validator.error_msg()
+    assert 'duplicate uuids' in msg
+    assert 'responsible parties' in msg
+
+    sample_component_definition.components[1].uuid = str(uuid4())
+    sample_component_definition.metadata.responsible_parties[0].role_id = 'id1'
+    assert validator.model_is_valid(sample_component_definition)
+
+
+def test_validate_single_rule_no_walk(
+    sample_component_definition: ComponentDefinition, monkeypatch: MonkeyPatch
+) -> None:
+    """Test the refs and oscal version validators check the metadata directly rather than walking the model."""
+
+    def no_visit_model(*args, **kwargs):
+        raise AssertionError('model walked')
+
+    monkeypatch.setattr(validator_module, 'visit_model', no_visit_model)
+    refs_validator = validator_factory.get(argparse.Namespace(mode=const.VAL_MODE_REFS))
+    version_validator = validator_factory.get(argparse.Namespace(mode=const.VAL_MODE_OSCAL_VERSION))
+    assert refs_validator.model_is_valid(sample_component_definition)
+    assert version_validator.model_is_valid(sample_component_definition)
+    sample_component_definition.metadata.roles = [Role(id='id1', title='title1')]
+    sample_component_definition.metadata.responsible_parties = [
+        ResponsibleParty(role_id='bad_id', party_uuids=[PartyUuid(__root__=str(uuid4()))])
+    ]
+    assert not refs_validator.model_is_valid(sample_component_definition)
+
+
 def test_validate_distributed(
     testdata_dir: pathlib.Path, tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch
 ) -> None:
@@ -15,6 +15,8 @@
 # limitations under the License.
 """Tests for exceptions module."""
 
+import pickle
+
 from trestle.core.err import TrestleError, TrestleNotFoundError, TrestleValidationError
 
 
@@ -45,3 +47,11 @@ def test_trestle_validation_error() -> None:
     except TrestleValidationError as err:
         assert str(err) == msg
         assert err.msg == msg
+
+
+def test_trestle_error_pickle() -> None:
+    """Test trestle errors survive pickling as needed by process pools."""
+    msg = 'Custom pickled error'
+    err = pickle.loads(pickle.dumps(TrestleNotFoundError(msg)))
+    assert isinstance(err, TrestleNotFoundError)
+    assert err.msg == msg
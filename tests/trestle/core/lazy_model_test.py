@@ -0,0 +1,98 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2021 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the lazy view of OSCAL models."""
+
+import pathlib
+
+import pytest
+
+from tests import test_utils
+
+import trestle.core.const as const
+from trestle.core.err import TrestleError
+from trestle.core.lazy_model import LazyOscalModel
+from trestle.core.models.elements import ElementPath
+from trestle.oscal.catalog import Catalog
+
+CATALOG_PATH = test_utils.JSON_TEST_DATA_PATH / 'simplified_nist_catalog.json'
+
+
+@pytest.mark.parametrize('trusted', [False, True])
+def test_lazy_model_attributes(trusted: bool) -> None:
+    """Test fields are built only when accessed and match those of the full model."""
+    catalog = Catalog.oscal_read(CATALOG_PATH)
+    lazy_catalog = LazyOscalModel.read(Catalog, CATALOG_PATH, trusted)
+    assert lazy_catalog.model_type is Catalog
+    assert lazy_catalog.metadata == catalog.metadata
+    assert list(lazy_catalog._values.keys()) == ['metadata']
+    assert lazy_catalog.metadata is lazy_catalog.metadata
+    assert lazy_catalog.params is None
+    with pytest.raises(AttributeError):
+        lazy_catalog.not_a_field
+    assert lazy_catalog.materialize() == catalog
+
+
+@pytest.mark.parametrize(
+    'element_path',
+    [
+        'catalog.metadata.roles',
+        'catalog.groups',
+        'catalog.groups.0.controls',
+        'catalog.groups.1.controls.0',
+        'catalog.groups.0.controls.0.parts.0.prose'
+    ]
+)
+def test_lazy_model_get_at(element_path: str) -> None:
+    """Test get_at builds the same element as the full model gives."""
+    catalog = Catalog.oscal_read(CATALOG_PATH)
+    lazy_catalog = LazyOscalModel.read(Catalog, CATALOG_PATH)
+    expected = catalog
+    for part in element_path.split('.')[1:]:
+        expected = expected[int(part)] if part.isnumeric() else expected.get_field_value_by_alias(part)
+    element = lazy_catalog.get_at(ElementPath(element_path))
+    assert element == expected
+    assert lazy_catalog.get_at(ElementPath(element_path)) is element
+    assert lazy_catalog._model is None
+
+
+@pytest.mark.parametrize(
+    'element_path',
+    ['catalog.nope', 'catalog.groups.99', 'catalog.metadata.0', 'catalog.groups.nope', 'catalog.params']
+)
+def test_lazy_model_get_at_missing(element_path: str) -> None:
+    """Test get_at gives None for elements not present."""
+    lazy_catalog = LazyOscalModel.read(Catalog, CATALOG_PATH)
+    assert lazy_catalog.get_at(ElementPath(element_path)) is None
+
+
+def test_lazy_model_invalid(tmp_path: pathlib.Path) -> None:
+    """Test only the parts built are validated."""
+    catalog_path = tmp_path / 'catalog.json'
+    catalog_path.write_text(
+        '{"catalog": {"uuid": "not a uuid", "groups": [{"title": "group"}, {"id": "no_title"}]}}',
+        encoding=const.FILE_ENCODING
+    )
+    lazy_catalog = LazyOscalModel.read(Catalog, catalog_path)
+    assert lazy_catalog.get_at(ElementPath('catalog.groups.0')).title == 'group'
+    with pytest.raises(TrestleError):
+        lazy_catalog.get_at(ElementPath('catalog.groups.1'))
+    with pytest.raises(TrestleError):
+        lazy_catalog.uuid
+    with pytest.raises(TrestleError):
+        lazy_catalog.materialize()
+    assert LazyOscalModel.read(Catalog, catalog_path, trusted=True).uuid == 'not a uuid'
+    with pytest.raises(TrestleError):
+        LazyOscalModel.read(Catalog, test_utils.JSON_TEST_DATA_PATH / 'simplified_nist_profile.json')
@@ -131,3 +131,6 @@ def test_create_path_magic_methods(tmp_path):
 
     action_desc = cpa.to_string()
     assert action_desc == f'{cpa.get_type()} {tmp_data_dir}'
+    assert cpa.get_sub_path() == tmp_data_dir.resolve()
+    assert not cpa.get_clear_content()
+    assert CreatePathAction(tmp_data_dir / 'test.json', clear_content=True).get_clear_content()
@@ -0,0 +1,180 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2021 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the index of elements of a model."""
+
+import copy
+
+import pytest
+
+from tests import test_utils
+
+from trestle.core.err import TrestleNotFoundError
+from trestle.core.models.actions import RemoveAction, UpdateAction
+from trestle.core.models.element_index import ElementIndex
+from trestle.core.models.elements import Element, ElementPath
+from trestle.oscal.catalog import Catalog, Control
+
+CATALOG_PATH = test_utils.JSON_TEST_DATA_PATH / 'simplified_nist_catalog.json'
+
+ELEMENT_PATHS = [
+    'catalog.metadata',
+    'catalog.metadata.roles',
+    'catalog.metadata.roles.1',
+    'catalog.metadata.last_modified',
+    'catalog.metadata.0',
+    'catalog.groups.*',
+    'catalog.groups.0.controls.2.parts',
+    'catalog.groups.1.controls.0.parts.0.prose',
+    'catalog.params',
+    'catalog.nope'
+]
+
+
+@pytest.mark.parametrize('element_path', ELEMENT_PATHS)
+def test_indexed_get_at(element_path: str) -> None:
+    """Test the indexed element gives the same elements as walking the model, both before and after indexing."""
+    catalog = Catalog.oscal_read(CATALOG_PATH)
+    element = Element(catalog)
+    indexed_element = Element(catalog, indexed=True)
+    for _ in range(2):
+        assert indexed_element.get_at(ElementPath(element_path)) is element.get_at(ElementPath(element_path))
+    indexed_element.get_index().get_by_id('ac-1')
+    assert indexed_element.get_at(ElementPath(element_path)) is element.get_at(ElementPath(element_path))
+
+
+def test_indexed_get_at_parent() -> None:
+    """Test the parent of the element path is followed as without the index."""
+    catalog = Catalog.oscal_read(CATALOG_PATH)
+    element = Element(catalog)
+    indexed_element = Element(catalog, indexed=True)
+    parent_path = ElementPath('catalog.groups.0')
+    element_path = ElementPath('group.controls.1', parent_path)
+    assert indexed_element.get_at(element_path) is catalog.groups[0].controls[1]
+    assert indexed_element.get_at(element_path, False) is element.get_at(element_path, False) is None
+    missing_parent_path = ElementPath('parameter.label', ElementPath('catalog.params'))
+    for test_element in [element, indexed_element]:
+        with pytest.raises(TrestleNotFoundError):
+            test_element.get_at(missing_parent_path)
+
+
+def test_indexed_set_at() -> None:
+    """Test set_at invalidates the index."""
+    catalog = Catalog.oscal_read(CATALOG_PATH)
+    element = Element(catalog, indexed=True)
+    control_path = ElementPath('catalog.groups.0.controls')
+    controls = element.get_at(control_path)
+    assert element.get_index().get_by_id(controls[0].id) is controls[0]
+    new_control = copy.deepcopy(controls[0])
+    new_control.id = 'new-1'
+    element.set_at(control_path, [new_control])
+    # the assignment is validated so the model holds a copy of the new control
+    assert element.get_at(ElementPath('catalog.groups.0.controls.0')) is catalog.groups[0].controls[0]
+    assert element.get_index().get_by_id('new-1') is catalog.groups[0].controls[0]
+    assert catalog.groups[0].controls[0] == new_control
+    # changes made other than through set_at need the index to be invalidated
+    catalog.groups[0].controls = controls
+    element.invalidate_index()
+    assert element.get_at(ElementPath('catalog.groups.0.controls.0')) is catalog.groups[0].controls[0]
+    assert element.get_index().get_by_id('new-1') is None
+
+
+def test_element_index_ids() -> None:
+    """Test lookup by id and uuid."""
+    catalog = Catalog.oscal_read(CATALOG_PATH)
+    index = ElementIndex(catalog)
+    assert index.get_by_id(catalog.uuid) is catalog
+    assert index.get_path_of_id(catalog.uuid) == ()
+    control = catalog.groups[1].controls[0]
+    assert index.get_path_of_id(control.id) == ('groups', '1', 'controls', '0')
+    assert isinstance(index.get_by_id(control.id), Control)
+    assert index.get_by_id('not-an-id') is None
+    assert ElementIndex.to_path_str('catalog', ('groups', '1', 'controls', '0')) == 'catalog.groups.1.controls.0'
+    built_index = ElementIndex(catalog)
+    built_index.build()
+    assert built_index.get_path_of_id(control.id) == ('groups', '1', 'controls', '0')
+
+
+def test_model_index_updated_by_actions() -> None:
+    """Test the index built on the model is used by elements and kept up to date by the update and remove actions."""
+    catalog = Catalog.oscal_read(CATALOG_PATH)
+    assert catalog.get_index() is None
+    index = catalog.build_index()
+    assert catalog.get_index() is index
+    assert catalog.copy().get_index() is None
+    assert Element(catalog, indexed=True).get_index() is index
+    old_control = catalog.groups[0].controls[0]
+    assert index.get_by_id(old_control.id, Control) is old_control
+    assert index.get_path_of_uuid(catalog.uuid) == ()
+
+    # replace the controls of the first group through an update action
+    new_control = copy.deepcopy(old_control)
+    new_control.id = 'new-1'
+    element = Element(catalog, indexed=True)
+    control_path = ElementPath('catalog.groups.0.controls')
+    update_action = UpdateAction([new_control], element, control_path)
+    update_action.execute()
+    assert catalog.get_index() is index
+    assert index.get_by_id(old_control.id) is None
+    assert index.get_by_id('new-1') is catalog.groups[0].controls[0]
+    assert index.get_path_of_id('new-1') == ('groups', '0', 'controls', '0')
+    assert element.get_at(ElementPath('catalog.groups.0.controls.0')) is catalog.groups[0].controls[0]
+    update_action.rollback()
+    assert index.get_by_id('new-1') is None
+    assert index.get_by_id(old_control.id) is catalog.groups[0].controls[0]
+
+    # remove the back matter and the uuids within it
+    resource_uuid = catalog.back_matter.resources[0].uuid
+    assert index.get_by_uuid(resource_uuid) is catalog.back_matter.resources[0]
+    RemoveAction(element, ElementPath('catalog.back-matter')).execute()
+    assert index.get_by_uuid(resource_uuid) is None
+    assert element.get_at(ElementPath('catalog.back-matter')) is None
+
+
+def test_model_index_only_used_when_indexed() -> None:
+    """Test a plain element walks the model even when the model has an index of its own."""
+    catalog = Catalog.oscal_read(CATALOG_PATH)
+    catalog.build_index()
+    title_path = ElementPath('catalog.metadata.title')
+    assert Element(catalog, indexed=True).get_at(title_path) == catalog.metadata.title
+    catalog.metadata.title = 'CHANGED'
+    assert Element(catalog).get_index() is None
+    assert Element(catalog).get_at(title_path) == 'CHANGED'
+
+
+def test_index_update_under_path() -> None:
+    """Test an update removes every entry under the path, including those below paths never looked up."""
+    catalog = Catalog.oscal_read(CATALOG_PATH)
+    index = ElementIndex(catalog)
+    controls = catalog.groups[0].controls
+    # the path is updated before any of the paths above it are indexed
+    index.update(('groups', '0', 'controls'), controls)
+    assert index.get(('groups', '0', 'controls', '0')) is controls[0]
+    other_group = catalog.groups[1]
+    assert index.get(('groups', '1')) is other_group
+    index.update(('groups', ), None)
+    assert ('groups', '0', 'controls') not in index._paths
+    assert ('groups', '1') not in index._paths
+    assert index.get(('metadata', )) is catalog.metadata
+
+    # with ids indexed, only the ids under the path are removed
+    index = ElementIndex(catalog)
+    control_id = catalog.groups[0].controls[0].id
+    other_id = catalog.groups[1].controls[0].id
+    assert index.get_path_of_id(control_id) == ('groups', '0', 'controls', '0')
+    index.update(('groups', '0', 'controls'), None)
+    assert index.get_paths_of_id(control_id) == []
+    assert index.get_path_of_id(other_id) == ('groups', '1', 'controls', '0')
+    assert index.get_path_of_uuid(catalog.uuid) == ()
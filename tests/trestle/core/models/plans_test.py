@@ -17,12 +17,16 @@
 import pathlib
 from typing import List
 
+import pytest
+
 from tests import test_utils
 
+from trestle.core.err import TrestleError
 from trestle.core.models.actions import CreatePathAction, WriteFileAction
 from trestle.core.models.elements import Element
 from trestle.core.models.file_content_type import FileContentType
 from trestle.core.models.plans import Plan
+from trestle.oscal import catalog as cat
 from trestle.oscal import component
 
 
@@ -74,6 +78,60 @@ def test_plan_execution(tmp_path, sample_nist_component_def: component.Component
         target_file.exists()
 
 
+def _make_split_plan(base_dir: pathlib.Path, catalog: cat.Catalog) -> Plan:
+    """Make a plan splitting the groups of the catalog into separate files."""
+    content_type = FileContentType.JSON
+    root_file = base_dir / 'catalog.json'
+    split_plan = Plan()
+    for index, group in enumerate(catalog.groups):
+        target_file = base_dir / 'catalog' / 'groups' / f'{index:05d}__group.json'
+        split_plan.add_action(CreatePathAction(target_file))
+        split_plan.add_action(WriteFileAction(target_file, Element(group, 'group'), content_type))
+    split_plan.add_action(CreatePathAction(root_file, True))
+    split_plan.add_action(WriteFileAction(root_file, Element(catalog.metadata, 'metadata'), content_type))
+    return split_plan
+
+
+def test_plan_execute_batched(tmp_path: pathlib.Path):
+    """Test batched execution of a plan writes the same files as sequential execution."""
+    catalog = cat.Catalog.oscal_read(test_utils.JSON_TEST_DATA_PATH / 'simplified_nist_catalog.json')
+    seq_dir = tmp_path / 'sequential'
+    batch_dir = tmp_path / 'batched'
+    for base_dir in [seq_dir, batch_dir]:
+        test_utils.ensure_trestle_config_dir(base_dir)
+        (base_dir / 'catalog.json').write_text('old content')
+
+    _make_split_plan(seq_dir, catalog).execute()
+    _make_split_plan(batch_dir, catalog).execute_batched(max_workers=2)
+
+    seq_files = sorted(path.relative_to(seq_dir) for path in seq_dir.rglob('*') if path.is_file())
+    batch_files = sorted(path.relative_to(batch_dir) for path in batch_dir.rglob('*') if path.is_file())
+    assert batch_files == seq_files
+    assert len(batch_files) == len(catalog.groups) + 1
+    for rel_path in seq_files:
+        assert (batch_dir / rel_path).read_text() == (seq_dir / rel_path).read_text()
+    # the staging directory is removed
+    assert list((batch_dir / '.trestle').iterdir()) == []
+
+
+def test_plan_execute_batched_failure(tmp_path: pathlib.Path):
+    """Test a failure in batched execution leaves the files as they were."""
+    catalog = cat.Catalog.oscal_read(test_utils.JSON_TEST_DATA_PATH / 'simplified_nist_catalog.json')
+    test_utils.ensure_trestle_config_dir(tmp_path)
+    root_file = tmp_path / 'catalog.json'
+    root_file.write_text('old content')
+    split_plan = _make_split_plan(tmp_path, catalog)
+    split_plan.add_action(CreatePathAction(tmp_path / 'bad.json'))
+    split_plan.add_action(WriteFileAction(tmp_path / 'bad.json', None, FileContentType.JSON))
+
+    with pytest.raises(TrestleError):
+        split_plan.execute_batched()
+    assert root_file.read_text() == 'old content'
+    assert not (tmp_path / 'catalog').exists()
+    assert not (tmp_path / 'bad.json').exists()
+    assert list((tmp_path / '.trestle').iterdir()) == []
+
+
 def test_plan_execution_failure():
     """Test unsuccessful execution of a valid plan."""
 
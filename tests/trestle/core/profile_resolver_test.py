@@ -19,11 +19,14 @@ import copy
 import pathlib
 from typing import List, Tuple
 
+from _pytest.monkeypatch import MonkeyPatch
+
 import pytest
 
 from tests import test_utils
 
 from trestle.core import generators as gens
+from trestle.core.err import TrestleError
 from trestle.core.profile_resolver import CatalogInterface, ProfileResolver
 from trestle.core.repository import Repository
 from trestle.oscal import catalog as cat
@@ -68,6 +71,51 @@ def test_profile_resolver(tmp_trestle_dir: pathlib.Path) -> None:
     assert control.parts[0].parts[0].prose == 'Extra added part in subpart'
 
 
+@pytest.mark.parametrize('use_processes', [True, False])
+def test_profile_resolver_parallel(tmp_trestle_dir: pathlib.Path, use_processes: bool) -> None:
+    """Test resolving sibling imports concurrently gives the same catalog as sequential resolution."""
+    test_utils.setup_for_multi_profile(tmp_trestle_dir, False, True)
+
+    prof_a_path = fs.path_for_top_level_model(tmp_trestle_dir, 'test_profile_a', prof.Profile, fs.FileContentType.JSON)
+    seq_cat = ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, prof_a_path)
+    par_cat = ProfileResolver.get_resolved_profile_catalog(
+        tmp_trestle_dir, prof_a_path, max_workers=2, use_processes=use_processes
+    )
+    par_cat.uuid = seq_cat.uuid
+    assert test_utils.models_are_equivalent(seq_cat, par_cat)
+    assert [control.id for control in par_cat.controls] == [control.id for control in seq_cat.controls]
+
+
+def test_profile_resolver_cache(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test the resolved catalog is reused until the profile or any of its imports changes."""
+    test_utils.setup_for_multi_profile(tmp_trestle_dir, False, True)
+
+    prof_a_path = fs.path_for_top_level_model(tmp_trestle_dir, 'test_profile_a', prof.Profile, fs.FileContentType.JSON)
+    first_cat = ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, prof_a_path, use_cache=True)
+
+    def process_mock(*args, **kwargs):
+        raise TrestleError('resolution should not be needed')
+
+    monkeypatch.setattr(ProfileResolver.Import, 'process', process_mock)
+    cached_cat = ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, prof_a_path, use_cache=True)
+    assert test_utils.models_are_equivalent(first_cat, cached_cat)
+
+    # different resolution options need a fresh resolution
+    with pytest.raises(TrestleError):
+        ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, prof_a_path, True, use_cache=True)
+
+    # a change in an indirectly imported profile needs a fresh resolution
+    prof_b, prof_b_path = fs.load_top_level_model(tmp_trestle_dir, 'test_profile_b', prof.Profile)
+    prof_b.metadata.title = 'changed title'
+    prof_b.oscal_write(prof_b_path)
+    with pytest.raises(TrestleError):
+        ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, prof_a_path, use_cache=True)
+
+    monkeypatch.undo()
+    new_cat = ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, prof_a_path, use_cache=True)
+    assert new_cat.uuid != first_cat.uuid
+
+
 def test_deep_catalog() -> None:
     """Test ssp generation with deep catalog."""
     catalog = test_utils.generate_complex_catalog()
@@ -76,6 +124,20 @@ def test_deep_catalog() -> None:
     assert interface.get_count_of_controls_in_catalog(True) == 16
 
 
+def test_dependent_control_ids() -> None:
+    """Test the child control index is depth first and follows replaced controls."""
+    catalog = test_utils.generate_complex_catalog()
+    interface = CatalogInterface(catalog)
+    assert interface.get_dependent_control_ids('b-3') == ['b-2-1', 'b-2-2', 'b-2-3']
+    control = interface.get_control('b-3')
+    control.controls[0].controls = [cat.Control(id='b-2-1.1', title='deep control')]
+    interface.replace_control(control.controls[0])
+    assert interface.get_dependent_control_ids('b-3') == ['b-2-1', 'b-2-1.1', 'b-2-2', 'b-2-3']
+    control.controls = None
+    interface.replace_control(control)
+    assert interface.get_dependent_control_ids('b-3') == []
+
+
 def test_ok_when_reference_id_is_not_given_after_or_before(tmp_trestle_dir: pathlib.Path) -> None:
     """Test when by_id is not given and position is set to after or before it fails."""
     cat_path = test_utils.JSON_TEST_DATA_PATH / test_utils.SIMPLIFIED_NIST_CATALOG_NAME
@@ -196,6 +258,15 @@ def test_replace_params(param_id, param_text, prose, result) -> None:
     assert ProfileResolver.Modify._replace_id_with_text(prose, param_dict) == result
 
 
+def test_replace_several_params() -> None:
+    """Test every param id in the prose is replaced, not only the first one found."""
+    param_dict = {'ac-2_smt.1': 'hello', 'ac-2_smt.10': 'world', 'ac-3_prm_1': 'again'}
+    prose = 'ac-2_smt.1 there ac-2_smt.10 ac-3_prm_1 and xac-3_prm_1'
+    result = 'hello there world again and xac-3_prm_1'
+    assert ProfileResolver.Modify._replace_id_with_text(prose, param_dict) == result
+    assert ProfileResolver.Modify._replace_id_with_text('no params here', param_dict) == 'no params here'
+
+
 def test_profile_resolver_param_sub() -> None:
     """Test profile resolver param sub via regex."""
     id_1 = 'ac-2_smt.1'
@@ -206,6 +277,37 @@ def test_profile_resolver_param_sub() -> None:
     assert new_text == 'Make sure that the cat is very well fed today.  Very well fed!'
 
 
+def test_change_prose_visits_parts_once(monkeypatch: MonkeyPatch) -> None:
+    """Test prose substitution handles each part of each control and sub-control exactly once."""
+    param = com.Parameter(id='c-1_prm_1', values=[com.ParameterValue(__root__='blue')])
+    sub_part = com.Part(id='c-1.1_smt', name='statement', prose='The sub {{ insert: param, c-1_prm_1 }}.')
+    sub_control = cat.Control(id='c-1.1', title='sub control', parts=[sub_part])
+    inner_part = com.Part(id='c-1_smt.a', name='item', prose='Inner {{c-1_prm_1}} and {{c-1_prm_1}}.')
+    part = com.Part(id='c-1_smt', name='statement', prose='The {{ c-1_prm_1 }} sky.', parts=[inner_part])
+    control = cat.Control(id='c-1', title='control', params=[param], parts=[part], controls=[sub_control])
+    catalog = gens.generate_sample_model(cat.Catalog)
+    catalog.controls = [control]
+
+    calls: List[str] = []
+    orig_replace = ProfileResolver.Modify._replace_params
+
+    def replace_params_counted(text, param_dict):
+        calls.append(text)
+        return orig_replace(text, param_dict)
+
+    monkeypatch.setattr(ProfileResolver.Modify, '_replace_params', replace_params_counted)
+    modify = ProfileResolver.Modify(gens.generate_sample_model(prof.Profile), True)
+    modify._catalog_interface = CatalogInterface(catalog)
+    modify._change_prose_with_param_values()
+    new_catalog = modify._catalog_interface.get_catalog()
+
+    assert len(calls) == 3
+    new_control = new_catalog.controls[0]
+    assert new_control.parts[0].prose == 'The blue sky.'
+    assert new_control.parts[0].parts[0].prose == 'Inner blue and blue.'
+    assert new_control.controls[0].parts[0].prose == 'The sub blue.'
+
+
 def test_parameter_resolution(tmp_trestle_dir: pathlib.Path) -> None:
     """Test whether expected order of operations is preserved for parameter substution."""
     test_utils.setup_for_multi_profile(tmp_trestle_dir, False, True)
@@ -78,6 +78,48 @@ def test_fetcher_oscal(tmp_trestle_dir: pathlib.Path) -> None:
     assert models_are_equivalent(fetched_data, catalog_data)
 
 
+def test_fetcher_oscal_memo(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test repeated get_oscal uses the memo and returns independent copies."""
+    cache.FetcherBase.clear_model_memo()
+    fetcher, catalog_data = get_catalog_fetcher(tmp_trestle_dir)
+    first, root_key = fetcher.get_oscal()
+    assert root_key == 'catalog'
+    first.metadata.title = 'changed title'
+
+    def parse_dict_mock(*args, **kwargs):
+        raise err.TrestleError('memo not used')
+
+    monkeypatch.setattr(cache.parser, 'parse_dict', parse_dict_mock)
+    second, _ = fetcher.get_oscal()
+    assert second is not first
+    assert models_are_equivalent(second, catalog_data)
+
+    # change of content must cause a fresh parse
+    catalog_data.metadata.title = 'new content'
+    catalog_data.oscal_write(fetcher._cached_object_path)
+    with pytest.raises(err.TrestleError):
+        fetcher.get_oscal()
+    monkeypatch.undo()
+    third, _ = fetcher.get_oscal()
+    assert third.metadata.title == 'new content'
+    cache.FetcherBase.clear_model_memo()
+
+
+def test_model_memo_bounded() -> None:
+    """Test the memo evicts least recently used models beyond its size."""
+    memo = cache.ModelMemo(2)
+    catalog = generators.generate_sample_model(Catalog)
+    memo.put(('a', '1'), catalog, 'catalog')
+    memo.put(('b', '1'), catalog, 'catalog')
+    assert memo.get(('a', '1')) is not None
+    memo.put(('c', '1'), catalog, 'catalog')
+    assert len(memo) == 2
+    assert memo.get(('b', '1')) is None
+    model, _ = memo.get(('a', '1'))
+    assert model is not catalog
+    assert models_are_equivalent(model, catalog)
+
+
 def test_fetcher_oscal_fails(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
     """Test failed read from cache."""
     logged_error = 'oscal_fail'
@@ -0,0 +1,87 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2021 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the validation manifest."""
+
+import pathlib
+import shutil
+import subprocess
+
+import pytest
+
+from tests import test_utils
+
+from trestle.core.err import TrestleError
+from trestle.core.validation_manifest import ValidationManifest, get_changed_files
+
+test_data_dir = pathlib.Path('tests/data').resolve()
+
+
+def _add_catalog(trestle_root: pathlib.Path, name: str) -> pathlib.Path:
+    catalog_dir = trestle_root / test_utils.CATALOGS_DIR / name
+    catalog_dir.mkdir(parents=True, exist_ok=True)
+    catalog_path = catalog_dir / 'catalog.json'
+    shutil.copyfile(test_data_dir / 'json/minimal_catalog.json', catalog_path)
+    return catalog_path
+
+
+def test_validation_manifest(tmp_trestle_dir: pathlib.Path) -> None:
+    """Test the manifest detects changed files and persists results."""
+    catalog_path = _add_catalog(tmp_trestle_dir, 'my_catalog')
+    other_path = _add_catalog(tmp_trestle_dir, 'other_catalog')
+
+    manifest = ValidationManifest(tmp_trestle_dir)
+    assert not manifest.is_unchanged_and_valid(catalog_path)
+    manifest.record(catalog_path, True, 'passed')
+    manifest.record(other_path, False, 'failed')
+    assert manifest.is_unchanged_and_valid(catalog_path)
+    # a model that failed is never skipped
+    assert not manifest.is_unchanged_and_valid(other_path)
+    manifest.save()
+
+    manifest = ValidationManifest(tmp_trestle_dir)
+    assert manifest.is_unchanged_and_valid(catalog_path)
+
+    # adding a file to the model directory changes it
+    extra_path = catalog_path.parent / 'extra.json'
+    extra_path.write_text('{}')
+    assert not manifest.is_unchanged_and_valid(catalog_path)
+    extra_path.unlink()
+    assert manifest.is_unchanged_and_valid(catalog_path)
+
+    # changing the content changes it but touching the file does not
+    content = catalog_path.read_text()
+    catalog_path.write_text(content)
+    assert manifest.is_unchanged_and_valid(catalog_path)
+    catalog_path.write_text(content.replace('"title"', '"title" ', 1))
+    assert not manifest.is_unchanged_and_valid(catalog_path)
+
+
+def test_get_changed_files(tmp_trestle_dir: pathlib.Path) -> None:
+    """Test getting the files changed since a git reference."""
+    catalog_path = _add_catalog(tmp_trestle_dir, 'my_catalog')
+    _add_catalog(tmp_trestle_dir, 'other_catalog')
+    git_cmd = ['git', '-c', 'user.name=trestle', '-c', 'user.email=trestle@example.com']
+    subprocess.run(git_cmd + ['init', '-q'], cwd=tmp_trestle_dir, check=True)
+    subprocess.run(git_cmd + ['add', '.'], cwd=tmp_trestle_dir, check=True)
+    subprocess.run(git_cmd + ['commit', '-q', '-m', 'initial'], cwd=tmp_trestle_dir, check=True)
+    assert get_changed_files(tmp_trestle_dir, 'HEAD') == set()
+
+    catalog_path.write_text(catalog_path.read_text().replace('"title"', '"title" ', 1))
+    new_path = _add_catalog(tmp_trestle_dir, 'new_catalog')
+    assert get_changed_files(tmp_trestle_dir, 'HEAD') == {catalog_path.resolve(), new_path.resolve()}
+
+    with pytest.raises(TrestleError):
+        get_changed_files(tmp_trestle_dir, 'no_such_ref')
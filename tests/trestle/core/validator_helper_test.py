@@ -127,3 +127,40 @@ def test_find_by_name() -> None:
     my_dict = {'a': 'foo', 'b': 'bar', 'c': {'x': 1, 'a': 7, 'y': 'hello'}}
     result = validator_helper.find_values_by_name(my_dict, 'a')
     assert result == ['foo', 7]
+
+
+def test_find_duplicate_values_with_paths() -> None:
+    """Test finding duplicate values along with the element paths where they occur."""
+    good_component_path = test_utils.YAML_TEST_DATA_PATH / 'good_component.yaml'
+    good_component = component.ComponentDefinition.oscal_read(good_component_path)
+    assert validator_helper.find_duplicate_values_by_name(good_component, 'uuid') == []
+
+    good_component.components[1].uuid = good_component.components[0].uuid
+    duplicates = validator_helper.find_duplicate_values_by_name(good_component, 'uuid')
+    assert duplicates == [
+        (
+            good_component.components[0].uuid, [
+                'component-definition.components.0.uuid', 'component-definition.components.1.uuid'
+            ]
+        )
+    ]
+
+    duplicates = validator_helper.find_duplicate_values_by_type(good_component, common.Property)
+    assert duplicates
+    for prop, paths in duplicates:
+        assert len(paths) > 1
+        assert all('.props.' in path for path in paths)
+        assert len(set(paths)) == len(paths)
+
+
+def test_iter_values_by_name_order_and_depth() -> None:
+    """Test the generator traversal preserves order and handles very deep objects."""
+    my_dict = {'a': 'foo', 'b': [{'a': 1}, {'c': {'a': 2}}]}
+    assert list(validator_helper.iter_values_by_name(my_dict, 'a')) == [('a', 'foo'), ('b.0.a', 1), ('b.1.c.a', 2)]
+    assert list(validator_helper.iter_values_by_type(my_dict, int)) == [('b.0.a', 1), ('b.1.c.a', 2)]
+
+    deep = {'a': 0}
+    for index in range(1, 5000):
+        deep = {'a': index, 'child': deep}
+    assert len(list(validator_helper.iter_values_by_name(deep, 'a'))) == 5000
+    assert validator_helper.find_duplicate_values_by_name(deep, 'a') == []
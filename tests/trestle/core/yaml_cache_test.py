@@ -0,0 +1,100 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2021 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the cache of parsed yaml files."""
+
+import os
+import pathlib
+import shutil
+from typing import Any, Callable, List
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from tests import test_utils
+
+import trestle.core.const as const
+from trestle.core import yaml_cache
+from trestle.core.base_model import _load_yaml_file
+from trestle.oscal.component import ComponentDefinition
+
+
+def _counting_loader(calls: List[pathlib.Path]) -> Callable[[pathlib.Path], Any]:
+    """Get a loader that records each file it loads."""
+
+    def loader(path: pathlib.Path) -> Any:
+        calls.append(path)
+        return _load_yaml_file(path)
+
+    return loader
+
+
+def test_yaml_cache(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test parsed yaml is cached while the file is unchanged."""
+    yaml_file = tmp_trestle_dir / 'component-definitions/mycomp/component-definition.yaml'
+    yaml_file.parent.mkdir(parents=True)
+    shutil.copyfile(test_utils.YAML_TEST_DATA_PATH / 'good_component.yaml', yaml_file)
+    cache_dir = tmp_trestle_dir / const.TRESTLE_YAML_CACHE_DIR
+    calls: List[pathlib.Path] = []
+
+    # the cache is off by default
+    content = yaml_cache.load_yaml_file(yaml_file, _counting_loader(calls))
+    assert not cache_dir.exists()
+
+    monkeypatch.setenv(const.TRESTLE_YAML_CACHE_ENV, 'true')
+    assert yaml_cache.load_yaml_file(yaml_file, _counting_loader(calls)) == content
+    assert len(list(cache_dir.iterdir())) == 1
+    assert yaml_cache.load_yaml_file(yaml_file, _counting_loader(calls)) == content
+    assert len(calls) == 2
+    # models read through the cache are the same
+    assert ComponentDefinition.oscal_read(yaml_file) == ComponentDefinition.parse_obj(content['component-definition'])
+
+    # a change to the file replaces the entry
+    yaml_file.write_text(yaml_file.read_text().replace('Demo target definition', 'Changed target definition'))
+    stat = yaml_file.stat()
+    os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+    changed = yaml_cache.load_yaml_file(yaml_file, _counting_loader(calls))
+    assert len(calls) == 3
+    assert changed != content
+    assert yaml_cache.load_yaml_file(yaml_file, _counting_loader(calls)) == changed
+    assert len(calls) == 3
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_yaml_cache_skipped(tmp_path: pathlib.Path, tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test content with timestamps and files outside a trestle project are not cached."""
+    monkeypatch.setenv(const.TRESTLE_YAML_CACHE_ENV, '1')
+    cache_dir = tmp_trestle_dir / const.TRESTLE_YAML_CACHE_DIR
+    dated_file = tmp_trestle_dir / 'dated.yaml'
+    dated_file.write_text('last-modified: 2021-01-01T00:00:00+00:00\n')
+    assert yaml_cache.load_yaml_file(dated_file, _load_yaml_file)['last-modified'].year == 2021
+    assert not cache_dir.exists()
+
+    outside_file = tmp_path.parent / f'{tmp_path.name}_outside.yaml'
+    outside_file.write_text('title: outside\n')
+    try:
+        assert yaml_cache.load_yaml_file(outside_file, _load_yaml_file) == {'title': 'outside'}
+    finally:
+        outside_file.unlink()
+    assert not cache_dir.exists()
+
+
+def test_find_trestle_root_not_cached_when_missing(tmp_path: pathlib.Path) -> None:
+    """Test a directory outside a trestle project is found once a project is created around it."""
+    sub_dir = tmp_path / 'project/sub'
+    sub_dir.mkdir(parents=True)
+    assert yaml_cache._find_trestle_root(str(sub_dir)) is None
+    (tmp_path / 'project' / const.TRESTLE_CONFIG_DIR).mkdir()
+    assert yaml_cache._find_trestle_root(str(sub_dir)) == tmp_path / 'project'
+    assert yaml_cache._find_trestle_root(str(sub_dir)) == tmp_path / 'project'
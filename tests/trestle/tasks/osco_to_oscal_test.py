@@ -17,10 +17,16 @@
 import configparser
 import os
 import pathlib
+import shutil
 import uuid
+from xml.etree.ElementTree import ParseError  # noqa: S405 - used for the exception type only
 
 from _pytest.monkeypatch import MonkeyPatch
 
+from defusedxml import DTDForbidden
+
+import pytest
+
 from tests.test_utils import text_files_equal
 
 import trestle.tasks.osco_to_oscal as osco_to_oscal
@@ -468,3 +474,48 @@ def test_osco_execute_input_configmaps(tmp_path, monkeypatch: MonkeyPatch):
         f_produced = d_produced / fn
         result = text_files_equal(f_expected, f_produced)
         assert (result)
+
+
+def test_osco_report_streamed() -> None:
+    """Test rule results are parsed as they are reached, before the rest of the report."""
+    ipth = pathlib.Path('tests/data/tasks/osco/input-xml-rhel7/rhel7-check-result.xml')
+    osco_xml = ipth.read_text(encoding='utf8')
+    rule_uses = list(osco.ComplianceOperatorReport(osco_xml).rule_use_generator())
+    assert rule_uses
+    assert rule_uses[0].target_type is not None
+    # cut the report off after its first rule result
+    end_tag = '</rule-result>'
+    truncated_xml = osco_xml[:osco_xml.index(end_tag) + len(end_tag)]
+    rule_use_generator = osco.ComplianceOperatorReport(truncated_xml).rule_use_generator()
+    assert next(rule_use_generator).__dict__ == rule_uses[0].__dict__
+    with pytest.raises(ParseError):
+        next(rule_use_generator)
+
+
+def test_osco_report_dtd_forbidden() -> None:
+    """Test a report with a DTD is rejected."""
+    osco_xml = '<?xml version="1.0"?><!DOCTYPE x [<!ENTITY a "b">]><x/>'
+    with pytest.raises(DTDForbidden):
+        list(osco.ComplianceOperatorReport(osco_xml).rule_use_generator())
+
+
+@pytest.mark.parametrize('parallel_files', ['1', '2'])
+def test_osco_execute_parallel_files(tmp_path, parallel_files):
+    """Test execute call with files in turn or in parallel, where a failed file does not stop the others."""
+    ipth = tmp_path / 'input'
+    ipth.mkdir()
+    for fn in ['input-xml-rhel7/rhel7-check-result.xml',
+               'input-xml-ocp4/ocp4-check-result.xml',
+               'input-bad-yaml/bad.yaml']:
+        shutil.copy(pathlib.Path('tests/data/tasks/osco') / fn, ipth)
+    config = configparser.ConfigParser()
+    config_path = pathlib.Path('tests/data/tasks/osco/test-osco-to-oscal.config')
+    config.read(config_path)
+    section = config['task.osco-to-oscal']
+    section['input-dir'] = str(ipth)
+    section['output-dir'] = str(tmp_path / 'output')
+    section['parallel-files'] = parallel_files
+    tgt = osco_to_oscal.OscoToOscal(section)
+    retval = tgt.execute()
+    assert retval == TaskOutcome.FAILURE
+    assert sorted(os.listdir(tmp_path / 'output')) == ['ocp4-check-result.oscal.json', 'rhel7-check-result.oscal.json']
@@ -206,6 +206,69 @@ def test_tanium_execute_checking(tmp_path, monkeypatch: MonkeyPatch):
     assert list(open(f_produced, encoding=const.FILE_ENCODING)) == list(open(f_expected, encoding=const.FILE_ENCODING))
 
 
+def test_tanium_execute_chunksize(tmp_path, monkeypatch: MonkeyPatch):
+    """Test execute call streaming the input in chunks."""
+    monkeybusiness = MonkeyBusiness()
+    monkeypatch.setattr(tanium, '_uuid_component', monkeybusiness.uuid_component)
+    monkeypatch.setattr(tanium, '_uuid_inventory', monkeybusiness.uuid_inventory)
+    monkeypatch.setattr(tanium, '_uuid_observation', monkeybusiness.uuid_observation)
+    monkeypatch.setattr(tanium, '_uuid_result', monkeybusiness.uuid_result)
+    tanium.TaniumTransformer.set_timestamp('2021-02-24T19:31:13+00:00')
+    assert tanium.TaniumTransformer.get_timestamp() == '2021-02-24T19:31:13+00:00'
+    config = configparser.ConfigParser()
+    config_path = pathlib.Path('tests/data/tasks/tanium/demo-tanium-to-oscal.config')
+    config.read(config_path)
+    section = config['task.tanium-to-oscal']
+    section['output-dir'] = str(tmp_path)
+    section['cpus-max'] = '1'
+    section['chunksize'] = '7'
+    tgt = tanium_to_oscal.TaniumToOscal(section)
+    retval = tgt.execute()
+    assert retval == TaskOutcome.SUCCESS
+    assert len(os.listdir(str(tmp_path))) == 1
+    f_expected = pathlib.Path('tests/data/tasks/tanium/output/') / 'Tanium.oscal.json'
+    f_produced = tmp_path / 'Tanium.oscal.json'
+    assert list(open(f_produced, encoding=const.FILE_ENCODING)) == list(open(f_expected, encoding=const.FILE_ENCODING))
+
+
+def test_tanium_execute_parallel_files(tmp_path):
+    """Test execute call with files in parallel."""
+    config = configparser.ConfigParser()
+    config_path = pathlib.Path('tests/data/tasks/tanium/demo-tanium-to-oscal.config')
+    config.read(config_path)
+    section = config['task.tanium-to-oscal']
+    section['output-dir'] = str(tmp_path)
+    section['parallel-files'] = '2'
+    tgt = tanium_to_oscal.TaniumToOscal(section)
+    retval = tgt.execute()
+    assert retval == TaskOutcome.SUCCESS
+    assert os.listdir(str(tmp_path)) == ['Tanium.oscal.json']
+    section['output-overwrite'] = 'false'
+    tgt = tanium_to_oscal.TaniumToOscal(section)
+    retval = tgt.execute()
+    assert retval == TaskOutcome.FAILURE
+
+
+def test_tanium_observations_sharded(monkeypatch: MonkeyPatch):
+    """Test observations made by several batch workers match those made by one."""
+    timestamp = '2021-02-24T19:31:13+00:00'
+    ipth = pathlib.Path('tests/data/tasks/tanium/input/Tanium.comply-results-json')
+    rule_use_list = tanium.RuleUseFactory(timestamp).make_list(ipth.read_text(encoding=const.FILE_ENCODING))
+    observations_list = []
+    for cpus in [1, 2]:
+        monkeybusiness = MonkeyBusiness()
+        monkeypatch.setattr(tanium, '_uuid_component', monkeybusiness.uuid_component)
+        monkeypatch.setattr(tanium, '_uuid_inventory', monkeybusiness.uuid_inventory)
+        tanium_oscal_factory = tanium.TaniumOscalFactory(timestamp, rule_use_list)
+        # force the number of workers regardless of the CPUs available
+        tanium_oscal_factory._cpus = cpus
+        observations = tanium_oscal_factory.result.observations
+        # each worker makes its own observation uuids
+        observations_list.append([observation.copy(exclude={'uuid'}) for observation in observations])
+    assert len(observations_list[0]) == len(rule_use_list)
+    assert observations_list[0] == observations_list[1]
+
+
 def test_tanium_execute_one_file(tmp_path, monkeypatch: MonkeyPatch):
     """Test execute call."""
     monkeybusiness = MonkeyBusiness()
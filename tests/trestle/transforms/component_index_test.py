@@ -0,0 +1,41 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2021 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the component index of transformers."""
+
+from trestle.oscal.assessment_results import Status1, SystemComponent
+from trestle.transforms.component_index import ComponentIndex
+
+
+def _make_component(uuid: str, title: str) -> SystemComponent:
+    return SystemComponent(
+        uuid=uuid, type='Service', title=title, description=title, status=Status1(state='operational')
+    )
+
+
+def test_component_index() -> None:
+    """Test components are found by key and kept in the order added."""
+    component_index = ComponentIndex()
+    assert len(component_index) == 0
+    assert component_index.get_ref(('Service', 'a')) is None
+    component_a = _make_component('11111111-1111-4111-8111-111111111111', 'a')
+    component_b = _make_component('22222222-2222-4222-8222-222222222222', 'b')
+    component_index.add(('Service', 'a'), component_a)
+    component_index.add(('Service', 'b'), component_b)
+    assert len(component_index) == 2
+    assert component_index.get_ref(('Service', 'a')) == component_a.uuid
+    assert component_index.get_ref(('Service', 'b')) == component_b.uuid
+    assert component_index.get_ref(('Operating System', 'a')) is None
+    assert component_index.components == [component_a, component_b]
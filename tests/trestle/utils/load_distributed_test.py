@@ -17,12 +17,17 @@
 
 import shutil
 
+import pytest
+
 from tests import test_utils
 
+from trestle.core.err import TrestleError
 from trestle.oscal.catalog import Catalog
 from trestle.oscal.common import Role
 from trestle.utils import fs
-from trestle.utils.load_distributed import _load_list, load_distributed
+from trestle.utils.load_distributed import (
+    _LoadPlan, _load_distributed, _load_list, load_distributed, stream_distributed
+)
 
 
 def test_load_list(testdata_dir, tmp_trestle_dir):
@@ -99,3 +104,53 @@ def test_load_distributed(testdata_dir, tmp_trestle_dir):
     assert actual_model_type == Catalog
     assert actual_model_alias == 'catalog'
     assert test_utils.models_are_equivalent(expected_model_instance, actual_model_instance)
+
+
+def test_load_distributed_plan(testdata_dir, tmp_trestle_dir):
+    """Test loading with the scanned and prefetched plan matches loading directly from the file system."""
+    test_utils.ensure_trestle_config_dir(tmp_trestle_dir)
+    catalogs_dir = tmp_trestle_dir / 'catalogs'
+    shutil.rmtree(catalogs_dir)
+    shutil.copytree(testdata_dir / 'split_merge/step4_split_groups_array/catalogs', catalogs_dir)
+    catalog_file = catalogs_dir / 'mycatalog/catalog.json'
+
+    _, _, planned_catalog = load_distributed(catalog_file, tmp_trestle_dir)
+    # a plan that has not scanned anything falls back to the file system for every path
+    _, _, direct_catalog = _load_distributed(catalog_file, tmp_trestle_dir, None, _LoadPlan(tmp_trestle_dir))
+    assert test_utils.models_are_equivalent(planned_catalog, direct_catalog)
+
+    # errors reading a file are raised when it is loaded
+    role_file = catalogs_dir / 'mycatalog/catalog/metadata/roles/00000__role.json'
+    role_file.write_text('{not json')
+    with pytest.raises(TrestleError):
+        load_distributed(catalog_file, tmp_trestle_dir)
+
+
+def test_stream_distributed(testdata_dir, tmp_trestle_dir):
+    """Test streaming a decomposed model gives the same model as loading it, and invalid content is caught."""
+    test_utils.ensure_trestle_config_dir(tmp_trestle_dir)
+    catalogs_dir = tmp_trestle_dir / 'catalogs'
+    shutil.rmtree(catalogs_dir)
+    shutil.copytree(testdata_dir / 'split_merge/step4_split_groups_array/catalogs', catalogs_dir)
+    catalog_file = catalogs_dir / 'mycatalog/catalog.json'
+    out_file = tmp_trestle_dir / 'streamed.json'
+
+    _, _, loaded_catalog = load_distributed(catalog_file, tmp_trestle_dir)
+    model_type = stream_distributed(catalog_file, tmp_trestle_dir, out_file, 'catalog')
+    assert model_type == Catalog
+    assert Catalog.oscal_read(out_file) == loaded_catalog
+    # fields are written in the same order as serializing the loaded model
+    assert list(fs.load_file(out_file)['catalog'].keys()) == list(loaded_catalog.oscal_dict()['catalog'].keys())
+
+    # an invalid leaf is only caught by validation, and the output is left untouched when it fails
+    group_file = catalogs_dir / 'mycatalog/catalog/groups/00000__group.json'
+    group_file.write_text('{"group": {"id": "no_title"}}')
+    streamed = out_file.read_text()
+    with pytest.raises(TrestleError):
+        stream_distributed(catalog_file, tmp_trestle_dir, out_file, 'catalog')
+    assert out_file.read_text() == streamed
+    assert list(tmp_trestle_dir.glob('.*.tmp.json')) == []
+    stream_distributed(catalog_file, tmp_trestle_dir, out_file, 'catalog', validate=False)
+    group = fs.load_file(out_file)['catalog']['groups'][0]
+    assert group['id'] == 'no_title'
+    assert 'title' not in group
@@ -15,9 +15,11 @@
 # limitations under the License.
 """Validate based on all registered validators."""
 
+from typing import List, Optional, Tuple
+
 import trestle.core.validator_factory as vfact
 from trestle.core.base_model import OscalBaseModel
-from trestle.core.validator import Validator
+from trestle.core.validator import ModelVisitor, Validator, visit_model
 
 
 class AllValidator(Validator):
@@ -33,16 +35,23 @@ class AllValidator(Validator):
         """
         Validate an oscal model against all available validators in the trestle library.
 
+        Validators that provide a visitor share a single traversal of the model, and the others are run in turn.
+        All validators are run and the failure message lists every one that failed.
+
         args:
             model: An Oscal model that can be passed to the validator.
 
         returns:
             True (valid) if the model passed all registered validators.
         """
-        self.last_failure_msg = self.__doc__
-        for val in vfact.validator_factory.get_all():
-            if val != self:
-                if not val.model_is_valid(model):
-                    self.last_failure_msg = val.error_msg()
-                    return False
-        return True
+        validators_visitors: List[Tuple[Validator, Optional[ModelVisitor]]] = [
+            (val, val.get_visitor()) for val in vfact.validator_factory.get_all() if val != self
+        ]
+        visit_model(model, [visitor for _, visitor in validators_visitors if visitor is not None])
+        failure_msgs: List[str] = []
+        for val, visitor in validators_visitors:
+            valid = val.model_is_valid(model) if visitor is None else visitor.is_valid()
+            if not valid:
+                failure_msgs.append(val.error_msg())
+        self.last_failure_msg = '; '.join(failure_msgs) if failure_msgs else self.__doc__
+        return not failure_msgs
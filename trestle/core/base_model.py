@@ -26,27 +26,194 @@ from. This allows additional functionality to be easily inserted.
 I can write a comment in here and you can even edit on the same line.
 """
 
+import contextlib
 import datetime
+import enum
 import logging
+import mmap
+import os
 import pathlib
-from typing import Any, Dict, List, Optional, Type, Union, cast
+import threading
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, TextIO, Tuple, Type, Union, cast
 
 import orjson
 
 from pydantic import Extra, Field, create_model
 from pydantic.fields import ModelField
-from pydantic.parse import load_file
+from pydantic.json import pydantic_encoder
 
-from ruamel.yaml import YAML
+import ruamel.yaml.resolver
+
+import yaml
 
 import trestle.core.const as const
 import trestle.core.err as err
+from trestle.core import yaml_cache
+from trestle.core.models.element_index import ElementIndex
 from trestle.core.models.file_content_type import FileContentType
 from trestle.core.trestle_base_model import TrestleBaseModel
 from trestle.core.utils import classname_to_alias, get_origin, is_collection_field_type
 
 logger = logging.getLogger(__name__)
 
+# Process-wide registries of the model types created dynamically, since creating a pydantic class is expensive.
+# Stripped types are keyed by the model class and the names of the stripped fields.
+_stripped_model_types: Dict[Tuple[Type['OscalBaseModel'], FrozenSet[str]], Type['OscalBaseModel']] = {}
+# Collection wrapper types are keyed by class name and the collection type wrapped in __root__.
+_collection_wrapper_types: Dict[Tuple[str, Any], Type['OscalBaseModel']] = {}
+_model_types_lock = threading.Lock()
+
+
+def get_collection_wrapper_type(class_name: str, collection_type: Any) -> Type['OscalBaseModel']:
+    """
+    Get the model wrapping a list or dict in __root__, creating it only the first time it is needed.
+
+    Args:
+        class_name: Name of the wrapper class.
+        collection_type: The list or dict type wrapped, e.g. List[Control].
+
+    Returns:
+        The wrapper model type.
+    """
+    key = (class_name, collection_type)
+    with _model_types_lock:
+        wrapper_model = _collection_wrapper_types.get(key, None)
+        if wrapper_model is None:
+            wrapper_model = create_model(class_name, __base__=OscalBaseModel, __root__=(collection_type, ...))
+            wrapper_model = cast(Type[OscalBaseModel], wrapper_model)
+            _collection_wrapper_types[key] = wrapper_model
+    return wrapper_model
+
+
+class _OscalYamlDumper(getattr(yaml, 'CSafeDumper', yaml.SafeDumper)):  # type: ignore
+    """Safe yaml dumper, using the C emitter when available, that writes model dicts as they are serialized to json."""
+
+    yaml_implicit_resolvers: Dict[Any, List[Any]] = {}
+
+    def ignore_aliases(self, data: Any) -> bool:
+        """Write repeated objects in full rather than as anchors and aliases."""
+        return True
+
+
+class _OscalYamlLoader(getattr(yaml, 'CSafeLoader', yaml.SafeLoader)):  # type: ignore
+    """Safe yaml loader, using the C parser when available, that loads the same content as ruamel.yaml."""
+
+    yaml_implicit_resolvers: Dict[Any, List[Any]] = {}
+
+
+def _construct_yaml_int(loader: _OscalYamlLoader, node: yaml.Node) -> int:
+    """Construct an int by the yaml 1.2 rules, where leading zeros do not make it octal."""
+    value = loader.construct_scalar(node).replace('_', '')
+    try:
+        return int(value, 0)
+    except ValueError:
+        return int(value, 10)
+
+
+# resolve plain strings by the yaml 1.2 rules used by ruamel.yaml, so e.g. yes and no are strings and left unquoted
+for versions, tag, regexp, first in ruamel.yaml.resolver.implicit_resolvers:
+    if (1, 2) in versions:
+        _OscalYamlDumper.add_implicit_resolver(tag, regexp, first)
+        _OscalYamlLoader.add_implicit_resolver(tag, regexp, first)
+_OscalYamlLoader.add_constructor('tag:yaml.org,2002:int', _construct_yaml_int)
+
+# str and int subclasses such as urls and constrained types are written as plain values
+_OscalYamlDumper.add_multi_representer(str, lambda dumper, data: dumper.represent_str(str(data)))
+_OscalYamlDumper.add_multi_representer(int, lambda dumper, data: dumper.represent_int(int(data)))
+_OscalYamlDumper.add_multi_representer(enum.Enum, lambda dumper, data: dumper.represent_data(data.value))
+# datetimes are written as the quoted strings found in the json
+_OscalYamlDumper.add_representer(
+    datetime.datetime, lambda dumper, data: dumper.represent_str(orjson.dumps(data).decode(const.FILE_ENCODING)[1:-1])
+)
+_OscalYamlDumper.add_multi_representer(
+    object, lambda dumper, data: dumper.represent_data(orjson.loads(orjson.dumps(data, default=pydantic_encoder)))
+)
+
+
+def yaml_dump(data: Any, stream: Optional[TextIO] = None, default_flow_style: Optional[bool] = None) -> Optional[str]:
+    """
+    Dump the dict of a model as yaml directly, without first serializing it to json and loading that back.
+
+    The output is the same as dumping the json loaded as a dict with the safe ruamel.yaml dumper.
+
+    Args:
+        data: The dict to dump, as returned by oscal_dict or dict(by_alias=True, exclude_none=True).
+        stream: The stream to write to, or None to return the yaml as a string.
+        default_flow_style: False to write all collections in block style, None to write leaf ones in flow style.
+
+    Returns:
+        The yaml string if no stream is given.
+    """
+    return yaml.dump(data, stream, Dumper=_OscalYamlDumper, allow_unicode=True, default_flow_style=default_flow_style)
+
+
+def _load_yaml_file(path: pathlib.Path) -> Any:
+    """Load the yaml file with the C parser when available."""
+    with path.open('r', encoding=const.FILE_ENCODING) as yaml_file:
+        return yaml.load(yaml_file, Loader=_OscalYamlLoader)  # noqa: S506 - the loader is a safe loader
+
+
+def json_load(path: pathlib.Path) -> Any:
+    """
+    Load a json file with orjson, reading its bytes once.
+
+    Large files are mapped into memory and parsed in place, rather than first being copied into a buffer.
+
+    Args:
+        path: The json file to load.
+
+    Returns:
+        The content of the file.
+    """
+    with path.open('rb') as json_file:
+        if os.fstat(json_file.fileno()).st_size < const.MMAP_MIN_FILE_SIZE:
+            return orjson.loads(json_file.read())
+        with mmap.mmap(json_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            with memoryview(mapped_file) as content:
+                return orjson.loads(content)
+
+
+def yaml_load(path: pathlib.Path) -> Any:
+    """
+    Load a yaml file, using the cache of parsed yaml files if it is enabled.
+
+    The content is the same as loading the file with the safe ruamel.yaml loader, except that timestamps with a
+    timezone keep it rather than being converted to naive utc times.
+
+    Args:
+        path: The yaml file to load.
+
+    Returns:
+        The content of the file.
+    """
+    return yaml_cache.load_yaml_file(path, _load_yaml_file)
+
+
+def is_trusted_load_enabled() -> bool:
+    """Determine if models are read without validation by default, as set by the environment variable."""
+    return os.environ.get(const.TRESTLE_TRUSTED_LOAD_ENV, '').lower() in ['1', 'true', 'yes', 'on']
+
+
+@contextlib.contextmanager
+def trusted_load(enabled: bool) -> Iterator[None]:
+    """
+    Set whether models are read without validation by default within the context.
+
+    The setting is held in the environment variable so it also applies to any worker processes started within it.
+
+    Args:
+        enabled: True to read models without validation, False to always validate them.
+    """
+    old_value = os.environ.get(const.TRESTLE_TRUSTED_LOAD_ENV, None)
+    os.environ[const.TRESTLE_TRUSTED_LOAD_ENV] = 'true' if enabled else 'false'
+    try:
+        yield
+    finally:
+        if old_value is None:
+            del os.environ[const.TRESTLE_TRUSTED_LOAD_ENV]
+        else:
+            os.environ[const.TRESTLE_TRUSTED_LOAD_ENV] = old_value
+
 
 def robust_datetime_serialization(input_dt: datetime.datetime) -> str:
     """Return a nicely formatted string for in a format compatible with OSCAL specifications.
@@ -97,6 +264,9 @@ class OscalBaseModel(TrestleBaseModel):
         # Validate on assignment of variables to ensure no escapes
         validate_assignment = True
 
+    # holds the index of the elements once built by build_index, in a slot so it is not part of the model data
+    __slots__ = ('_element_index', )
+
     @classmethod
     def create_stripped_model_type(
         cls,
@@ -115,6 +285,7 @@ class OscalBaseModel(TrestleBaseModel):
 
         Returns:
             Pydantic data class thta can be used to instanciate a model.
+            The class is created once per set of stripped fields and shared by later calls.
 
         Raises:
             TrestleError: If user provided both stripped_fields and stripped_field_aliases or neither.
@@ -136,6 +307,17 @@ class OscalBaseModel(TrestleBaseModel):
             except KeyError as e:
                 raise err.TrestleError(f'Field {str(e)} does not exist in the model')
 
+        key = (cls, frozenset(excluded_fields))
+        with _model_types_lock:
+            stripped_model = _stripped_model_types.get(key, None)
+            if stripped_model is None:
+                stripped_model = cls._create_stripped_model_type(excluded_fields)
+                _stripped_model_types[key] = stripped_model
+        return stripped_model
+
+    @classmethod
+    def _create_stripped_model_type(cls, excluded_fields: List[str]) -> Type['OscalBaseModel']:
+        """Create the pydantic model derived from the current model without the excluded fields."""
         current_fields = cls.__fields__
         new_fields_for_model = {}
         # Build field list
@@ -247,6 +429,19 @@ class OscalBaseModel(TrestleBaseModel):
         # This function is provided for backwards compatibility
         return self.oscal_serialize_json_bytes(pretty, wrapped).decode(const.FILE_ENCODING)
 
+    def oscal_serialize_yaml(self, wrapped: bool = True, default_flow_style: Optional[bool] = None) -> str:
+        """
+        Return an 'oscal wrapped' yaml object.
+
+        Args:
+            wrapped: Whether to include the single top level key.
+            default_flow_style: False to write all collections in block style, None to write leaf ones in flow style.
+        Returns:
+            Oscal model serialized to yaml.
+        """
+        odict = self.oscal_dict() if wrapped else self.dict(by_alias=True, exclude_none=True)
+        return yaml_dump(odict, default_flow_style=default_flow_style)
+
     def oscal_write(self, path: pathlib.Path) -> None:
         """
         Write out a pydantic data model in an oscal friendly way.
@@ -265,11 +460,8 @@ class OscalBaseModel(TrestleBaseModel):
         # The output will have \r\n newlines on windows and \n newlines elsewhere
 
         if content_type == FileContentType.YAML:
-            write_file = pathlib.Path(path).open('w', encoding=const.FILE_ENCODING)
-            yaml = YAML(typ='safe')
-            yaml.dump(yaml.load(self.oscal_serialize_json()), write_file)
-            write_file.flush()
-            write_file.close()
+            with pathlib.Path(path).open('w', encoding=const.FILE_ENCODING) as write_file:
+                yaml_dump(self.oscal_dict(), write_file)
         elif content_type == FileContentType.JSON:
             write_file = pathlib.Path(path).open('wb')
             write_file.write(self.oscal_serialize_json_bytes(pretty=True))
@@ -278,7 +470,7 @@ class OscalBaseModel(TrestleBaseModel):
             write_file.close()
 
     @classmethod
-    def oscal_read(cls, path: pathlib.Path) -> 'OscalBaseModel':
+    def oscal_read(cls, path: pathlib.Path, trusted: Optional[bool] = None) -> 'OscalBaseModel':
         """
         Read OSCAL objects.
 
@@ -286,39 +478,64 @@ class OscalBaseModel(TrestleBaseModel):
 
         Args:
             path: The path of the oscal object to read.
+            trusted: True to build the model without validation, None to follow the trusted load setting.
         Returns:
             The oscal object read into trestle oscal models.
         """
-        # Create the wrapper model.
-        alias = classname_to_alias(cls.__name__, 'json')
-
-        content_type = FileContentType.to_content_type(path.suffix)
-        logger.debug(f'oscal_read content type {content_type} and alias {alias} from {path}')
-
         if not path.exists():
             logger.warning(f'path does not exist in oscal_read: {path}')
             return None
+        return cls.oscal_parse_raw(cls.oscal_read_raw(path), path, trusted)
+
+    @classmethod
+    def oscal_read_raw(cls, path: pathlib.Path) -> Dict[str, Any]:
+        """
+        Read the raw content of an OSCAL json or yaml file without parsing it into a model.
+
+        Args:
+            path: The path of the oscal object to read.
+        Returns:
+            The dict loaded from the file, still wrapped by the top level key.
+        """
+        content_type = FileContentType.to_content_type(path.suffix)
+        logger.debug(f'oscal_read_raw content type {content_type} from {path}')
 
         obj: Dict[str, Any] = {}
         try:
             if content_type == FileContentType.YAML:
-                yaml = YAML(typ='safe')
-                fh = path.open('r', encoding=const.FILE_ENCODING)
-                obj = yaml.load(fh)
-                fh.close()
+                obj = yaml_load(path)
             elif content_type == FileContentType.JSON:
-                obj = load_file(
-                    path,
-                    json_loads=cls.__config__.json_loads,
-                )
+                obj = json_load(path)
         except Exception as e:
             raise err.TrestleError(f'Error loading file {path} {str(e)}')
+        return obj
+
+    @classmethod
+    def oscal_parse_raw(
+        cls, obj: Dict[str, Any], path: pathlib.Path, trusted: Optional[bool] = None
+    ) -> 'OscalBaseModel':
+        """
+        Parse the raw content read from an OSCAL file into the model.
+
+        Trusted content, such as files written by trestle itself, is built without validation which is much faster.
+
+        Args:
+            obj: The dict read from the file, wrapped by the top level key.
+            path: The path the content was read from, used in error messages.
+            trusted: True to build the model without validation, None to follow the trusted load setting.
+        Returns:
+            The oscal object read into trestle oscal models.
+        """
+        # Create the wrapper model.
+        alias = classname_to_alias(cls.__name__, 'json')
+        if trusted is None:
+            trusted = is_trusted_load_enabled()
         try:
             if not len(obj) == 1:
                 logger.error('Provided oscal file does not have a single top level key wrapping it.')
                 logger.error(f'It has {len(obj)} keys.')
                 raise err.TrestleError('Invalid OSCAL file structure, multiple base keys.')
-            parsed = cls.parse_obj(obj[alias])
+            parsed = cls.parse_obj_trusted(obj[alias]) if trusted else cls.parse_obj(obj[alias])
         except KeyError:
             logger.error(f'Provided oscal file does not have top level key: {alias}')
             raise err.TrestleError(f'Provided oscal file does not have top level key key: {alias}')
@@ -327,6 +544,25 @@ class OscalBaseModel(TrestleBaseModel):
             raise err.TrestleError(f'Error parsing file {path} {str(e)}')
         return parsed
 
+    def build_index(self) -> ElementIndex:
+        """
+        Build the index of the elements of the model by path, id and uuid, replacing any existing one.
+
+        The whole model is traversed once.  The index is kept up to date by changes made through Element.set_at,
+        including those of the update and remove actions, but any other change to the model needs a new index.
+
+        Returns:
+            The index of the model.
+        """
+        index = ElementIndex(self)
+        index.build()
+        object.__setattr__(self, '_element_index', index)
+        return index
+
+    def get_index(self) -> Optional[ElementIndex]:
+        """Get the index built by build_index, or None if there is none."""
+        return getattr(self, '_element_index', None)
+
     def copy_to(self, new_oscal_type: Type['OscalBaseModel']) -> 'OscalBaseModel':
         """
         Opportunistic copy operation between similar types of data classes.
@@ -72,6 +72,8 @@ class CatalogInterface():
         """Initialize the interface with the catalog."""
         self._catalog = catalog
         self._param_dict: Dict[str, str] = {}
+        # direct sub-control ids of each control that has them, in catalog order
+        self._child_dict: Dict[str, List[str]] = {}
         self._control_dict = self._create_control_dict() if catalog else None
 
     def _add_params_to_dict(self, control: cat.Control) -> None:
@@ -96,6 +98,7 @@ class CatalogInterface():
             group_id = control_handle.group_id
             group_title = control_handle.group_title
             group_class = control_handle.group_class
+            self._child_dict[control_handle.control.id] = [con.id for con in control_handle.control.controls]
             for sub_control in control_handle.control.controls:
                 control_handle = CatalogInterface.ControlHandle(
                     group_id=group_id, group_title=group_title, group_class=group_class, path=path, control=sub_control
@@ -168,12 +171,13 @@ class CatalogInterface():
         return controls
 
     def get_dependent_control_ids(self, control_id: str) -> List[str]:
-        """Find all children of this control."""
+        """Find all children of this control, depth first, using the precomputed child index."""
         children: List[str] = []
-        control = self.get_control(control_id)
-        if control.controls:
-            new_controls = self._get_all_controls_in_list(control.controls, True)
-            children.extend([con.id for con in new_controls])
+        stack = list(reversed(self._child_dict.get(control_id, [])))
+        while stack:
+            child_id = stack.pop()
+            children.append(child_id)
+            stack.extend(reversed(self._child_dict.get(child_id, [])))
         return children
 
     def get_control_ids(self) -> List[str]:
@@ -313,6 +317,10 @@ class CatalogInterface():
     def replace_control(self, control: cat.Control) -> None:
         """Replace the control in the control_dict after modifying it."""
         self._control_dict[control.id].control = control
+        if control.controls:
+            self._child_dict[control.id] = [con.id for con in control.controls]
+        else:
+            self._child_dict.pop(control.id, None)
 
     def get_catalog(self, update=True) -> cat.Catalog:
         """Safe method to get catalog after forced update from catalog dict."""
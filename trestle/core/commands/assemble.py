@@ -29,7 +29,7 @@ from trestle.core.models.file_content_type import FileContentType
 from trestle.core.models.plans import Plan
 from trestle.utils import fs
 from trestle.utils import log
-from trestle.utils.load_distributed import load_distributed
+from trestle.utils.load_distributed import load_distributed, stream_distributed
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +46,17 @@ class AssembleCmd(CommandPlusDocs):
         self.add_argument(
             '-x', '--extension', help='Type of file output.', choices=['json', 'yaml', 'yml'], default='json'
         )
+        self.add_argument(
+            '--stream',
+            help='Write the assembled json model incrementally from the split files instead of loading it in memory.',
+            action='store_true'
+        )
+        self.add_argument(
+            '--no-validate',
+            help='Do not validate the model assembled with --stream.',
+            dest='validate',
+            action='store_false'
+        )
 
     def _run(self, args: argparse.Namespace) -> int:
         return self.assemble_model(args.model, args)
@@ -91,14 +102,28 @@ class AssembleCmd(CommandPlusDocs):
                     logger.error(f'No top level model file at {root_model_dir}')
                     return CmdReturnCodes.COMMAND_ERROR.value
 
-                # distributed load
-                _, _, assembled_model = load_distributed(root_model_filepath, args.trestle_root)
                 plural_alias = fs.model_type_to_model_dir(model_alias)
 
                 assembled_model_dir = trestle_root / const.TRESTLE_DIST_DIR / plural_alias
 
                 assembled_model_filepath = assembled_model_dir / f'{model_name}.{args.extension}'
 
+                if getattr(args, 'stream', False):
+                    if args.extension == 'json':
+                        assembled_model_dir.mkdir(parents=True, exist_ok=True)
+                        stream_distributed(
+                            root_model_filepath,
+                            args.trestle_root,
+                            assembled_model_filepath,
+                            model_alias,
+                            validate=getattr(args, 'validate', True)
+                        )
+                        continue
+                    logger.warning('Streaming assembly only supports json output so the model is loaded in memory.')
+
+                # distributed load
+                _, _, assembled_model = load_distributed(root_model_filepath, args.trestle_root)
+
                 plan = Plan()
                 plan.add_action(CreatePathAction(assembled_model_filepath, True))
                 plan.add_action(
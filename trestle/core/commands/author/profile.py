@@ -117,7 +117,7 @@ class ProfileGenerate(AuthorCommonCommand):
         """
         try:
             _, _, profile = load_distributed(profile_path, trestle_root)
-            catalog = ProfileResolver().get_resolved_profile_catalog(trestle_root, profile_path, True)
+            catalog = ProfileResolver().get_resolved_profile_catalog(trestle_root, profile_path, True, use_cache=True)
             catalog_interface = CatalogInterface(catalog)
             catalog_interface.write_catalog_as_markdown(
                 markdown_path, yaml_header, None, False, True, profile, preserve_header_values, set_parameters
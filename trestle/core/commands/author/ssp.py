@@ -100,7 +100,7 @@ class SSPGenerate(AuthorCommonCommand):
 
         profile_resolver = ProfileResolver()
         try:
-            resolved_catalog = profile_resolver.get_resolved_profile_catalog(trestle_root, profile_path)
+            resolved_catalog = profile_resolver.get_resolved_profile_catalog(trestle_root, profile_path, use_cache=True)
             catalog_interface = CatalogInterface(resolved_catalog)
         except Exception as e:
             logger.error(f'Error creating the resolved profile catalog: {e}')
@@ -304,7 +304,7 @@ class SSPFilter(AuthorCommonCommand):
             )
 
             prof_resolver = ProfileResolver()
-            catalog = prof_resolver.get_resolved_profile_catalog(trestle_root, profile_path)
+            catalog = prof_resolver.get_resolved_profile_catalog(trestle_root, profile_path, use_cache=True)
             catalog_interface = CatalogInterface(catalog)
 
             # The input ssp should reference a superset of the controls referenced by the profile
@@ -19,7 +19,7 @@ import argparse
 import logging
 import pathlib
 import traceback
-from typing import List
+from typing import Any, List
 
 import trestle.utils.log as log
 from trestle.core.base_model import OscalBaseModel
@@ -27,7 +27,7 @@ from trestle.core.commands.command_docs import CommandPlusDocs
 from trestle.core.commands.common import cmd_utils as utils
 from trestle.core.commands.common.return_codes import CmdReturnCodes
 from trestle.core.err import TrestleError
-from trestle.core.models.elements import Element
+from trestle.core.lazy_model import LazyOscalModel
 from trestle.utils import fs
 
 logger = logging.getLogger(__name__)
@@ -113,12 +113,14 @@ class DescribeCmd(CommandPlusDocs):
         # figure out the model type so we can read it
         try:
             model_type, _ = fs.get_stripped_model_type(file_path, trestle_root)
-            model: OscalBaseModel = model_type.oscal_read(file_path)
+            model = LazyOscalModel.read(model_type, file_path)
         except TrestleError as e:
             logger.warning(f'Error loading model {file_path} to describe: {e}')
             return []
 
-        sub_model = model
+        # only the element being described is built from the file
+        sub_model: Any = model
+        sub_model_type = model_type
 
         # if an element path was provided, follow the path chain to the desired sub_model
         if element_path_str:
@@ -130,13 +132,13 @@ class DescribeCmd(CommandPlusDocs):
                 logger.warning('The element path for describe must either be omitted or contain at least 2 parts.')
                 return []
 
-            element_paths = utils.parse_element_arg(model, element_path_str)
+            element_paths = utils.parse_element_arg(None, element_path_str)
 
-            sub_model_element = Element(model)
-
-            for element_path in element_paths:
-                sub_model = sub_model_element.get_at(element_path, False)
-                sub_model_element = Element(sub_model)
+            sub_model = model.get_at(element_paths[-1])
+            if sub_model is None:
+                logger.warning(f'Element path {element_path_str} is not present in model file {file_path}.')
+                return []
+            sub_model_type = type(sub_model)
 
         # now that we have the desired sub_model we can describe it
 
@@ -151,10 +153,10 @@ class DescribeCmd(CommandPlusDocs):
             logger.info(text)
         else:
             text = f'Model file {file_path}{element_text} is of type '
-            text += f'{cls._clean_type_string(str(type(sub_model)))} and contains:'
+            text += f'{cls._clean_type_string(str(sub_model_type))} and contains:'
             text_out.append(text)
             logger.info(text)
-            for key in sub_model.__fields__.keys():
+            for key in sub_model_type.__fields__.keys():
                 value = getattr(sub_model, key, None)
                 text = f'    {key}: {cls._description_text(value)}'
                 text_out.append(text)
@@ -25,7 +25,7 @@ from trestle.core.base_model import OscalBaseModel
 from trestle.core.commands.command_docs import CommandPlusDocs
 from trestle.core.commands.common.return_codes import CmdReturnCodes
 from trestle.core.err import TrestleError
-from trestle.core.models.actions import CreatePathAction, RemovePathAction, WriteFileAction
+from trestle.core.models.actions import CreatePathAction, RemovePathAction, StreamWriteFileAction, WriteFileAction
 from trestle.core.models.elements import Element, ElementPath
 from trestle.core.models.file_content_type import FileContentType
 from trestle.core.models.plans import Plan
@@ -47,6 +47,18 @@ class MergeCmd(CommandPlusDocs):
             help=f'{const.ARG_DESC_ELEMENT}(s) to be merged. The last element is merged into the second last element.',
             required=True
         )
+        self.add_argument(
+            '--stream',
+            help='Write the merged json model incrementally from the split files instead of loading it in memory. '
+            'Only applies to merges with the * wildcard.',
+            action='store_true'
+        )
+        self.add_argument(
+            '--no-validate',
+            help='Do not validate the merged model written with --stream.',
+            dest='validate',
+            action='store_false'
+        )
 
     def _run(self, args: argparse.Namespace) -> int:
         """Merge elements into the parent oscal model."""
@@ -59,7 +71,9 @@ class MergeCmd(CommandPlusDocs):
             element_paths = elements_clean.split(',')
             logger.debug(f'merge _run element paths {element_paths}')
             cwd = Path.cwd()
-            rc = self.perform_all_merges(element_paths, cwd, args.trestle_root)
+            stream = getattr(args, 'stream', False)
+            validate = getattr(args, 'validate', True)
+            rc = self.perform_all_merges(element_paths, cwd, args.trestle_root, stream, validate)
             return rc
         except TrestleError as e:
             logger.debug(traceback.format_exc())
@@ -71,12 +85,19 @@ class MergeCmd(CommandPlusDocs):
             return CmdReturnCodes.UNKNOWN_ERROR.value
 
     @classmethod
-    def perform_all_merges(cls, element_paths: List[str], effective_cwd: Path, trestle_root: Path) -> int:
+    def perform_all_merges(
+        cls,
+        element_paths: List[str],
+        effective_cwd: Path,
+        trestle_root: Path,
+        stream: bool = False,
+        validate: bool = True
+    ) -> int:
         """Run all merges over a list of element paths."""
         try:
             for element_path in element_paths:
                 logger.debug(f'merge {element_path}')
-                plan = cls.merge(effective_cwd, ElementPath(element_path), trestle_root)
+                plan = cls.merge(effective_cwd, ElementPath(element_path), trestle_root, stream, validate)
                 plan.execute()
         except TrestleError as err:
             logger.error(f'Merge failed: {err}')
@@ -84,10 +105,19 @@ class MergeCmd(CommandPlusDocs):
         return CmdReturnCodes.SUCCESS.value
 
     @classmethod
-    def merge(cls, effective_cwd: Path, element_path: ElementPath, trestle_root: Path) -> Plan:
+    def merge(
+        cls,
+        effective_cwd: Path,
+        element_path: ElementPath,
+        trestle_root: Path,
+        stream: bool = False,
+        validate: bool = True
+    ) -> Plan:
         """Merge operations.
 
-        It returns a plan for the operation
+        It returns a plan for the operation.
+        With stream and the * wildcard the plan writes a json destination model from the split files, without loading
+        it in memory, and validates it only if requested, before removing the split files.
         """
         if not element_path.is_multipart():
             msg = 'Multiple parts of an element path must be passed to merge e.g. catalog.* or catalog.groups'
@@ -128,6 +158,29 @@ class MergeCmd(CommandPlusDocs):
             if destination_model_type.is_collection_container():
                 collection_type = destination_model_type.get_collection_type()
 
+            remove_path_folder = effective_cwd / destination_model_alias
+            if stream and file_type == FileContentType.JSON:
+                logger.debug(f'stream merged model to {destination_model_path}')
+
+                def stream_destination(out_path: Path) -> None:
+                    load_distributed.stream_distributed(
+                        destination_model_path,
+                        trestle_root,
+                        out_path,
+                        destination_model_alias,
+                        collection_type,
+                        validate
+                    )
+
+                plan = Plan()
+                plan.add_action(
+                    StreamWriteFileAction(destination_model_path, stream_destination, destination_model_alias)
+                )
+                plan.add_action(RemovePathAction(remove_path_folder))
+                return plan
+            if stream:
+                logger.warning('Streaming merge only supports json models so the model is loaded in memory.')
+
             merged_model_type, _, merged_model_instance = load_distributed.load_distributed(
                 destination_model_path, trestle_root, collection_type)
             plan = Plan()
@@ -136,7 +189,6 @@ class MergeCmd(CommandPlusDocs):
             write_destination_action = WriteFileAction(
                 destination_model_path, Element(merged_model_instance, wrapper_alias), content_type=file_type
             )
-            remove_path_folder = effective_cwd / destination_model_alias
             delete_target_action = RemovePathAction(remove_path_folder)
             plan: Plan = Plan()
             plan.add_action(reset_destination_action)
@@ -84,7 +84,7 @@ class RemoveCmd(CommandPlusDocs):
                 logger.error(f'Remove failed (parent_model.oscal_read()): {err}')
                 return CmdReturnCodes.COMMAND_ERROR.value
 
-            parent_element = Element(parent_object, parent_alias)
+            parent_element = Element(parent_object, parent_alias, indexed=True)
 
             add_plan = Plan()
 
@@ -198,7 +198,7 @@ class SplitCmd(CommandPlusDocs):
             trash.store(file_path, True)
 
             try:
-                split_plan.execute()
+                split_plan.execute_batched()
             except Exception as e:
                 logger.error(f'Split has failed with error: {e}.')
                 trash.recover(file_path, True)
@@ -21,6 +21,7 @@ import traceback
 
 import trestle.core.validator_factory as vfact
 import trestle.utils.log as log
+from trestle.core.base_model import trusted_load
 from trestle.core.commands.command_docs import CommandPlusDocs
 from trestle.core.commands.common.return_codes import CmdReturnCodes
 from trestle.core.const import VAL_MODE_ALL
@@ -46,7 +47,9 @@ class ValidateCmd(CommandPlusDocs):
             mode_args = argparse.Namespace(mode=VAL_MODE_ALL)
             validator = vfact.validator_factory.get(mode_args)
 
-            return validator.validate(args)
+            # models are always fully validated here, even if trusted load is enabled
+            with trusted_load(False):
+                return validator.validate(args)
         except TrestleError as e:
             logger.debug(traceback.format_exc())
             logger.error(f'Error while validating contents of a trestle model: {e}')
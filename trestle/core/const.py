@@ -196,6 +196,35 @@ HOUR_SECONDS: int = 3600
 
 DAY_SECONDS: int = 24 * HOUR_SECONDS
 
+TRESTLE_RESOLVED_CACHE_DIR = TRESTLE_CACHE_DIR + '/resolved'
+
+# maximum number of parsed models retained in memory by the fetcher memo
+MODEL_MEMO_MAX_SIZE: int = 16
+
+HASH_CHUNK_SIZE: int = 1 << 20
+
+TRESTLE_VALIDATION_MANIFEST = TRESTLE_CACHE_DIR + '/validation_manifest.json'
+
+TRESTLE_YAML_CACHE_DIR = TRESTLE_CACHE_DIR + '/yaml'
+
+# json files at least this large are mapped into memory rather than read into a buffer before parsing
+MMAP_MIN_FILE_SIZE: int = 1 << 20
+
+# environment variable enabling the cache of parsed yaml files
+TRESTLE_YAML_CACHE_ENV = 'TRESTLE_YAML_CACHE'
+
+# environment variable making models read from files be built without validation unless a call says otherwise
+TRESTLE_TRUSTED_LOAD_ENV = 'TRESTLE_TRUSTED_LOAD'
+
+# maximum number of threads reading the files of a decomposed model
+LOAD_DISTRIBUTED_MAX_WORKERS: int = 8
+
+# maximum number of threads encoding and staging the files written by a plan
+PLAN_MAX_WORKERS: int = 8
+
+# prefix of the temporary directories in which a plan stages its files
+PLAN_STAGING_PREFIX = 'staging_'
+
 FILE_URI = 'file:///'
 
 SFTP_URI = 'sftp://'
@@ -15,9 +15,41 @@
 # limitations under the License.
 """Validate by confirming no duplicate uuids."""
 
+import logging
+from typing import Any, List, Tuple
+
+import pydantic
+
 from trestle.core.base_model import OscalBaseModel
-from trestle.core.validator import Validator
-from trestle.core.validator_helper import has_no_duplicate_values_by_name
+from trestle.core.validator import ModelVisitor, Validator
+from trestle.core.validator_helper import find_duplicates
+
+logger = logging.getLogger(__name__)
+
+
+class DuplicatesVisitor(ModelVisitor):
+    """Collect the values of a name in the model along with their element paths."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize the visitor for values of the given name."""
+        self._name = name
+        self._paths_and_values: List[Tuple[str, Any]] = []
+
+    def visit(self, node: Any, path: str) -> None:
+        """Collect the value of the name if the node has it."""
+        if isinstance(node, pydantic.BaseModel):
+            value = getattr(node, self._name, None)
+        else:
+            value = node.get(self._name, None)
+        if value is not None:
+            self._paths_and_values.append((f'{path}.{self._name}', value))
+
+    def is_valid(self) -> bool:
+        """Return whether no value was seen more than once."""
+        duplicates = find_duplicates(self._paths_and_values)
+        for item, paths in duplicates:
+            logger.info(f'Duplicate detected of item {item} with {len(paths)} instances at {", ".join(paths)}.')
+        return not duplicates
 
 
 class DuplicatesValidator(Validator):
@@ -33,4 +65,8 @@ class DuplicatesValidator(Validator):
         returns:
             True (valid) if the model does not contain duplicate uuid's.
         """
-        return has_no_duplicate_values_by_name(model, 'uuid')
+        return self._model_is_valid_by_visitor(model)
+
+    def get_visitor(self) -> ModelVisitor:
+        """Get a visitor counting the uuids in the model."""
+        return DuplicatesVisitor('uuid')
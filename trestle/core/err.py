@@ -30,7 +30,8 @@ class TrestleError(RuntimeError):
         Args:
             msg (str): The error message
         """
-        RuntimeError.__init__(self)
+        # pass msg through so the error survives pickling, e.g. when raised in a process pool worker
+        RuntimeError.__init__(self, msg)
         self.msg = msg
 
     def __str__(self) -> str:
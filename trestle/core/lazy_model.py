@@ -0,0 +1,169 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2021 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Lazy view of an OSCAL model that only builds the parts of it that are accessed."""
+
+import logging
+import pathlib
+from typing import Any, Dict, List, Optional, Type
+
+from pydantic import BaseModel
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON
+
+from trestle.core.base_model import OscalBaseModel, is_trusted_load_enabled
+from trestle.core.err import TrestleError
+from trestle.core.models.elements import ElementPath
+from trestle.core.utils import classname_to_alias
+
+logger = logging.getLogger(__name__)
+
+
+class LazyOscalModel():
+    """
+    View of an OSCAL model read from a file, building its typed sub-models only when they are first accessed.
+
+    The file is parsed once into its raw content.  Accessing a field as an attribute builds just that field and
+    caches it, and get_at builds just the element at the path, so a command that only needs the metadata of a
+    large model never builds the rest of it.  Only the parts that are built are validated.
+    """
+
+    def __init__(self, model_type: Type[OscalBaseModel], obj: Dict[str, Any], trusted: Optional[bool] = None) -> None:
+        """
+        Initialize the view of the raw content.
+
+        Args:
+            model_type: The type of the model.
+            obj: The raw content of the model, not wrapped by its top level key.
+            trusted: True to build the parts without validation, None to follow the trusted load setting.
+        """
+        self._model_type = model_type
+        self._obj = obj
+        self._trusted = is_trusted_load_enabled() if trusted is None else trusted
+        self._model: Optional[OscalBaseModel] = None
+        self._values: Dict[str, Any] = {}
+        self._elements: Dict[str, Any] = {}
+
+    @classmethod
+    def read(
+        cls, model_type: Type[OscalBaseModel], path: pathlib.Path, trusted: Optional[bool] = None
+    ) -> 'LazyOscalModel':
+        """
+        Read the raw content of an OSCAL file into a lazy view of the model.
+
+        Args:
+            model_type: The type of the model in the file.
+            path: The path of the oscal object to read.
+            trusted: True to build the parts without validation, None to follow the trusted load setting.
+        Returns:
+            The lazy view of the model.
+        """
+        obj = model_type.oscal_read_raw(path)
+        alias = classname_to_alias(model_type.__name__, 'json')
+        if not isinstance(obj, dict) or len(obj) != 1 or alias not in obj:
+            raise TrestleError(f'Provided oscal file {path} does not have the single top level key: {alias}')
+        return cls(model_type, obj[alias], trusted)
+
+    @property
+    def model_type(self) -> Type[OscalBaseModel]:
+        """Get the type of the model."""
+        return self._model_type
+
+    def _parse_value(self, model_type: Type[OscalBaseModel], name: str, value: Any, item: bool = False) -> Any:
+        try:
+            return model_type.parse_field_value(name, value, self._trusted, item)
+        except Exception as e:
+            raise TrestleError(f'Error parsing {name} of {model_type.__name__}: {e}')
+
+    def __getattr__(self, name: str) -> Any:
+        """Get the value of the field, building and caching it on first access."""
+        # only called for names that are not regular attributes of the view
+        if name.startswith('_') or name not in self._model_type.__fields__:
+            raise AttributeError(f'{self._model_type.__name__} has no field {name}')
+        if name not in self._values:
+            if self._model is not None:
+                self._values[name] = getattr(self._model, name)
+            else:
+                value = self._obj.get(self._model_type.__fields__[name].alias, None)
+                self._values[name] = None if value is None else self._parse_value(self._model_type, name, value)
+        return self._values[name]
+
+    def get_at(self, element_path: ElementPath) -> Any:
+        """
+        Get the element at the element path, building and caching only that element.
+
+        The path is followed as Element.get_at does, through field aliases and list indices, and stops at a wildcard.
+
+        Args:
+            element_path: The element path, starting with the alias of the model.
+        Returns:
+            The element at the path, or None if it is not present.
+        """
+        path_parts = element_path.get_full_path_parts()[1:]
+        path_key = ElementPath.PATH_SEPARATOR.join(path_parts)
+        if path_key not in self._elements:
+            self._elements[path_key] = self._build_element(path_parts)
+        return self._elements[path_key]
+
+    def _build_element(self, path_parts: List[str]) -> Any:
+        """Follow the path through the raw content and build the element at its end."""
+        parent_type: Type[OscalBaseModel] = self._model_type
+        field_name: Optional[str] = None
+        value: Any = self._obj
+        item = False
+        for part in path_parts:
+            if part == ElementPath.WILDCARD:
+                break
+            field = None if field_name is None else parent_type.__fields__[field_name]
+            if part.isnumeric():
+                # index to a non list type returns None
+                if field is None or field.shape != SHAPE_LIST or item or not isinstance(value, list):
+                    return None
+                index = int(part)
+                if index >= len(value):
+                    return None
+                value = value[index]
+                item = True
+                continue
+            if field is not None:
+                # only a single sub-model can be followed into by alias
+                is_model = isinstance(field.type_, type) and issubclass(field.type_, BaseModel)
+                if not is_model or not (field.shape == SHAPE_SINGLETON or item):
+                    return None
+                parent_type = field.type_
+            alias_field = parent_type.alias_to_field_map().get(part, None)
+            if alias_field is None or not isinstance(value, dict):
+                return None
+            field_name = alias_field.name
+            value = value.get(part, None)
+            item = False
+            if value is None:
+                return None
+        if field_name is None:
+            return self.materialize()
+        if parent_type is self._model_type and not item:
+            return getattr(self, field_name)
+        return self._parse_value(parent_type, field_name, value, item)
+
+    def materialize(self) -> OscalBaseModel:
+        """Build the whole model and cache it."""
+        if self._model is None:
+            try:
+                if self._trusted:
+                    self._model = self._model_type.parse_obj_trusted(self._obj)
+                else:
+                    self._model = self._model_type.parse_obj(self._obj)
+            except Exception as e:
+                raise TrestleError(f'Error parsing {self._model_type.__name__}: {e}')
+        return self._model
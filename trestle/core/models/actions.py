@@ -19,7 +19,7 @@ import os
 import pathlib
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Callable, List, Optional
 
 import trestle.core.const as const
 from trestle.core.err import TrestleError
@@ -130,8 +130,11 @@ class WriteAction(Action):
 
         return False
 
-    def _encode(self) -> str:
+    def encode(self) -> str:
         """Encode the element to appropriate content type."""
+        if self._element is None:
+            raise TrestleError('Element is empty and cannot write')
+
         if self._content_type == FileContentType.YAML:
             return self._element.to_yaml()
         if self._content_type == FileContentType.JSON:
@@ -147,7 +150,7 @@ class WriteAction(Action):
         if not self._is_writer_valid():
             raise TrestleError('Writer is not provided or closed')
 
-        self._writer.write(self._encode())
+        self._writer.write(self.encode())
         self._writer.flush()
         self._mark_executed()
 
@@ -191,6 +194,10 @@ class WriteFileAction(WriteAction):
         # Note, execute and rollback sets the writer as appropriate
         super().__init__(None, element, content_type)
 
+    def get_file_path(self) -> pathlib.Path:
+        """Return the path of the file written."""
+        return self._file_path
+
     def execute(self) -> None:
         """Execute the action."""
         if not self._file_path.exists():
@@ -219,6 +226,50 @@ class WriteFileAction(WriteAction):
         return f'{self._type} {self._element} to "{self._file_path}"'
 
 
+class StreamWriteFileAction(Action):
+    """Write a file with a function that streams the content to it, rather than encoding an element in memory."""
+
+    def __init__(self, file_path: pathlib.Path, write_file: Callable[[pathlib.Path], Any], description: str) -> None:
+        """Initialize a stream write file action.
+
+        Arguments:
+            file_path: the path of the file to write, which need not exist yet
+            write_file: the function called with the file path to write the file
+            description: what is written, used to describe the action
+        """
+        if not isinstance(file_path, pathlib.Path):
+            raise TrestleError('file_path should be of type pathlib.Path')
+
+        self._file_path = file_path
+        self._write_file = write_file
+        self._description = description
+        self._old_file_content: Optional[bytes] = None
+
+        super().__init__(ActionType.WRITE, True)
+
+    def execute(self) -> None:
+        """Execute the action."""
+        # keep the previous content for rollback
+        self._old_file_content = self._file_path.read_bytes() if self._file_path.exists() else None
+        self._write_file(self._file_path)
+        self._mark_executed()
+
+    def rollback(self) -> None:
+        """Rollback the action."""
+        if self.has_executed():
+            if self._old_file_content is not None:
+                self._file_path.write_bytes(self._old_file_content)
+            elif self._file_path.exists():
+                self._file_path.unlink()
+            self._old_file_content = None
+
+        self._mark_rollback()
+
+    def __str__(self) -> str:
+        """Return string representation."""
+        return f'{self._type} {self._description} to "{self._file_path}"'
+
+
 class CreatePathAction(Action):
     """Create a file or directory path."""
 
@@ -250,6 +301,14 @@ class CreatePathAction(Action):
         """Return the trestle project root path."""
         return self._trestle_project_root
 
+    def get_sub_path(self) -> pathlib.Path:
+        """Return the file or directory path created."""
+        return self._sub_path
+
+    def get_clear_content(self) -> bool:
+        """Return whether the content of an existing file is cleared."""
+        return self._clear_content
+
     def get_created_paths(self) -> List[pathlib.Path]:
         """Get the list of paths that were created after being executed."""
         return self._created_paths
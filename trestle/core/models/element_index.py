@@ -0,0 +1,251 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2021 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Index of the elements of a loaded model by element path and by id or uuid."""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Type
+
+import pydantic
+
+import trestle.core.const as const
+
+logger = logging.getLogger(__name__)
+
+# path of an element as the aliases and list indices leading to it from the root, without the root alias
+PathKey = Tuple[str, ...]
+
+UUID_FIELD = 'uuid'
+
+ID_FIELD = 'id'
+
+
+def _get_child(elm: Any, part: str) -> Any:
+    """Get the child of the element for one part of a path, in the same way as Element.get_at."""
+    if part.isnumeric():
+        # index to a non list type gives None
+        return elm[int(part)] if isinstance(elm, list) else None
+    return elm.get_field_value_by_alias(part)
+
+
+class ElementIndex():
+    """
+    Index of the elements of a model by path, and of the elements having an id or uuid.
+
+    Each element found by path is remembered along with every element on the way to it, so a path that was already
+    followed, or that extends one, is resolved without walking from the root again.  The maps of ids and uuids are
+    built by a single traversal of the whole model the first time one is looked up, and are kept up to date by update.
+    The index holds references into the model, so any change to the model not made through update needs a new index.
+    The paths indexed are linked to their parent paths, so update only visits the entries under the path replaced.
+    """
+
+    def __init__(self, root: Any) -> None:
+        """
+        Initialize the index of the model.
+
+        Args:
+            root: The model to index.  Searches start from the list or dict held by its __root__ if it has one.
+        """
+        self._model = root
+        root_value = getattr(root, '__root__', None)
+        if isinstance(root_value, (dict, list)):
+            root = root_value
+        self._root = root
+        self._paths: Dict[PathKey, Any] = {(): root}
+        # the paths below each path that has any indexed, including paths linking them to the root
+        self._children: Dict[PathKey, Set[PathKey]] = {}
+        self._uuids: Optional[Dict[str, PathKey]] = None
+        # the paths with each id, in a dict for order
+        self._ids: Optional[Dict[str, Dict[PathKey, None]]] = None
+        # the uuid and id held by the element at each path, to remove them with the path
+        self._uuid_of_path: Dict[PathKey, str] = {}
+        self._id_of_path: Dict[PathKey, str] = {}
+
+    @property
+    def model(self) -> Any:
+        """Get the model that is indexed."""
+        return self._model
+
+    def get(self, path: Sequence[str]) -> Any:
+        """
+        Get the element at the path.
+
+        Args:
+            path: The aliases and list indices leading to the element, which stops at the first wildcard.
+        Returns:
+            The element, or None if it is not present.
+        """
+        key = tuple(path)
+        if const.ELEMENT_WILDCARD in key:
+            key = key[:key.index(const.ELEMENT_WILDCARD)]
+        if key in self._paths:
+            return self._paths[key]
+        # resume from the longest part of the path already indexed
+        n_known = len(key) - 1
+        while key[:n_known] not in self._paths:
+            n_known -= 1
+        elm = self._paths[key[:n_known]]
+        for ii in range(n_known, len(key)):
+            elm = _get_child(elm, key[ii])
+            if elm is None:
+                return None
+            self._add_path(key[:ii + 1], elm)
+        return elm
+
+    def _add_path(self, key: PathKey, elm: Any) -> None:
+        """Add the element at the path, linking the path to those above it."""
+        self._paths[key] = elm
+        while key:
+            parent_key = key[:-1]
+            children = self._children.setdefault(parent_key, set())
+            if key in children:
+                break
+            children.add(key)
+            key = parent_key
+
+    def _remove_path(self, key: PathKey) -> None:
+        """Remove the path and all paths below it, along with the uuids and ids they hold."""
+        if key:
+            self._children.get(key[:-1], set()).discard(key)
+        stack = [key]
+        while stack:
+            key = stack.pop()
+            self._paths.pop(key, None)
+            uuid = self._uuid_of_path.pop(key, None)
+            if uuid is not None and self._uuids.get(uuid, None) == key:
+                del self._uuids[uuid]
+            id_ = self._id_of_path.pop(key, None)
+            if id_ is not None:
+                id_keys = self._ids[id_]
+                id_keys.pop(key, None)
+                if not id_keys:
+                    del self._ids[id_]
+            stack.extend(self._children.pop(key, ()))
+
+    def _index_from(self, key: PathKey, elm: Any) -> None:
+        """Index the element at the path and everything within it, adding those with an id or uuid to the maps."""
+        stack: List[Tuple[PathKey, Any]] = [(key, elm)]
+        while stack:
+            key, elm = stack.pop()
+            self._add_path(key, elm)
+            children: List[Tuple[PathKey, Any]] = []
+            if isinstance(elm, list):
+                children = [(key + (str(ii), ), item) for ii, item in enumerate(elm) if item is not None]
+            elif isinstance(elm, pydantic.BaseModel):
+                for name, field in elm.__fields__.items():
+                    value = getattr(elm, name, None)
+                    if value is None:
+                        continue
+                    if name == UUID_FIELD and isinstance(value, str):
+                        self._uuids[value] = key
+                        self._uuid_of_path[key] = value
+                    elif name == ID_FIELD and isinstance(value, str):
+                        self._ids.setdefault(value, {})[key] = None
+                        self._id_of_path[key] = value
+                    children.append((key + (field.alias, ), value))
+            # push in reverse so the elements are visited in document order
+            stack.extend(reversed(children))
+
+    def build(self) -> None:
+        """Build the full index by traversing the whole model once, indexing every element."""
+        self._uuids = {}
+        self._ids = {}
+        self._uuid_of_path = {}
+        self._id_of_path = {}
+        self._index_from((), self._root)
+
+    def update(self, path: Sequence[str], value: Any) -> None:
+        """
+        Update the index after the element at the path has been replaced by the value.
+
+        Only the entries under the path are removed from the index, and only the elements within the new value are
+        added, so the cost does not depend on the size of the rest of the model.
+
+        Args:
+            path: The aliases and list indices leading to the element that was replaced.
+            value: The new value at the path as held by the model, or None if it was removed.
+        """
+        key = tuple(path)
+        self._remove_path(key)
+        if value is None:
+            return
+        if self._uuids is None:
+            self._add_path(key, value)
+            return
+        self._index_from(key, value)
+
+    def get_path_of_uuid(self, uuid: str) -> Optional[PathKey]:
+        """
+        Get the path of the element with the uuid.
+
+        The path of its parent is the path up to the alias of the field holding the element.
+
+        Args:
+            uuid: The uuid of the element.
+        Returns:
+            The path of the element, or None if there is none.
+        """
+        if self._uuids is None:
+            self.build()
+        return self._uuids.get(uuid, None)
+
+    def get_by_uuid(self, uuid: str) -> Any:
+        """Get the element with the uuid, or None if there is none."""
+        key = self.get_path_of_uuid(uuid)
+        return None if key is None else self._paths[key]
+
+    def get_paths_of_id(self, id_: str) -> List[PathKey]:
+        """
+        Get the paths of all elements with the id, since ids are only unique among elements of the same type.
+
+        The paths are in document order, except that those of elements added by update come last.
+        """
+        if self._ids is None:
+            self.build()
+        return list(self._ids.get(id_, {}))
+
+    def get_path_of_id(self, id_: str) -> Optional[PathKey]:
+        """
+        Get the path of the element with the id or uuid.
+
+        Args:
+            id_: The id or uuid of the element.
+        Returns:
+            The path of the first element with the id, or of the element with the uuid, or None if there is none.
+        """
+        paths = self.get_paths_of_id(id_)
+        return paths[0] if paths else self.get_path_of_uuid(id_)
+
+    def get_by_id(self, id_: str, model_type: Optional[Type[Any]] = None) -> Any:
+        """
+        Get the element with the id or uuid.
+
+        Args:
+            id_: The id or uuid of the element.
+            model_type: The type of element to find, or None for the first element found with the id.
+        Returns:
+            The element, or None if there is none.
+        """
+        for key in self.get_paths_of_id(id_):
+            elm = self._paths[key]
+            if model_type is None or isinstance(elm, model_type):
+                return elm
+        elm = self.get_by_uuid(id_)
+        return elm if model_type is None or isinstance(elm, model_type) else None
+
+    @staticmethod
+    def to_path_str(root_alias: str, key: PathKey) -> str:
+        """Convert the path of an element into the string of its element path."""
+        return const.ALIAS_PATH_SEPARATOR.join((root_alias, ) + key)
@@ -15,17 +15,16 @@
 
 import logging
 import pathlib
-from typing import Any, List, Optional, Type, Union, cast
+from typing import Any, List, Optional, Tuple, Type, Union, cast
 
 from pydantic import Field, create_model
 from pydantic.error_wrappers import ValidationError
 
-from ruamel.yaml import YAML
-
 import trestle.core.const as const
 from trestle.core import common_types, utils
-from trestle.core.base_model import OscalBaseModel
+from trestle.core.base_model import OscalBaseModel, get_collection_wrapper_type
 from trestle.core.err import TrestleError, TrestleNotFoundError
+from trestle.core.models.element_index import ElementIndex, PathKey
 from trestle.core.models.file_content_type import FileContentType
 
 logger = logging.getLogger(__name__)
@@ -161,10 +160,7 @@ class ElementPath:
                 raise TrestleError('Unknown error inferring type from element path.')
             # Final path must be the alias
 
-            new_base_type = create_model(
-                utils.alias_to_classname(collection_name, 'json'), __base__=OscalBaseModel, __root__=(base_type, ...)
-            )
-            return new_base_type
+            return get_collection_wrapper_type(utils.alias_to_classname(collection_name, 'json'), base_type)
         return base_type
 
     def _top_level_type_lookup(self, element_str: str) -> Type[common_types.TopLevelOscalModel]:
@@ -368,7 +364,7 @@ class Element:
 
     _allowed_sub_element_types: List[str] = ['Element', 'OscalBaseModel', 'list', 'None', 'dict']
 
-    def __init__(self, elem: OscalBaseModel, wrapper_alias: str = ''):
+    def __init__(self, elem: OscalBaseModel, wrapper_alias: str = '', indexed: bool = False):
         """Initialize an element wrapper.
 
         wrapper_alias is the OSCAL alias for the given elem object and used for seriazation in to_json() method.
@@ -380,6 +376,11 @@ class Element:
         wrapper_alias is deduced for collection type object
 
         if wrapper_alias = IGNORE_WRAPPER_ALIAS, then it is ignored and assumed to be json-serializable during to_json()
+
+        if indexed is True, elements found by get_at are kept in an index so repeated lookups do not walk the model
+        again.  The index built on the model by build_index is then used if there is one.  It is updated by set_at, so
+        any other change to the model must call invalidate_index().  If indexed is False the model is always walked,
+        even if it has an index of its own.
         """
         # FIXME: There are instances where elem is a list.
         self._elem: OscalBaseModel = elem
@@ -396,6 +397,10 @@ class Element:
 
         self._wrapper_alias: str = wrapper_alias
 
+        self._index: Optional[ElementIndex] = None
+        if indexed:
+            self._index = self._get_model_index() or ElementIndex(elem)
+
     def _get_singular_classname(self) -> str:
         """Get the inner class name for list or dict objects."""
         # this assumes all items in list and all values in dict are same type
@@ -413,6 +418,43 @@ class Element:
         """Return the model object."""
         return self._elem
 
+    def _get_model_index(self) -> Optional[ElementIndex]:
+        """Get the index built on the model itself, if any."""
+        return self._elem.get_index() if isinstance(self._elem, OscalBaseModel) else None
+
+    def get_index(self) -> Optional[ElementIndex]:
+        """Return the index of the elements of the model, or None if the element is not indexed."""
+        return self._index
+
+    def invalidate_index(self) -> None:
+        """Invalidate the index after the model has been changed other than through set_at."""
+        if self._index is None:
+            return
+        if self._index is self._get_model_index():
+            self._index = self._elem.build_index()
+        else:
+            self._index = ElementIndex(self._elem)
+
+    def _get_search_root(self) -> Any:
+        """Get the element to start searches from, which is the list or dict held by __root__ if there is one."""
+        elm = self._elem
+        if hasattr(elm, '__root__') and (isinstance(elm.__root__, dict) or isinstance(elm.__root__, list)):
+            elm = elm.__root__
+        return elm
+
+    def _get_index_key(self, index: ElementIndex, element_path: ElementPath, check_parent: bool) -> PathKey:
+        """Get the path of the element in the index, resolving the parent path as get_at does."""
+        _, path_parts = self._split_element_path(element_path)
+        if const.ELEMENT_WILDCARD in path_parts:
+            path_parts = path_parts[:path_parts.index(const.ELEMENT_WILDCARD)]
+        parent_path = element_path.get_parent()
+        if check_parent and parent_path is not None and parent_path.get_last() != ElementPath.WILDCARD:
+            parent_key = self._get_index_key(index, parent_path, True)
+            if index.get(parent_key) is None:
+                raise TrestleNotFoundError(f'Invalid parent path {parent_path}')
+            return parent_key + tuple(path_parts)
+        return tuple(path_parts)
+
     def _split_element_path(self, element_path: ElementPath):
         """Split the element path into root_model and remaing attr names."""
         path_parts = element_path.get()
@@ -432,15 +474,17 @@ class Element:
         if element_path is None:
             return self._elem
 
+        index = self.get_index()
+        if index is not None:
+            return index.get(self._get_index_key(index, element_path, check_parent))
+
         # find the root-model and element path parts
         _, path_parts = self._split_element_path(element_path)
 
         # TODO validate that self._elem is of same type as root_model
 
         # initialize the starting element for search
-        elm = self._elem
-        if hasattr(elm, '__root__') and (isinstance(elm.__root__, dict) or isinstance(elm.__root__, list)):
-            elm = elm.__root__
+        elm = self._get_search_root()
 
         # if parent exists and does not end with wildcard, use the parent as the starting element for search
         if check_parent and element_path.get_parent(
@@ -543,41 +587,42 @@ class Element:
                 f'but found "{model_obj.__class__}"'
             )
 
+        # the model holds a validated copy of the sub-element, so that is what gets indexed
+        index = self.get_index()
+        if index is not None:
+            path_parts = element_path.get_full_path_parts()[1:]
+            if path_parts[-1] == ElementPath.WILDCARD:
+                path_parts = path_parts[:-1]
+            index.update(path_parts, getattr(preceding_elm, sub_element_name))
+
         # returning self will allow to do 'chaining' of commands after set
         return self
 
     def to_yaml(self) -> str:
         """Convert into YAML string."""
-        yaml = YAML(typ='safe')
-        yaml.default_flow_style = False
-        from io import StringIO
-        string_stream = StringIO()
-        yaml.dump(yaml.load(self.to_json(pretty=False)), string_stream)
-        yaml_data = string_stream.getvalue()
-        string_stream.close()
-
-        return yaml_data
+        model, wrapped = self._get_serializable_model()
+        return model.oscal_serialize_yaml(wrapped=wrapped, default_flow_style=False)
 
     def to_json(self, pretty: bool = True) -> str:
         """Convert into JSON string."""
-        if self._wrapper_alias == self.IGNORE_WRAPPER_ALIAS:
-            json_data = self._elem.oscal_serialize_json(pretty=pretty, wrapped=False)
+        model, wrapped = self._get_serializable_model()
+        return model.oscal_serialize_json(pretty=pretty, wrapped=wrapped)
 
-        else:
-            # Note before trying to edit this
-            # This transient model allows self._elem not be an OscalBaseModel (e.g. a DICT or LIST)
-            # typing need to be clarified.
-            if isinstance(self._elem, OscalBaseModel):
-                json_data = self._elem.oscal_serialize_json(pretty=pretty)
-            else:
-                dynamic_passer = {}
-                dynamic_passer['TransientField'] = (self._elem.__class__, Field(self, alias=self._wrapper_alias))
-                wrapper_model = create_model(
-                    'TransientModel', __base__=OscalBaseModel, **dynamic_passer
-                )  # type: ignore
-                wrapped_model = wrapper_model.construct(**{self._wrapper_alias: self._elem})
-                json_data = wrapped_model.oscal_serialize_json(pretty=pretty, wrapped=False)
-        return json_data
+    def _get_serializable_model(self) -> Tuple[OscalBaseModel, bool]:
+        """Get the model to serialize and whether it is wrapped by the alias of its class."""
+        if self._wrapper_alias == self.IGNORE_WRAPPER_ALIAS:
+            return self._elem, False
+
+        # Note before trying to edit this
+        # This transient model allows self._elem not be an OscalBaseModel (e.g. a DICT or LIST)
+        # typing need to be clarified.
+        if isinstance(self._elem, OscalBaseModel):
+            return self._elem, True
+        dynamic_passer = {}
+        dynamic_passer['TransientField'] = (self._elem.__class__, Field(self, alias=self._wrapper_alias))
+        wrapper_model = create_model('TransientModel', __base__=OscalBaseModel, **dynamic_passer)  # type: ignore
+        wrapped_model = wrapper_model.construct(**{self._wrapper_alias: self._elem})
+        return wrapped_model, False
 
     @classmethod
     def get_sub_element_class(cls, parent_elm: OscalBaseModel, sub_element_name: str):
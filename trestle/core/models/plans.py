@@ -13,10 +13,19 @@
 # limitations under the License.
 """Plan of action of a command."""
 import logging
+import os
+import pathlib
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from io import UnsupportedOperation
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
-from .actions import Action
+import trestle.core.const as const
+from trestle.core.err import TrestleError
+from trestle.utils import fs
+
+from .actions import Action, CreatePathAction, WriteFileAction
 
 logger = logging.getLogger(__name__)
 
@@ -68,6 +77,114 @@ class Plan:
                 self.rollback()
                 raise e
 
+    def execute_batched(self, max_workers: Optional[int] = None) -> None:
+        """Execute the plan by encoding the elements on a thread pool and moving all files into place at once.
+
+        Only plans made of CreatePathAction and WriteFileAction are batched, and any other plan is executed in order.
+        The files are staged in a temporary directory in the trestle project and are only moved into place once all
+        of them have been written, so a failure leaves the project as it was.
+        Each new directory tree is moved into place with a single rename and each file in an existing directory is
+        replaced individually, with any previous content restored if a later move fails.
+
+        Unlike execute, the individual actions are not marked as executed and cannot be rolled back afterwards.
+        """
+        if not all(isinstance(action, (CreatePathAction, WriteFileAction)) for action in self._actions):
+            self.execute()
+            return
+        trestle_root, targets = self._get_batch_targets()
+        if trestle_root is None:
+            return
+        staging_dir = pathlib.Path(
+            tempfile.mkdtemp(prefix=const.PLAN_STAGING_PREFIX, dir=trestle_root / const.TRESTLE_CONFIG_DIR)
+        )
+        new_dir = staging_dir / 'new'
+        try:
+            # the unit moved into place is the topmost missing part of each path, or the file itself if it exists
+            units: Dict[pathlib.Path, pathlib.Path] = {}
+            staged_files: List[Tuple[pathlib.Path, Optional[pathlib.Path], List[WriteFileAction]]] = []
+            for target, (is_file, clear, write_actions) in targets.items():
+                if target.exists() and (not is_file or (not clear and not write_actions)):
+                    continue
+                unit = target
+                for parent in reversed(target.parents):
+                    if len(parent.parts) > len(trestle_root.parts) and not parent.exists():
+                        unit = parent
+                        break
+                units[unit] = new_dir / unit.relative_to(trestle_root)
+                staged_path = new_dir / target.relative_to(trestle_root)
+                if is_file:
+                    staged_path.parent.mkdir(parents=True, exist_ok=True)
+                    prefix_path = target if target.exists() and not clear else None
+                    staged_files.append((staged_path, prefix_path, write_actions))
+                else:
+                    staged_path.mkdir(parents=True, exist_ok=True)
+            workers = max_workers if max_workers else const.PLAN_MAX_WORKERS
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda args: Plan._stage_file(*args), staged_files))
+            self._swap_units(units, staging_dir)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+    def _get_batch_targets(self) -> Tuple[Optional[pathlib.Path], Dict[pathlib.Path, Tuple[bool, bool, List]]]:
+        """Gather each path in the plan with whether it is a file, if it is cleared, and the actions writing to it."""
+        trestle_root: Optional[pathlib.Path] = None
+        targets: Dict[pathlib.Path, Tuple[bool, bool, List[WriteFileAction]]] = {}
+        for action in self._actions:
+            if isinstance(action, CreatePathAction):
+                path = action.get_sub_path()
+                action_root = action.get_trestle_project_root()
+                is_file = path.suffix != ''
+                _, clear, write_actions = targets.get(path, (is_file, False, []))
+                targets[path] = (is_file, clear or (is_file and action.get_clear_content()), write_actions)
+            else:
+                path = action.get_file_path().resolve()
+                action_root = fs.get_trestle_project_root(path)
+                if path not in targets:
+                    if not path.exists():
+                        raise TrestleError(f'File at {path} does not exist')
+                    targets[path] = (True, False, [])
+                targets[path][2].append(action)
+            if trestle_root is None:
+                trestle_root = action_root
+            elif action_root != trestle_root:
+                raise TrestleError(f'Path {path} is not in the trestle project {trestle_root}')
+        return trestle_root, targets
+
+    @staticmethod
+    def _stage_file(
+        staged_path: pathlib.Path, prefix_path: Optional[pathlib.Path], write_actions: List[WriteFileAction]
+    ) -> None:
+        """Write the existing content to keep, if any, followed by the encoded elements of the write actions."""
+        contents = [prefix_path.read_text(encoding=const.FILE_ENCODING)] if prefix_path is not None else []
+        for action in write_actions:
+            contents.append(action.encode())
+        staged_path.write_text(''.join(contents), encoding=const.FILE_ENCODING)
+
+    @staticmethod
+    def _swap_units(units: Dict[pathlib.Path, pathlib.Path], staging_dir: pathlib.Path) -> None:
+        """Move the staged units into place, restoring the previous state if any of the moves fails."""
+        backup_dir = staging_dir / 'old'
+        backup_dir.mkdir()
+        moved: List[Tuple[pathlib.Path, Optional[pathlib.Path]]] = []
+        try:
+            for index, (unit, staged_unit) in enumerate(units.items()):
+                backup = None
+                if unit.exists():
+                    backup = backup_dir / str(index)
+                    os.replace(unit, backup)
+                moved.append((unit, backup))
+                os.replace(staged_unit, unit)
+        except Exception as e:
+            logger.error(f'Failed to move the staged files of the plan into place: {e}. Rolling back.')
+            for unit, backup in reversed(moved):
+                if unit.is_dir():
+                    shutil.rmtree(unit)
+                elif unit.exists():
+                    unit.unlink()
+                if backup is not None:
+                    os.replace(backup, unit)
+            raise e
+
     def rollback(self) -> None:
         """Rollback the actions in the plan."""
         # execute in reverse order
@@ -17,13 +17,39 @@
 
 import logging
 import re
+from typing import Any
 
 from trestle.core.base_model import OscalBaseModel
-from trestle.core.validator import Validator
+from trestle.core.validator import ModelVisitor, Validator
 from trestle.oscal.__init__ import OSCAL_VERSION_REGEX
 
 logger = logging.getLogger(__name__)
 
+OSCAL_VERSION_PATTERN = re.compile(OSCAL_VERSION_REGEX)
+
+
+def oscal_version_is_valid(metadata: Any) -> bool:
+    """Check the OSCAL version in the metadata is supported."""
+    oscal_version = metadata.oscal_version.__root__
+    return OSCAL_VERSION_PATTERN.match(oscal_version) is not None
+
+
+class OSCALVersionVisitor(ModelVisitor):
+    """Check the OSCAL version in the metadata of the model."""
+
+    def __init__(self) -> None:
+        """Initialize the visitor."""
+        self._valid = False
+
+    def visit(self, node: Any, path: str) -> None:
+        """Check the version when the metadata of the model is reached."""
+        if path.count('.') == 1 and path.endswith('.metadata'):
+            self._valid = oscal_version_is_valid(node)
+
+    def is_valid(self) -> bool:
+        """Return whether the model has metadata with a supported OSCAL version."""
+        return self._valid
+
 
 class OSCALVersionValidator(Validator):
     """Validator to confirm the OSCAL version is the one supported."""
@@ -38,7 +64,8 @@ class OSCALVersionValidator(Validator):
         returns:
             True (valid) if the OSCAL version in the model is supported.
         """
-        oscal_version = model.metadata.oscal_version.__root__
-        p = re.compile(OSCAL_VERSION_REGEX)
-        matched = p.match(oscal_version)
-        return matched is not None
+        return oscal_version_is_valid(model.metadata)
+
+    def get_visitor(self) -> ModelVisitor:
+        """Get a visitor checking the OSCAL version."""
+        return OSCALVersionVisitor()
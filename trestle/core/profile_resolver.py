@@ -16,8 +16,8 @@
 import logging
 import pathlib
 import re
-import string
-from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Match, Optional, Set, Tuple, Union
 from uuid import uuid4
 
 import trestle.core.const as const
@@ -30,6 +30,7 @@ from trestle.core.control_io import ControlIOReader
 from trestle.core.err import TrestleError
 from trestle.core.pipeline import Pipeline
 from trestle.core.remote import cache
+from trestle.core.resolved_catalog_cache import ResolvedCatalogCache
 from trestle.core.utils import as_list, none_if_empty
 from trestle.oscal import common
 
@@ -57,6 +58,25 @@ ITEM_EXCLUDE_MAP = {
     'Catalog': CATALOG_EXCLUDE
 }
 
+# moustache with its contents, which is a param id possibly preceded by 'insert: param,'
+MOUSTACHE_REGEX = re.compile(r'{{(.*?)}}')
+
+# chars that may not be adjacent to a param id found in prose
+PARAM_ID_ADJACENT_CHARS = r'[A-Za-z0-9._]'
+
+
+def _run_import_pipeline(pipeline: Pipeline) -> cat.Catalog:
+    """Run a single import pipeline to completion.
+
+    This is module level so it can be pickled and sent to a process pool worker.
+    """
+    return next(pipeline.process(None))
+
+
+def _prefetch_href(trestle_root: pathlib.Path, href: str) -> None:
+    """Make sure the href is present and current in the trestle cache."""
+    cache.FetcherFactory.get_fetcher(trestle_root, href)._update_cache()
+
 
 class ProfileResolver():
     """Class to resolve a catalog given a profile."""
@@ -149,13 +169,13 @@ class ProfileResolver():
                     logger.warning('Profile does not specify include-controls, so including all.')
                 include_ids = self._catalog_interface.get_control_ids()
 
-            exclude_ids = self._controls_selected(self._import.exclude_controls)
+            exclude_ids = set(self._controls_selected(self._import.exclude_controls))
 
-            if not set(include_ids).issuperset(set(exclude_ids)):
+            if not exclude_ids.issubset(include_ids):
                 logger.debug(f'include_ids is not a superset of exclude_ids in import {self._import.href}')
             return [id_ for id_ in include_ids if id_ not in exclude_ids]
 
-        def _prune_control(self, needed_ids: List[str], control: cat.Control, exclude_ids: List[str]) -> cat.Control:
+        def _prune_control(self, needed_ids: Set[str], control: cat.Control, loaded_ids: Set[str]) -> cat.Control:
             """
             Prune the control based on the Import requirements.
 
@@ -167,14 +187,20 @@ class ProfileResolver():
                 return control
             controls = []
             for sub_control in control.controls:
-                if sub_control.id in needed_ids and sub_control.id not in exclude_ids:
-                    controls.append(self._prune_control(needed_ids, sub_control, exclude_ids))
-                    exclude_ids.append(sub_control.id)
+                if sub_control.id in needed_ids and sub_control.id not in loaded_ids:
+                    controls.append(self._prune_control(needed_ids, sub_control, loaded_ids))
+                    loaded_ids.add(sub_control.id)
             control.controls = none_if_empty(controls)
             return control
 
         def _prune_controls(self, needed_ids: List[str]) -> List[str]:
-            loaded_ids = []
+            """
+            Prune the needed controls and return the ids of those not loaded as sub-controls of another.
+
+            Membership checks use sets so the pruning is linear in the number of controls.
+            """
+            needed_id_set = set(needed_ids)
+            loaded_ids: Set[str] = set()
             final_ids: List[str] = []
             for control_id in needed_ids:
                 if control_id not in loaded_ids:
@@ -185,9 +211,9 @@ class ProfileResolver():
                             f'but it is not in catalog titled "{self._catalog.metadata.title}"'
                         )
                         raise TrestleError(msg)
-                    control = self._prune_control(needed_ids, control, loaded_ids)
+                    control = self._prune_control(needed_id_set, control, loaded_ids)
                     self._catalog_interface.replace_control(control)
-                    loaded_ids.append(control_id)
+                    loaded_ids.add(control_id)
                     final_ids.append(control_id)
             return final_ids
 
@@ -262,10 +288,20 @@ class ProfileResolver():
         Now the controls must be gathered, merged, and grouped based on the merge settings.
         """
 
-        def __init__(self, profile: prof.Profile) -> None:
-            """Initialize the class with the profile."""
+        def __init__(
+            self, profile: prof.Profile, max_workers: Optional[int] = None, use_processes: bool = True
+        ) -> None:
+            """
+            Initialize the class with the profile.
+
+            If max_workers is given the incoming import pipelines are run concurrently,
+            in a process pool if use_processes is True and otherwise in a thread pool.
+            The catalogs are still merged in the original order of the imports so the result is deterministic.
+            """
             logger.debug('merge filter initialize')
             self._profile = profile
+            self._max_workers = max_workers
+            self._use_processes = use_processes
 
         def _get_id(self, item: OBT) -> Optional[str]:
             id_ = getattr(item, ID, None)
@@ -412,9 +448,18 @@ class ProfileResolver():
             """
             merged: Optional[cat.Catalog] = None
             logger.debug(f'merge entering process with {len(pipelines)} pipelines')
-            for pipeline in pipelines:
-                catalog = next(pipeline.process(None))
-                merged = self._merge_catalog(merged, catalog)
+            if self._max_workers is None or len(pipelines) < 2:
+                for pipeline in pipelines:
+                    catalog = _run_import_pipeline(pipeline)
+                    merged = self._merge_catalog(merged, catalog)
+                yield merged
+                return
+            executor_class = ProcessPoolExecutor if self._use_processes else ThreadPoolExecutor
+            executor: Executor
+            with executor_class(max_workers=min(self._max_workers, len(pipelines))) as executor:
+                # map yields results in the order of the pipelines regardless of completion order
+                for catalog in executor.map(_run_import_pipeline, pipelines):
+                    merged = self._merge_catalog(merged, catalog)
             yield merged
 
     class Modify(Pipeline.Filter):
@@ -441,34 +486,15 @@ class ProfileResolver():
 
             Need to check all values in dict for a match
             Reject matches where the string has an adjacent alphanumeric char: param_1 and param_10 or aparam_1
+            All param ids are compiled into a single pattern, longest first, so the prose is scanned only once.
             """
-            for param_id, param_value in param_dict.items():
-                bad_chars = string.ascii_letters + string.digits + '._'
-                new_prose = prose
-                id_len = len(param_id)
-                loc = 0
-                if param_id not in prose:
-                    continue
-                # handle simple case directly
-                if prose == param_id:
-                    return param_value
-                # it's there, but may be param_10 instead of param_1
-                while True:
-                    if loc >= len(new_prose):
-                        return new_prose
-                    next_loc = new_prose[loc:].find(param_id)
-                    if next_loc < 0:
-                        return new_prose
-                    loc += next_loc
-                    if loc > 0 and new_prose[loc - 1] in bad_chars:
-                        loc += id_len
-                        continue
-                    end_loc = loc + id_len
-                    if end_loc == len(new_prose) or new_prose[end_loc] not in bad_chars:
-                        new_prose = new_prose[:loc] + param_value + new_prose[end_loc:]
-                        loc += len(param_value)
-                        continue
-                    loc += id_len
+            param_ids = [param_id for param_id in param_dict if param_id in prose]
+            if not param_ids:
+                return prose
+            param_ids.sort(key=len, reverse=True)
+            alternatives = '|'.join(re.escape(param_id) for param_id in param_ids)
+            pattern = f'(?<!{PARAM_ID_ADJACENT_CHARS})(?:{alternatives})(?!{PARAM_ID_ADJACENT_CHARS})'
+            return re.sub(pattern, lambda match: param_dict[match.group(0)], prose)
 
         @staticmethod
         def _replace_params(text: str, param_dict: Dict[str, str]) -> str:
@@ -476,55 +502,42 @@ class ProfileResolver():
             Replace params found in moustaches with values from the param_dict.
 
             A single line of prose may contain multiple moustaches.
+            The text is scanned once and each moustache is resolved with a single lookup in the param_dict.
             """
-            # first check if there are any moustache patterns in the text
-            staches = re.findall(r'{{.*?}}', text)
-            if not staches:
+            if '{{' not in text:
                 return text
-            # now have list of all staches including braces, e.g. ['{{foo}}', '{{bar}}']
-            # clean the staches so they just have the param ids
-            param_ids = []
-            for stache in staches:
-                # remove braces so these are just param_ids but may have extra chars
-                stache_contents = stache[2:(-2)]
-                param_id = stache_contents.replace('insert: param,', '').strip()
-                param_ids.append(param_id)
-
-            # now replace original stache text with param values
-            for i, _ in enumerate(staches):
+
+            def replace_stache(match: Match[str]) -> str:
+                # remove the insert directive so this is just the param_id
+                param_id = match.group(1).replace('insert: param,', '').strip()
                 # A moustache may refer to a param_id not listed in the control's params
-                if param_ids[i] in param_dict:
-                    text = text.replace(staches[i], param_dict[param_ids[i]], 1)
-                else:
-                    logger.warning(f'Control prose references param {param_ids[i]} not found in the catalog.')
-            return text
+                if param_id in param_dict:
+                    return param_dict[param_id]
+                logger.warning(f'Control prose references param {param_id} not found in the catalog.')
+                return match.group(0)
+
+            return MOUSTACHE_REGEX.sub(replace_stache, text)
 
         @staticmethod
-        def _replace_part_prose(control: cat.Control, part: common.Part, param_dict: Dict[str, str]) -> None:
-            """Replace the part prose according to set_param."""
+        def _replace_part_prose(part: common.Part, param_dict: Dict[str, str]) -> None:
+            """Replace the prose of the part and its sub-parts according to set_param."""
             if part.prose is not None:
                 fixed_prose = ProfileResolver.Modify._replace_params(part.prose, param_dict)
-                # change the prose in the control itself
-                part.prose = fixed_prose
+                # only assign if changed, since assignment triggers validation
+                if fixed_prose != part.prose:
+                    part.prose = fixed_prose
             for prt in as_list(part.parts):
-                ProfileResolver.Modify._replace_part_prose(control, prt, param_dict)
-            for sub_control in as_list(control.controls):
-                for prt in as_list(sub_control.parts):
-                    ProfileResolver.Modify._replace_part_prose(sub_control, prt, param_dict)
+                ProfileResolver.Modify._replace_part_prose(prt, param_dict)
 
         @staticmethod
         def _replace_control_prose(control: cat.Control, param_dict: Dict[str, str]) -> None:
-            """Replace the control prose according to set_param."""
+            """
+            Replace the control prose according to set_param.
+
+            Sub-controls are not visited here since every control, including sub-controls, is handled separately.
+            """
             for part in as_list(control.parts):
-                if part.prose is not None:
-                    fixed_prose = ProfileResolver.Modify._replace_params(part.prose, param_dict)
-                    # change the prose in the control itself
-                    part.prose = fixed_prose
-                for prt in as_list(part.parts):
-                    ProfileResolver.Modify._replace_part_prose(control, prt, param_dict)
-            for sub_control in as_list(control.controls):
-                for prt in as_list(sub_control.parts):
-                    ProfileResolver.Modify._replace_part_prose(sub_control, prt, param_dict)
+                ProfileResolver.Modify._replace_part_prose(part, param_dict)
 
         @staticmethod
         def _add_contents_as_list(add: prof.Add) -> List[OBT]:
@@ -760,14 +773,29 @@ class ProfileResolver():
             import_: prof.Import,
             change_prose=False,
             block_adds: bool = False,
-            params_format: str = None
+            params_format: str = None,
+            max_workers: Optional[int] = None,
+            use_processes: bool = True
         ) -> None:
-            """Initialize and store trestle root for cache access."""
+            """
+            Initialize and store trestle root for cache access.
+
+            max_workers and use_processes only apply to the direct imports of this profile.
+            Imports nested further down are resolved sequentially within the worker handling them.
+            """
             self._trestle_root = trestle_root
             self._import = import_
             self._block_adds = block_adds
             self._change_prose = change_prose
             self._params_format = params_format
+            self._max_workers = max_workers
+            self._use_processes = use_processes
+
+        def _prefetch_imports(self, imports: List[prof.Import]) -> None:
+            """Fetch all remote imports into the cache concurrently since this is i/o bound."""
+            hrefs = list(dict.fromkeys(import_.href for import_ in imports))
+            with ThreadPoolExecutor(max_workers=min(self._max_workers, len(hrefs))) as executor:
+                list(executor.map(lambda href: _prefetch_href(self._trestle_root, href), hrefs))
 
         def process(self, input_=None) -> Iterator[cat.Catalog]:
             """Load href for catalog or profile and yield each import as catalog imported by its distinct pipeline."""
@@ -797,7 +825,9 @@ class ProfileResolver():
                     logger.debug(
                         f'sub_import add pipeline for sub href {sub_import.href} of main href {self._import.href}'
                     )
-                merge_filter = ProfileResolver.Merge(profile)
+                if self._max_workers is not None and len(profile.imports) > 1:
+                    self._prefetch_imports(profile.imports)
+                merge_filter = ProfileResolver.Merge(profile, self._max_workers, self._use_processes)
                 modify_filter = ProfileResolver.Modify(
                     profile, self._change_prose, self._block_adds, self._params_format
                 )
@@ -809,12 +839,41 @@ class ProfileResolver():
         trestle_root: pathlib.Path,
         profile_path: pathlib.Path,
         block_adds: bool = False,
-        params_format: str = None
+        params_format: str = None,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+        use_cache: bool = False
     ) -> cat.Catalog:
-        """Create the resolved profile catalog given a profile path."""
+        """
+        Create the resolved profile catalog given a profile path.
+
+        Args:
+            trestle_root: root directory of the trestle project
+            profile_path: path of the profile being resolved
+            block_adds: prevent the application of adds in the final profile
+            params_format: optional pattern with dot to wrap the param string, where dot represents the param string
+            max_workers: if given, fetch and prune the imports of the profile concurrently with this many workers
+            use_processes: with max_workers, prune in a process pool rather than a thread pool
+            use_cache: reuse the resolved catalog stored in the trestle cache if the profile and all its imports
+                are unchanged, and store the result there otherwise
+
+        Returns:
+            The resolved profile catalog
+        """
+        resolved_cache: Optional[ResolvedCatalogCache] = None
+        if use_cache:
+            options = {'change_prose': True, 'block_adds': block_adds, 'params_format': params_format}
+            resolved_cache = ResolvedCatalogCache(trestle_root, profile_path, options)
+            cached_catalog = resolved_cache.load()
+            if cached_catalog is not None:
+                return cached_catalog
         logger.debug(f'get resolved profile catalog for {profile_path} via generated Import.')
         import_ = prof.Import(href=str(profile_path), include_all={})
-        import_filter = ProfileResolver.Import(trestle_root, import_, True, block_adds, params_format)
+        import_filter = ProfileResolver.Import(
+            trestle_root, import_, True, block_adds, params_format, max_workers, use_processes
+        )
         logger.debug('launch pipeline')
         result = next(import_filter.process())
+        if resolved_cache is not None:
+            resolved_cache.save(result)
         return result
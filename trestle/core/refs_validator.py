@@ -14,11 +14,39 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Validate by confirming all refs have corresponding id."""
+from typing import Any
+
 from trestle.core.base_model import OscalBaseModel
-from trestle.core.validator import Validator
+from trestle.core.validator import ModelVisitor, Validator
 from trestle.core.validator_helper import find_values_by_name
 
 
+def refs_are_valid(metadata: Any) -> bool:
+    """Check every role referenced by a responsible party in the metadata is found in its roles."""
+    # FIXME oscal 1.0.0
+    roles_list_of_lists = find_values_by_name(metadata, 'roles')
+    roles_set = {item.id for sublist in roles_list_of_lists for item in sublist}
+    responsible_parties_list = find_values_by_name(metadata, 'responsible_parties')
+    return all(party.role_id in roles_set for sublist in responsible_parties_list for party in sublist)
+
+
+class RefsVisitor(ModelVisitor):
+    """Check the roles referenced by responsible parties when the metadata of the model is reached."""
+
+    def __init__(self) -> None:
+        """Initialize the visitor."""
+        self._valid = True
+
+    def visit(self, node: Any, path: str) -> None:
+        """Check the references when the metadata of the model is reached."""
+        if path.count('.') == 1 and path.endswith('.metadata'):
+            self._valid = refs_are_valid(node)
+
+    def is_valid(self) -> bool:
+        """Return whether every role referenced by a responsible party was found in roles."""
+        return self._valid
+
+
 class RefsValidator(Validator):
     """Validator to confirm all references in responsible parties are found in roles."""
 
@@ -31,19 +59,8 @@ class RefsValidator(Validator):
         returns:
             True (valid) if the model's responsible parties match those found in roles.
         """
-        # FIXME oscal 1.0.0
-        metadata = model.metadata
-        roles_list_of_lists = find_values_by_name(metadata, 'roles')
-        roles_list = [item.id for sublist in roles_list_of_lists for item in sublist]
-        roles_set = set(roles_list)
-        responsible_parties_list = find_values_by_name(metadata, 'responsible_parties')
-        if not responsible_parties_list:
-            return True
-        responsible_parties = [item for sublist in responsible_parties_list for item in sublist]
-        party_roles = []
-        for r in responsible_parties:
-            party_roles.append(r.role_id)
-        for party in party_roles:
-            if party not in roles_set:
-                return False
-        return True
+        return refs_are_valid(model.metadata)
+
+    def get_visitor(self) -> ModelVisitor:
+        """Get a visitor checking the responsible parties against the roles."""
+        return RefsVisitor()
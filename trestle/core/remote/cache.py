@@ -26,10 +26,12 @@ import os
 import pathlib
 import platform
 import re
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from enum import Enum
 from io import StringIO
-from typing import Any, Dict, Tuple, Type
+from typing import Any, Dict, Optional, Tuple, Type
 from urllib import parse
 
 import paramiko
@@ -45,9 +47,56 @@ from trestle.utils import fs
 logger = logging.getLogger(__name__)
 
 
+class ModelMemo():
+    """
+    Size-bounded in-process memo of oscal models parsed from cached files.
+
+    Entries are keyed by the cached file path and a hash of its content, so any change to the file is a miss.
+    The stored model is never handed out directly - each hit returns a deep copy that the caller may modify freely.
+    This avoids re-parsing and re-validating the same catalog when it is imported several times in one resolution.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the memo with the maximum number of models retained."""
+        self._max_size = max_size
+        self._models: 'OrderedDict[Tuple[str, str], Tuple[OscalBaseModel, str]]' = OrderedDict()
+        # imports may be fetched from several threads at once
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[Tuple[OscalBaseModel, str]]:
+        """Get a copy of the memoized model and its root key, or None if not present."""
+        with self._lock:
+            entry = self._models.get(key, None)
+            if entry is None:
+                return None
+            self._models.move_to_end(key)
+        model, root_key = entry
+        return model.copy(deep=True), root_key
+
+    def put(self, key: Tuple[str, str], model: OscalBaseModel, root_key: str) -> None:
+        """Store a private copy of the model and evict the least recently used entries beyond the size limit."""
+        model_copy = model.copy(deep=True)
+        with self._lock:
+            self._models[key] = (model_copy, root_key)
+            self._models.move_to_end(key)
+            while len(self._models) > self._max_size:
+                self._models.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all memoized models."""
+        with self._lock:
+            self._models.clear()
+
+    def __len__(self) -> int:
+        """Return number of memoized models."""
+        return len(self._models)
+
+
 class FetcherBase(ABC):
     """FetcherBase - base class for caching and fetching remote oscal objects."""
 
+    _model_memo = ModelMemo(const.MODEL_MEMO_MAX_SIZE)
+
     def __init__(self, trestle_root: pathlib.Path, uri: str) -> None:
         """Intialize fetcher base.
 
@@ -105,9 +154,17 @@ class FetcherBase(ABC):
                 raise TrestleError(f'Cache update failure for {self._uri}') from e
         return False
 
+    def _content_hash(self) -> str:
+        """Hash the content of the cached file."""
+        return fs.get_file_hash(self._cached_object_path)
+
     def get_raw(self, force_update=False) -> Dict[str, Any]:
         """Retrieve the raw dictionary representing the underlying object."""
         self._update_cache(force_update)
+        return self._load_cached_raw()
+
+    def _load_cached_raw(self) -> Dict[str, Any]:
+        """Load the raw dictionary from the cached file."""
         # Return results in the cache, whether yaml or json, or whatever is supported by fs.load_file().
         try:
             raw_data = fs.load_file(self._cached_object_path)
@@ -140,13 +197,33 @@ class FetcherBase(ABC):
             raise TrestleError(f'get_oscal failure for {self._uri}')
 
     def get_oscal(self, force_update=False) -> Tuple[OscalBaseModel, str]:
-        """Retrieve the cached file and model name without knowing its model type."""
-        model_dict = self.get_raw(force_update)
+        """Retrieve the cached file and model name without knowing its model type.
+
+        Parsed models are memoized by cached file path and content hash, so an unchanged file is only parsed once.
+        The returned model is always a private copy and may be modified by the caller.
+        """
+        self._update_cache(force_update)
+        memo_key = None
+        if self._in_cache():
+            memo_key = (str(self._cached_object_path), self._content_hash())
+            memoized = FetcherBase._model_memo.get(memo_key)
+            if memoized is not None:
+                logger.debug(f'get_oscal using memoized model for {self._uri}')
+                return memoized
+        model_dict = self._load_cached_raw()
         root_key = parser.root_key(model_dict)
         model_name = parser.to_full_model_name(root_key)
         if model_name is None:
             raise TrestleError(f'Failed cache read of non top level model with root_key {root_key}')
-        return parser.parse_dict(model_dict[root_key], model_name), root_key
+        model = parser.parse_dict(model_dict[root_key], model_name)
+        if memo_key is not None:
+            FetcherBase._model_memo.put(memo_key, model, root_key)
+        return model, root_key
+
+    @staticmethod
+    def clear_model_memo() -> None:
+        """Clear the in-process memo of parsed models."""
+        FetcherBase._model_memo.clear()
 
 
 class LocalFetcher(FetcherBase):
@@ -0,0 +1,110 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2021 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persistent cache of resolved profile catalogs keyed by a fingerprint of everything the resolution depends on."""
+
+import hashlib
+import logging
+import pathlib
+from typing import Any, Dict, List, Optional, Set
+
+import trestle
+import trestle.core.const as const
+import trestle.oscal.catalog as cat
+from trestle.core.remote import cache
+
+logger = logging.getLogger(__name__)
+
+
+class ResolvedCatalogCache():
+    """
+    Store and retrieve resolved profile catalogs in the trestle cache directory.
+
+    There is one entry per profile and set of resolution options, containing the resolved catalog and the fingerprint
+    it was created with.  The fingerprint is a hash of the trestle version, the resolution options, and the content of
+    the profile and every catalog and profile it imports, directly or indirectly.
+    If anything changes the fingerprint no longer matches and the entry is replaced on the next save.
+    """
+
+    def __init__(self, trestle_root: pathlib.Path, profile_path: pathlib.Path, options: Dict[str, Any]) -> None:
+        """
+        Initialize the cache entry for the profile.
+
+        Args:
+            trestle_root: root directory of the trestle project
+            profile_path: path of the profile being resolved
+            options: the resolution options that affect the resolved catalog, such as block_adds
+        """
+        self._trestle_root = trestle_root.resolve()
+        self._profile_href = str(profile_path)
+        options_str = ','.join(f'{key}={options[key]}' for key in sorted(options.keys()))
+        self._options_str = f'trestle={trestle.__version__},{options_str}'
+        cache_dir = self._trestle_root / const.TRESTLE_RESOLVED_CACHE_DIR
+        entry_name = hashlib.sha256(f'{pathlib.Path(profile_path).resolve()}|{self._options_str}'.encode()).hexdigest()
+        self._catalog_path = cache_dir / f'{entry_name}.json'
+        self._fingerprint_path = cache_dir / f'{entry_name}.fingerprint'
+        self._fingerprint: Optional[str] = None
+
+    def _add_dependency(self, hasher: Any, href: str, visited: Set[str]) -> None:
+        """Add the content hash of the href to the fingerprint and recurse into the imports if it is a profile."""
+        fetcher = cache.FetcherFactory.get_fetcher(self._trestle_root, href)
+        fetcher._update_cache()
+        content_hash = fetcher._content_hash()
+        hasher.update(f'{href}|{content_hash}\n'.encode())
+        if content_hash in visited:
+            return
+        visited.add(content_hash)
+        raw_model = fetcher.get_raw()
+        profile_dict = raw_model.get(const.MODEL_TYPE_PROFILE, None) if isinstance(raw_model, dict) else None
+        if profile_dict is None:
+            return
+        imports: List[Dict[str, Any]] = profile_dict.get('imports', [])
+        for import_ in imports:
+            self._add_dependency(hasher, import_['href'], visited)
+
+    def fingerprint(self) -> str:
+        """Compute the fingerprint of the profile, its transitive imports and the resolution options."""
+        if self._fingerprint is None:
+            hasher = hashlib.sha256(self._options_str.encode())
+            self._add_dependency(hasher, self._profile_href, set())
+            self._fingerprint = hasher.hexdigest()
+        return self._fingerprint
+
+    def load(self) -> Optional[cat.Catalog]:
+        """Load the cached resolved catalog if present and still matching the fingerprint, otherwise return None."""
+        # always compute the fingerprint first so a later save reflects the inputs before resolution
+        fingerprint = self.fingerprint()
+        if not (self._catalog_path.exists() and self._fingerprint_path.exists()):
+            return None
+        if self._fingerprint_path.read_text(encoding=const.FILE_ENCODING) != fingerprint:
+            logger.debug(f'resolved catalog cache is stale for {self._profile_href}')
+            return None
+        try:
+            # the entry was written by trestle from a validated catalog so it is read without validation
+            catalog = cat.Catalog.oscal_read(self._catalog_path, trusted=True)
+        except Exception as e:
+            logger.debug(f'unable to read cached resolved catalog {self._catalog_path}: {e}')
+            return None
+        logger.debug(f'using cached resolved catalog for {self._profile_href}')
+        return catalog
+
+    def save(self, catalog: cat.Catalog) -> None:
+        """Save the resolved catalog along with its fingerprint."""
+        self._catalog_path.parent.mkdir(parents=True, exist_ok=True)
+        # write the fingerprint last so a partial write is never mistaken for a valid entry
+        if self._fingerprint_path.exists():
+            self._fingerprint_path.unlink()
+        self._catalog_path.write_bytes(catalog.oscal_serialize_json_bytes())
+        self._fingerprint_path.write_text(self.fingerprint(), encoding=const.FILE_ENCODING)
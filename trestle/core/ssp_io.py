@@ -23,6 +23,7 @@ from trestle.core.control_io import ControlIOWriter
 from trestle.core.err import TrestleError
 from trestle.core.markdown.markdown_node import MarkdownNode
 from trestle.core.markdown.md_writer import MDWriter
+from trestle.core.models.element_index import ElementIndex
 from trestle.oscal import ssp
 from trestle.oscal.catalog import Catalog
 from trestle.oscal.ssp import Statement
@@ -37,12 +38,19 @@ class SSPMarkdownWriter():
         """Initialize the class."""
         self._trestle_root = trestle_root
         self._ssp: ssp.SystemSecurityPlan = None
+        self._ssp_index: ElementIndex = None
+        self._implemented_reqs: Dict[str, ssp.ImplementedRequirement] = {}
         self._resolved_catalog: Catalog = None
         self._catalog_interface: CatalogInterface = None
 
     def set_ssp(self, ssp: ssp.SystemSecurityPlan):
         """Set ssp."""
         self._ssp = ssp
+        # index the ssp once rather than searching its lists for each control, without attaching it to the ssp
+        self._ssp_index = ElementIndex(ssp)
+        self._implemented_reqs = {}
+        for requirement in ssp.control_implementation.implemented_requirements:
+            self._implemented_reqs.setdefault(requirement.control_id, requirement)
 
     def set_catalog(self, resolved_catalog: Catalog):
         """Set catalog."""
@@ -117,32 +125,29 @@ class SSPMarkdownWriter():
         if self._ssp is None:
             raise TrestleError('Cannot get responsible roles, SSP is not set.')
 
-        for impl_requirement in self._ssp.control_implementation.implemented_requirements:
-            if impl_requirement.control_id == control_id:
-                if impl_requirement.responsible_roles:
-                    role_ids = []
-                    for resp_role in impl_requirement.responsible_roles:
-                        role_ids.append(resp_role.role_id.replace('_', ' '))
-
-                    # now check if this role exists in the metadata
-                    role_titles = dict(zip(role_ids, role_ids))
-                    if self._ssp.metadata.roles:
-                        for role in self._ssp.metadata.roles:
-                            if role.id in role_ids:
-                                role_titles[role.id] = role.title
-
-                    # dictionary to md table
-                    md_list = self._write_table_with_header(
-                        'Responsible Roles.', [[key, role_titles[key]] for key in role_titles.keys()],
-                        ['Role ID', 'Title'],
-                        level
-                    )
-                    return md_list
-                else:
-                    logger.warning(
-                        f'No responsible roles were found for the control with id: {control_id} in given SSP.'
-                    )
-                    return ''
+        impl_requirement = self._control_implemented_req(control_id)
+        if impl_requirement:
+            if impl_requirement.responsible_roles:
+                role_ids = []
+                for resp_role in impl_requirement.responsible_roles:
+                    role_ids.append(resp_role.role_id.replace('_', ' '))
+
+                # now check if this role exists in the metadata
+                role_titles = dict(zip(role_ids, role_ids))
+                if self._ssp.metadata.roles:
+                    for role in self._ssp.metadata.roles:
+                        if role.id in role_ids:
+                            role_titles[role.id] = role.title
+
+                # dictionary to md table
+                md_list = self._write_table_with_header(
+                    'Responsible Roles.', [[key, role_titles[key]] for key in role_titles.keys()], ['Role ID', 'Title'],
+                    level
+                )
+                return md_list
+            else:
+                logger.warning(f'No responsible roles were found for the control with id: {control_id} in given SSP.')
+                return ''
 
         return ''
 
@@ -264,12 +269,9 @@ class SSPMarkdownWriter():
                 # look up component title
                 subheader = component.component_uuid
                 response = ''
-                if self._ssp.system_implementation.components:
-                    for comp in self._ssp.system_implementation.components:
-                        if comp.uuid == component.component_uuid:
-                            title = comp.title
-                            if title:
-                                subheader = title
+                comp = self._ssp_index.get_by_uuid(component.component_uuid)
+                if isinstance(comp, ssp.SystemComponent) and comp.title:
+                    subheader = comp.title
                 if component.description:
                     response = component.description
 
@@ -281,10 +283,7 @@ class SSPMarkdownWriter():
 
     def _control_implemented_req(self, control_id: str) -> ssp.ImplementedRequirement:
         """Retrieve control implemented requirement by control-id."""
-        requirements = self._ssp.control_implementation.implemented_requirements
-        for requirement in requirements:
-            if requirement.control_id == control_id:
-                return requirement
+        return self._implemented_reqs.get(control_id, None)
 
     def _write_list_with_header(self, header: str, lines: List[str], level: int) -> str:
         if lines:
@@ -14,14 +14,50 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Trestle Base Model."""
-from typing import Any, Type, TypeVar
+import datetime
+import enum
+from typing import Any, Dict, List, Set, Tuple, Type, TypeVar
 
-from pydantic import BaseModel, ValidationError
+from pydantic import AnyUrl, BaseModel, EmailStr, ValidationError
+from pydantic.datetime_parse import parse_datetime
+from pydantic.fields import ModelField, SHAPE_DICT, SHAPE_LIST, SHAPE_MAPPING, SHAPE_SINGLETON, Undefined
+from pydantic.utils import ROOT_KEY
 
 from trestle.core.err import TrestleError
 
 Model = TypeVar('Model', bound='BaseModel')
 
+# how a value is built by the trusted fast path, decided once per field
+_KIND_RAW = 0
+_KIND_MODEL = 1
+_KIND_DATETIME = 2
+_KIND_ENUM = 3
+_KIND_VALIDATE = 4
+
+_RAW_TYPES = (str, int, float, bool)
+
+_SHARED_DEFAULT_TYPES = (type(None), str, int, float, bool, enum.Enum, tuple, frozenset)
+
+# marks a default that must be copied for each instance
+_COPIED_DEFAULT = object()
+
+
+def _field_kind(field: ModelField) -> int:
+    """Determine how the trusted fast path builds the values of the field."""
+    type_ = field.type_
+    if field.shape not in (SHAPE_SINGLETON, SHAPE_LIST, SHAPE_DICT, SHAPE_MAPPING) or not isinstance(type_, type):
+        return _KIND_VALIDATE if type_ is not Any else _KIND_RAW
+    if issubclass(type_, TrestleBaseModel):
+        return _KIND_MODEL
+    if issubclass(type_, datetime.datetime):
+        return _KIND_DATETIME
+    if issubclass(type_, enum.Enum):
+        return _KIND_ENUM
+    # urls and emails are validated into their own types, so only plain and constrained scalars are kept as is
+    if issubclass(type_, _RAW_TYPES) and not issubclass(type_, (AnyUrl, EmailStr)):
+        return _KIND_RAW
+    return _KIND_VALIDATE
+
 
 class TrestleBaseModel(BaseModel):
     """Trestle Base Model. Serves as wrapper around BaseModel for overriding methods."""
@@ -44,3 +80,116 @@ class TrestleBaseModel(BaseModel):
                 raise TrestleError(f'{message}')
             else:
                 raise
+
+    @classmethod
+    def _get_trusted_fields(cls) -> List[Tuple[str, str, ModelField, int, Any]]:
+        """Get the name, alias, field, kind and default of each field, computed once per class."""
+        trusted_fields = cls.__dict__.get('_trusted_fields_', None)
+        if trusted_fields is None:
+            trusted_fields = []
+            for name, field in cls.__fields__.items():
+                # immutable defaults are shared rather than copied for every instance, as get_default would do
+                default = field.default
+                if field.required:
+                    default = Undefined
+                elif field.default_factory is not None or not isinstance(default, _SHARED_DEFAULT_TYPES):
+                    default = _COPIED_DEFAULT
+                trusted_fields.append((name, field.alias, field, _field_kind(field), default))
+            # set on the class itself so subclasses do not share the entry
+            type.__setattr__(cls, '_trusted_fields_', trusted_fields)
+        return trusted_fields
+
+    @classmethod
+    def _construct_item(cls, field: ModelField, kind: int, value: Any) -> Any:
+        """Build a single item of a field without validating it, except for types needing conversion."""
+        if kind == _KIND_RAW or value is None:
+            return value
+        if kind == _KIND_MODEL:
+            return value if isinstance(value, field.type_) else field.type_.parse_obj_trusted(value)
+        if kind == _KIND_DATETIME:
+            return value if isinstance(value, datetime.datetime) else parse_datetime(value)
+        if kind == _KIND_ENUM:
+            return field.type_(value)
+        validated, errors = field.validate(value, {}, loc=field.alias, cls=cls)
+        if errors:
+            raise ValidationError([errors], cls)
+        return validated
+
+    @classmethod
+    def _construct_value(cls, field: ModelField, kind: int, value: Any) -> Any:
+        """Build the value of a field according to its shape."""
+        if kind == _KIND_VALIDATE or value is None:
+            return cls._construct_item(field, kind, value)
+        if field.shape == SHAPE_LIST:
+            if kind == _KIND_RAW:
+                return list(value)
+            return [cls._construct_item(field, kind, item) for item in value]
+        if field.shape in (SHAPE_DICT, SHAPE_MAPPING):
+            return {key: cls._construct_item(field, kind, item) for key, item in value.items()}
+        return cls._construct_item(field, kind, value)
+
+    @classmethod
+    def parse_obj_trusted(cls: Type['Model'], obj: Any) -> 'Model':
+        """
+        Build the model from trusted content without validating it.
+
+        The model and all its sub-models are created with construct, so only content already known to be valid,
+        such as files written by trestle, should be loaded this way.  Dates, enums, urls and emails are still
+        converted to the types full validation would give them, so the result matches parse_obj.
+
+        Args:
+            obj: The dict of the model keyed by alias, or the root value for models with a custom root type.
+        Returns:
+            The model built from the content.
+        """
+        trusted_fields = cls._get_trusted_fields()
+        if cls.__custom_root_type__:
+            obj = {ROOT_KEY: obj}
+        elif not isinstance(obj, dict):
+            raise TrestleError(f'Unable to build {cls.__name__} from {type(obj).__name__}')
+        # set the values and fields set directly as construct does, filling in the defaults in the same pass
+        values: Dict[str, Any] = {}
+        fields_set: Set[str] = set()
+        for name, alias, field, kind, default in trusted_fields:
+            if alias in obj:
+                value = obj[alias]
+            elif name in obj:
+                value = obj[name]
+            else:
+                if default is _COPIED_DEFAULT:
+                    values[name] = field.get_default()
+                elif default is not Undefined:
+                    values[name] = default
+                continue
+            values[name] = cls._construct_value(field, kind, value)
+            fields_set.add(name)
+        model = cls.__new__(cls)
+        object.__setattr__(model, '__dict__', values)
+        object.__setattr__(model, '__fields_set__', fields_set)
+        if cls.__private_attributes__:
+            model._init_private_attributes()
+        return model
+
+    @classmethod
+    def parse_field_value(cls, name: str, value: Any, trusted: bool = False, item: bool = False) -> Any:
+        """
+        Parse the value of a single field without building the rest of the model.
+
+        Args:
+            name: The name of the field.
+            value: The raw value of the field, or of a single item of it if the field is a list.
+            trusted: True to build the value without validation as parse_obj_trusted does.
+            item: True if the value is a single item of a list field.
+        Returns:
+            The value as it would be set in the model.
+        """
+        field = cls.__fields__[name]
+        kind = _field_kind(field)
+        if trusted and kind != _KIND_VALIDATE:
+            return cls._construct_item(field, kind, value) if item else cls._construct_value(field, kind, value)
+        if item:
+            field = field.sub_fields[0]
+        validated, errors = field.validate(value, {}, loc=field.alias, cls=cls)
+        if errors:
+            raise ValidationError([errors], cls)
+        return validated
@@ -0,0 +1,132 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2021 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Manifest of model file hashes and validation results used to skip validation of unchanged models."""
+
+import json
+import logging
+import pathlib
+import subprocess
+from typing import Any, Dict, List, Set
+
+import trestle
+import trestle.core.const as const
+from trestle.core.err import TrestleError
+from trestle.utils import fs
+
+logger = logging.getLogger(__name__)
+
+
+class ValidationManifest():
+    """
+    Record the content hashes of the files in each model along with the result of its last validation.
+
+    A model whose files are unchanged since it last passed validation does not need to be loaded and validated again.
+    The size and modification time of each file are kept with its hash so unchanged files are not read again.
+    The manifest is discarded if it was written by a different version of trestle.
+    """
+
+    def __init__(self, trestle_root: pathlib.Path) -> None:
+        """
+        Initialize the manifest, loading the saved one if present.
+
+        Args:
+            trestle_root: root directory of the trestle project
+        """
+        self._trestle_root = trestle_root.resolve()
+        self._manifest_path = self._trestle_root / const.TRESTLE_VALIDATION_MANIFEST
+        self._models: Dict[str, Dict[str, Any]] = {}
+        if self._manifest_path.exists():
+            try:
+                manifest = json.loads(self._manifest_path.read_text(encoding=const.FILE_ENCODING))
+                if manifest.get('trestle_version', None) == trestle.__version__:
+                    self._models = manifest.get('models', {})
+            except Exception as e:
+                logger.debug(f'ignoring unreadable validation manifest {self._manifest_path}: {e}')
+
+    def _model_key(self, model_path: pathlib.Path) -> str:
+        model_dir = model_path if model_path.is_dir() else model_path.parent
+        return model_dir.resolve().relative_to(self._trestle_root).as_posix()
+
+    def _file_hashes(self, model_key: str) -> Dict[str, List[Any]]:
+        """Get the size, modification time and content hash of every file in the model directory."""
+        old_files = self._models.get(model_key, {}).get('files', {})
+        files: Dict[str, List[Any]] = {}
+        for file_path in sorted((self._trestle_root / model_key).rglob('*')):
+            if not file_path.is_file():
+                continue
+            file_key = file_path.relative_to(self._trestle_root).as_posix()
+            stat = file_path.stat()
+            old_file = old_files.get(file_key, None)
+            if old_file is not None and old_file[0] == stat.st_size and old_file[1] == stat.st_mtime_ns:
+                files[file_key] = old_file
+            else:
+                files[file_key] = [stat.st_size, stat.st_mtime_ns, fs.get_file_hash(file_path)]
+        return files
+
+    def is_unchanged_and_valid(self, model_path: pathlib.Path) -> bool:
+        """Determine if the model passed its last validation and none of its files have changed since."""
+        model_key = self._model_key(model_path)
+        entry = self._models.get(model_key, None)
+        if entry is None or not entry['valid']:
+            return False
+        new_files = self._file_hashes(model_key)
+        old_hashes = {key: value[2] for key, value in entry['files'].items()}
+        if old_hashes != {key: value[2] for key, value in new_files.items()}:
+            return False
+        # keep any refreshed modification times so the files are not hashed again next time
+        entry['files'] = new_files
+        return True
+
+    def record(self, model_path: pathlib.Path, valid: bool, msg: str) -> None:
+        """Record the validation result for the model along with the current hashes of its files."""
+        model_key = self._model_key(model_path)
+        self._models[model_key] = {'valid': valid, 'msg': msg, 'files': self._file_hashes(model_key)}
+
+    def save(self) -> None:
+        """Save the manifest in the trestle cache directory."""
+        self._manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest = {'trestle_version': trestle.__version__, 'models': self._models}
+        self._manifest_path.write_text(json.dumps(manifest, indent=1), encoding=const.FILE_ENCODING)
+
+
+def get_changed_files(trestle_root: pathlib.Path, git_ref: str) -> Set[pathlib.Path]:
+    """
+    Get the files in the trestle project that differ between the working tree and a git reference.
+
+    Untracked files that are not ignored are included.
+
+    Args:
+        trestle_root: root directory of the trestle project, which must be within a git working tree
+        git_ref: the git reference to compare with, such as a branch, tag or commit
+
+    Returns:
+        The absolute paths of the changed files.
+    """
+    commands = [
+        ['git', 'diff', '--name-only', '--relative', git_ref, '--'],
+        ['git', 'ls-files', '--others', '--exclude-standard']
+    ]
+    changed_files: Set[pathlib.Path] = set()
+    for command in commands:
+        try:
+            result = subprocess.run(command, cwd=trestle_root, capture_output=True, text=True, check=True)
+        except (OSError, subprocess.CalledProcessError) as e:
+            stderr = getattr(e, 'stderr', None) or ''
+            raise TrestleError(f'Unable to get files changed since {git_ref}: {e} {stderr.strip()}')
+        for line in result.stdout.splitlines():
+            if line:
+                changed_files.add((trestle_root / line).resolve())
+    return changed_files
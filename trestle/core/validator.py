@@ -16,13 +16,20 @@
 
 import argparse
 import logging
+import pathlib
+import timeit
 from abc import ABC, abstractmethod
-from typing import TypeVar
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, List, Optional, Tuple, TypeVar
 
+import pydantic
+
+from trestle.core import validator_helper
 from trestle.core.base_model import OscalBaseModel
 from trestle.core.commands.common.return_codes import CmdReturnCodes
 from trestle.core.err import TrestleError
 from trestle.core.models.file_content_type import FileContentType
+from trestle.core.validation_manifest import ValidationManifest, get_changed_files
 from trestle.utils import fs
 from trestle.utils.load_distributed import load_distributed
 
@@ -32,6 +39,57 @@ logger = logging.getLogger(__name__)
 TG = TypeVar('TG')
 
 
+class ModelVisitor(ABC):
+    """
+    Validation rule that inspects the nodes of a model as they are reached in a shared traversal.
+
+    A visitor holds the state of a single traversal, so a fresh one is needed for each model validated.
+    """
+
+    @abstractmethod
+    def visit(self, node: Any, path: str) -> None:
+        """
+        Inspect a node of the model.
+
+        args:
+            node: A pydantic model or dict found in the model.
+            path: The element path of the node, starting with the alias of the model, e.g. catalog.metadata.
+        """
+
+    @abstractmethod
+    def is_valid(self) -> bool:
+        """Return whether the nodes visited passed this rule."""
+
+
+def visit_model(model: Any, visitors: List[ModelVisitor]) -> None:
+    """Traverse the model once and pass each pydantic model and dict in it to every visitor."""
+    for path, node in validator_helper.iter_nodes(model, validator_helper.get_root_path(model)):
+        if isinstance(node, (pydantic.BaseModel, dict)):
+            for visitor in visitors:
+                visitor.visit(node, path)
+
+
+def _validate_model_file(validator: 'Validator', model_path: pathlib.Path,
+                         trestle_root: pathlib.Path) -> Tuple[pathlib.Path, bool, str, float]:
+    """
+    Load and validate a single model, capturing any load error as a failure.
+
+    This is run in worker processes so it must be at module level.
+
+    returns:
+        The model path, whether it is valid, the message describing the result, and the time taken in seconds.
+    """
+    tick = timeit.default_timer()
+    try:
+        _, _, model = load_distributed(model_path, trestle_root)
+        valid = validator.model_is_valid(model)
+        msg = validator.error_msg()
+    except TrestleError as e:
+        valid = False
+        msg = f'File load error {e}'
+    return model_path, valid, msg, timeit.default_timer() - tick
+
+
 class Validator(ABC):
     """Validator base class."""
 
@@ -40,6 +98,23 @@ class Validator(ABC):
         # subclasses can override as needed
         return self.__doc__
 
+    def get_visitor(self) -> Optional[ModelVisitor]:
+        """
+        Get a fresh visitor that performs this validation during a shared traversal of a model.
+
+        Validators that provide a visitor can be run together with others in a single pass over the model.
+
+        returns:
+            The visitor, or None if this validator only supports model_is_valid.
+        """
+        return None
+
+    def _model_is_valid_by_visitor(self, model: OscalBaseModel) -> bool:
+        """Validate the model by walking it with the visitor of this validator alone."""
+        visitor = self.get_visitor()
+        visit_model(model, [visitor])
+        return visitor.is_valid()
+
     @abstractmethod
     def model_is_valid(self, model: OscalBaseModel) -> bool:
         """
@@ -52,6 +127,105 @@ class Validator(ABC):
             Whether or not the model passed this validation test.
         """
 
+    def _select_models(self, model_paths: List[pathlib.Path], trestle_root: pathlib.Path,
+                       args: argparse.Namespace) -> Tuple[List[pathlib.Path], Optional[ValidationManifest]]:
+        """
+        Select the models needing validation based on the incremental options.
+
+        With changed_since only models containing a file changed since the git reference are selected.
+        With incremental the models that passed validation and are unchanged since are skipped.
+
+        returns:
+            The paths of the models to validate, and the manifest to record results in if incremental.
+        """
+        changed_since = args.changed_since if 'changed_since' in args else None
+        if changed_since is not None:
+            changed_files = get_changed_files(trestle_root, changed_since)
+            changed_dirs = {parent for file_path in changed_files for parent in file_path.parents}
+            selected_paths = []
+            for model_path in model_paths:
+                model_dir = model_path if model_path.is_dir() else model_path.parent
+                if model_dir.resolve() in changed_dirs:
+                    selected_paths.append(model_path)
+                else:
+                    logger.info(f'SKIPPED: Model {model_path} has no changes since {changed_since}')
+            model_paths = selected_paths
+        manifest = None
+        if 'incremental' in args and args.incremental:
+            manifest = ValidationManifest(trestle_root)
+            selected_paths = []
+            for model_path in model_paths:
+                if manifest.is_unchanged_and_valid(model_path):
+                    logger.info(f'SKIPPED: Model {model_path} is unchanged since it passed validation')
+                else:
+                    selected_paths.append(model_path)
+            model_paths = selected_paths
+        return model_paths, manifest
+
+    def _validate_all_parallel(
+        self,
+        model_paths: List[pathlib.Path],
+        trestle_root: pathlib.Path,
+        jobs: int,
+        manifest: Optional[ValidationManifest] = None
+    ) -> int:
+        """
+        Load and validate the models in a pool of processes and report the results of all of them.
+
+        Unlike the serial validation this does not stop at the first failure.
+
+        args:
+            model_paths: paths of the models to validate
+            trestle_root: root directory of the trestle project
+            jobs: number of worker processes
+            manifest: manifest to record the results in, if validating incrementally
+
+        returns:
+            Success if every model passed, otherwise the validation error code.
+        """
+        if jobs < 1:
+            raise TrestleError(f'The number of jobs must be at least 1 but {jobs} was given.')
+        results = []
+        if model_paths:
+            with ProcessPoolExecutor(max_workers=min(jobs, len(model_paths))) as executor:
+                results = list(
+                    executor.map(
+                        _validate_model_file, [self] * len(model_paths), model_paths, [trestle_root] * len(model_paths)
+                    )
+                )
+        n_failed = 0
+        for model_path, valid, msg, _ in results:
+            if manifest is not None:
+                manifest.record(model_path, valid, msg)
+            if valid:
+                logger.info(f'VALID: Model {model_path} passed the {msg}')
+            else:
+                n_failed += 1
+                logger.info(f'INVALID: Model {model_path} did not pass the {msg}')
+
+        # summary table with one row per model
+        names = [str(model_path.relative_to(trestle_root)) for model_path, _, _, _ in results]
+        width = max([len(name) for name in names] + [len('Model')])
+        logger.info(f'{"Model":<{width}}  Result   Time (s)')
+        for name, (_, valid, _, duration) in zip(names, results):
+            result = 'VALID' if valid else 'INVALID'
+            logger.info(f'{name:<{width}}  {result:<7}  {duration:8.3f}')
+        logger.info(f'{len(results) - n_failed} of {len(results)} models passed validation.')
+        return CmdReturnCodes.SUCCESS.value if n_failed == 0 else CmdReturnCodes.OSCAL_VALIDATION_ERROR.value
+
+    def _check_model(
+        self, model: OscalBaseModel, model_path: pathlib.Path, manifest: Optional[ValidationManifest] = None
+    ) -> bool:
+        """Validate the loaded model, log the result and record it in the manifest if given."""
+        valid = self.model_is_valid(model)
+        if manifest is not None:
+            manifest.record(model_path, valid, self.error_msg())
+        if valid:
+            logger.info(f'VALID: Model {model_path} passed the {self.error_msg()}')
+        else:
+            logger.info(f'INVALID: Model {model_path} did not pass the {self.error_msg()}')
+        return valid
+
     def validate(self, args: argparse.Namespace) -> int:
         """Perform the validation according to user options."""
         trestle_root = args.trestle_root  # trestle root is set via command line in args. Default is cwd.
@@ -64,40 +238,48 @@ class Validator(ABC):
             else:
                 models = fs.get_models_of_type(args.type, trestle_root)
             models_path = trestle_root / fs.model_type_to_model_dir(args.type)
-            for m in models:
-                model_path = models_path / m
-                try:
-                    _, _, model = load_distributed(model_path, trestle_root)
-                except TrestleError as e:
-                    logger.warning(f'File load error {e}')
-                    return CmdReturnCodes.OSCAL_VALIDATION_ERROR.value
-                if not self.model_is_valid(model):
-                    logger.info(f'INVALID: Model {model_path} did not pass the {self.error_msg()}')
-                    return CmdReturnCodes.OSCAL_VALIDATION_ERROR.value
-                logger.info(f'VALID: Model {model_path} passed the {self.error_msg()}')
+            model_paths, manifest = self._select_models([models_path / m for m in models], trestle_root, args)
+            try:
+                for model_path in model_paths:
+                    try:
+                        _, _, model = load_distributed(model_path, trestle_root)
+                    except TrestleError as e:
+                        logger.warning(f'File load error {e}')
+                        if manifest is not None:
+                            manifest.record(model_path, False, f'File load error {e}')
+                        return CmdReturnCodes.OSCAL_VALIDATION_ERROR.value
+                    if not self._check_model(model, model_path, manifest):
+                        return CmdReturnCodes.OSCAL_VALIDATION_ERROR.value
+            finally:
+                if manifest is not None:
+                    manifest.save()
             return CmdReturnCodes.SUCCESS.value
 
         # validate all
         if 'all' in args and args.all:
-            model_tups = fs.get_all_models(trestle_root)
-            for mt in model_tups:
-
+            model_paths = []
+            for mt in fs.get_all_models(trestle_root):
                 model_dir = trestle_root / fs.model_type_to_model_dir(mt[0]) / mt[1]
                 extension_type = fs.get_contextual_file_type(model_dir)
-                model_path = model_dir / f'{mt[0]}{FileContentType.to_file_extension(extension_type)}'
-                _, _, model = load_distributed(model_path, trestle_root)
-                if not self.model_is_valid(model):
-                    logger.info(f'INVALID: Model {model_path} did not pass the {self.error_msg()}')
-                    return CmdReturnCodes.OSCAL_VALIDATION_ERROR.value
-                logger.info(f'VALID: Model {model_path} passed the {self.error_msg()}')
+                model_paths.append(model_dir / f'{mt[0]}{FileContentType.to_file_extension(extension_type)}')
+            model_paths, manifest = self._select_models(model_paths, trestle_root, args)
+            try:
+                jobs = args.jobs if 'jobs' in args else None
+                if jobs is not None:
+                    return self._validate_all_parallel(model_paths, trestle_root, jobs, manifest)
+                for model_path in model_paths:
+                    _, _, model = load_distributed(model_path, trestle_root)
+                    if not self._check_model(model, model_path, manifest):
+                        return CmdReturnCodes.OSCAL_VALIDATION_ERROR.value
+            finally:
+                if manifest is not None:
+                    manifest.save()
             return CmdReturnCodes.SUCCESS.value
 
         # validate file
         if 'file' in args and args.file:
             file_path = trestle_root / args.file
             _, _, model = load_distributed(file_path, trestle_root)
-            if not self.model_is_valid(model):
-                logger.info(f'INVALID: Model {file_path} did not pass the {self.error_msg()}')
+            if not self._check_model(model, file_path):
                 return CmdReturnCodes.OSCAL_VALIDATION_ERROR.value
-            logger.info(f'VALID: Model {file_path} passed the {self.error_msg()}')
         return CmdReturnCodes.SUCCESS.value
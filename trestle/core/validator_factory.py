@@ -38,3 +38,20 @@ def init_arguments(cmd: Command) -> None:
     group.add_argument('-t', '--type', choices=const.MODEL_TYPE_LIST, help='Validate one or all models of this type.')
     group.add_argument('-a', '--all', action='store_true', help='Validate all models in trestle directory.')
     cmd.add_argument('-n', '--name', help='Name of single model to validate (with --type specified).', required=False)
+    cmd.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        help='Number of processes used to validate models in parallel (with --all specified).',
+        required=False
+    )
+    cmd.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Skip models unchanged since they last passed validation (with --type or --all specified).'
+    )
+    cmd.add_argument(
+        '--changed-since',
+        help='Only validate models with files changed since this git reference (with --type or --all specified).',
+        required=False
+    )
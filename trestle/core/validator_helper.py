@@ -17,10 +17,11 @@
 import logging
 import re
 import uuid
-from typing import Any, Dict, List, Tuple, Type, TypeVar
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Type, TypeVar
 
 import pydantic
 
+from trestle.core import utils
 from trestle.core.common_types import FixedUuidModel
 
 logger = logging.getLogger(__name__)
@@ -29,6 +30,150 @@ logger = logging.getLogger(__name__)
 TG = TypeVar('TG')
 
 
+def _join_path(path: str, name: str) -> str:
+    return f'{path}.{name}' if path else name
+
+
+def get_root_path(object_of_interest: Any) -> str:
+    """Get the element path of the object itself, which is its json alias if it is a pydantic model."""
+    if isinstance(object_of_interest, pydantic.BaseModel):
+        return utils.classname_to_alias(type(object_of_interest).__name__, 'json')
+    return ''
+
+
+def iter_nodes(object_of_interest: Any, root_path: str = '') -> Iterator[Tuple[str, Any]]:
+    """
+    Traverse the object depth first and yield the element path and value of every node in it.
+
+    Pydantic models are followed through the fields that are set, along with lists and dicts.
+    Element paths join the json aliases of fields, the keys of dicts and the indices of lists with '.'.
+    An explicit stack is used so very large or deep models do not build intermediate lists or hit the recursion limit.
+
+    Args:
+        object_of_interest: the pydantic model, list or dict to traverse
+        root_path: element path of the object itself
+
+    Returns:
+        Iterator of tuples of element path and node, starting with the object itself
+    """
+    stack: List[Tuple[str, Any]] = [(root_path, object_of_interest)]
+    while stack:
+        path, node = stack.pop()
+        yield path, node
+        if isinstance(node, pydantic.BaseModel):
+            children = []
+            for field in node.__fields_set__:
+                # the __root__ of a wrapper model does not add to the path
+                name = node.__fields__[field].alias if field in node.__fields__ else field
+                child_path = path if field == '__root__' else _join_path(path, name)
+                children.append((child_path, node.__dict__.get(field, None)))
+        elif type(node) is list:
+            children = [(_join_path(path, str(index)), item) for index, item in enumerate(node)]
+        elif type(node) is dict:
+            children = [(_join_path(path, str(key)), value) for key, value in node.items()]
+        else:
+            continue
+        # push in reverse so children are visited in order
+        for child in reversed(children):
+            if child[1] is not None:
+                stack.append(child)
+
+
+def iter_values_by_name(object_of_interest: Any,
+                        name_of_interest: str,
+                        root_path: str = '') -> Iterator[Tuple[str, Any]]:
+    """
+    Traverse the object and yield the element path and value of every attribute or dict entry with the name.
+
+    Args:
+        object_of_interest: the pydantic model, list or dict to traverse
+        name_of_interest: the field name in models or key in dicts to find
+        root_path: element path of the object itself
+
+    Returns:
+        Iterator of tuples of element path and value
+    """
+    for path, node in iter_nodes(object_of_interest, root_path):
+        if isinstance(node, pydantic.BaseModel):
+            value = getattr(node, name_of_interest, None)
+            if value is not None:
+                field = node.__fields__.get(name_of_interest, None)
+                yield _join_path(path, field.alias if field is not None else name_of_interest), value
+        elif type(node) is dict and name_of_interest in node:
+            yield _join_path(path, name_of_interest), node[name_of_interest]
+
+
+def iter_values_by_type(object_of_interest: Any,
+                        type_of_interest: Type[TG],
+                        root_path: str = '') -> Iterator[Tuple[str, TG]]:
+    """
+    Traverse the object and yield the element path and value of every node of exactly the type.
+
+    Args:
+        object_of_interest: the pydantic model, list or dict to traverse
+        type_of_interest: the type of the values to find
+        root_path: element path of the object itself
+
+    Returns:
+        Iterator of tuples of element path and value
+    """
+    for path, node in iter_nodes(object_of_interest, root_path):
+        if type(node) is type_of_interest:
+            yield path, node
+
+
+def _hashable_key(value: Any) -> Any:
+    """Convert the value to a hashable key such that equal values have equal keys."""
+    if isinstance(value, pydantic.BaseModel):
+        # pydantic models compare equal if their dicts are equal
+        return _hashable_key(value.dict())
+    if isinstance(value, dict):
+        return tuple(sorted(((key, _hashable_key(item)) for key, item in value.items()), key=lambda x: str(x[0])))
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable_key(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_hashable_key(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def find_duplicates(paths_and_values: Iterable[Tuple[str, Any]]) -> List[Tuple[Any, List[str]]]:
+    """
+    Find the values that occur more than once, in linear time by hashing.
+
+    Args:
+        paths_and_values: tuples of element path and value, as from the iter_values functions
+
+    Returns:
+        List of tuples of each duplicated value and the element paths where it occurs
+    """
+    values: Dict[Any, Any] = {}
+    paths: Dict[Any, List[str]] = {}
+    for path, value in paths_and_values:
+        key = _hashable_key(value)
+        if key in paths:
+            paths[key].append(path)
+        else:
+            values[key] = value
+            paths[key] = [path]
+    return [(values[key], key_paths) for key, key_paths in paths.items() if len(key_paths) > 1]
+
+
+def find_duplicate_values_by_name(object_of_interest: Any, name_of_interest: str) -> List[Tuple[Any, List[str]]]:
+    """Find the values of the name that occur more than once, with the element paths where they occur."""
+    root_path = get_root_path(object_of_interest)
+    return find_duplicates(iter_values_by_name(object_of_interest, name_of_interest, root_path))
+
+
+def find_duplicate_values_by_type(object_of_interest: Any, type_of_interest: Type[TG]) -> List[Tuple[TG, List[str]]]:
+    """Find the values of the type that occur more than once, with the element paths where they occur."""
+    root_path = get_root_path(object_of_interest)
+    return find_duplicates(iter_values_by_type(object_of_interest, type_of_interest, root_path))
+
+
 # TODO: Improve typing - this could potentially be done through type vars
 def find_values_by_name_generic(object_of_interest: Any, var_name: str) -> List[str]:
     """Traverse object and return list of the values in dicts, tuples associated with variable name."""
@@ -102,52 +247,23 @@ def find_values_by_type(object_of_interest: Any, type_of_interest: Type[TG]) ->
 
 def has_no_duplicate_values_by_type(object_of_interest: Any, type_of_interest: Type[TG]) -> bool:
     """Determine if duplicate values of type exist in object."""
-    loe = find_values_by_type(object_of_interest, type_of_interest)
-    n = len(loe)
-    if n > 1:
-        for i in range(n - 1):
-            for j in range(i + 1, n):
-                if loe[i] == loe[j]:
-                    return False
-    return True
+    duplicates = find_duplicate_values_by_type(object_of_interest, type_of_interest)
+    for _, paths in duplicates:
+        logger.info(f'Duplicate detected of type {type_of_interest.__name__} at {", ".join(paths)}.')
+    return not duplicates
 
 
 def find_values_by_name(object_of_interest: Any, name_of_interest: str) -> List[Any]:
     """Traverse object and return list of values of specified name."""
-    loe = []
-    if isinstance(object_of_interest, pydantic.BaseModel):
-        value = getattr(object_of_interest, name_of_interest, None)
-        if value is not None:
-            loe.append(value)
-        fields = getattr(object_of_interest, '__fields_set__', None)
-        if fields is not None:
-            for field in fields:
-                loe.extend(find_values_by_name(getattr(object_of_interest, field, None), name_of_interest))
-    elif type(object_of_interest) is list:
-        for item in object_of_interest:
-            loe.extend(find_values_by_name(item, name_of_interest))
-    elif type(object_of_interest) is dict:
-        if name_of_interest in object_of_interest:
-            loe.append(object_of_interest[name_of_interest])
-        for item in object_of_interest.values():
-            loe.extend(find_values_by_name(item, name_of_interest))
-    return loe
+    return [value for _, value in iter_values_by_name(object_of_interest, name_of_interest)]
 
 
 def has_no_duplicate_values_by_name(object_of_interest: Any, name_of_interest: str) -> bool:
     """Determine if duplicate values of type exist in object."""
-    loe = find_values_by_name(object_of_interest, name_of_interest)
-    set_loe = set(loe)
-    if len(loe) == len(set_loe):
-        return True
-    items = {}
-    for item in loe:
-        items[item] = items.get(item, 0) + 1
-    # now print items
-    for item, instances in items.items():
-        if instances > 1:
-            logger.info(f'Duplicate detected of item {item} with {instances} instances.')
-    return False
+    duplicates = find_duplicate_values_by_name(object_of_interest, name_of_interest)
+    for item, paths in duplicates:
+        logger.info(f'Duplicate detected of item {item} with {len(paths)} instances at {", ".join(paths)}.')
+    return not duplicates
 
 
 def find_all_attribs_by_regex(object_of_interest: Any, regex_of_interest: str) -> List[Tuple[str, Any]]:
@@ -0,0 +1,109 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2021 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Optional cache of the parsed content of yaml files, stored as json in the trestle cache directory."""
+
+import hashlib
+import logging
+import os
+import pathlib
+from typing import Any, Callable, Dict, Optional
+
+import orjson
+
+import trestle.core.const as const
+
+logger = logging.getLogger(__name__)
+
+
+def is_enabled() -> bool:
+    """Determine if the cache is enabled by the environment variable."""
+    return os.environ.get(const.TRESTLE_YAML_CACHE_ENV, '').lower() in ['1', 'true', 'yes', 'on']
+
+
+# trestle roots found for directories; directories outside a project are not kept since one may be created later
+_trestle_roots: Dict[str, pathlib.Path] = {}
+
+
+def _find_trestle_root(dir_path: str) -> Optional[pathlib.Path]:
+    """Find the trestle project containing the directory, if any."""
+    trestle_root = _trestle_roots.get(dir_path, None)
+    if trestle_root is not None:
+        return trestle_root
+    path = pathlib.Path(dir_path)
+    for candidate in [path] + list(path.parents):
+        if (candidate / const.TRESTLE_CONFIG_DIR).is_dir():
+            _trestle_roots[dir_path] = candidate
+            return candidate
+    return None
+
+
+def _get_cache_path(abs_path: pathlib.Path) -> Optional[pathlib.Path]:
+    """Get the path of the cache entry for the file, or None if it is not in a trestle project."""
+    trestle_root = _find_trestle_root(str(abs_path.parent))
+    if trestle_root is None or const.TRESTLE_CONFIG_DIR in abs_path.relative_to(trestle_root).parts:
+        return None
+    entry_name = hashlib.sha256(str(abs_path).encode(const.FILE_ENCODING)).hexdigest()
+    return trestle_root / const.TRESTLE_YAML_CACHE_DIR / f'{entry_name}.json'
+
+
+def _reject_non_json(obj: Any) -> Any:
+    """Refuse to cache values such as dates that would not load back as the same type."""
+    raise TypeError(f'Type {type(obj)} is not cached')
+
+
+def load_yaml_file(path: pathlib.Path, loader: Callable[[pathlib.Path], Any]) -> Any:
+    """
+    Load the yaml file with the loader, or from the cache if it is enabled and the file is unchanged.
+
+    Each entry is keyed by the absolute path of the file and holds its size and modification time along with its
+    parsed content, so any change to the file makes the entry stale and it is replaced on the next load.
+    Content with dates or times is never cached, since json would load them back as strings.
+
+    Args:
+        path: The yaml file to load.
+        loader: Function that parses the yaml file.
+
+    Returns:
+        The parsed content of the file.
+    """
+    if not is_enabled():
+        return loader(path)
+    abs_path = path.resolve()
+    cache_path = _get_cache_path(abs_path)
+    if cache_path is None:
+        return loader(path)
+    stat = abs_path.stat()
+    if cache_path.exists():
+        try:
+            size, mtime_ns, content = orjson.loads(cache_path.read_bytes())
+            if size == stat.st_size and mtime_ns == stat.st_mtime_ns:
+                return content
+        except Exception as e:
+            logger.debug(f'ignoring unreadable yaml cache entry {cache_path}: {e}')
+    content = loader(path)
+    try:
+        data = orjson.dumps(
+            [stat.st_size, stat.st_mtime_ns, content], default=_reject_non_json, option=orjson.OPT_PASSTHROUGH_DATETIME
+        )
+    except TypeError as e:
+        logger.debug(f'not caching {path}: {e}')
+        return content
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # write then rename so concurrent readers never see a partial entry
+    tmp_path = cache_path.with_name(f'{cache_path.stem}.{os.getpid()}.tmp')
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, cache_path)
+    return content
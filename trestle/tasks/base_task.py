@@ -15,10 +15,15 @@
 # limitations under the License.
 """Trestle tasks base templating."""
 import configparser
+import itertools
 import logging
+import pathlib
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from enum import Enum
-from typing import Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from trestle.core.err import TrestleError
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +66,162 @@ class TaskBase(ABC):
         """Simulate the task and report task outcome."""
 
 
+def run_in_processes(function: Callable[..., Any], args_list: Sequence[Tuple[Any, ...]],
+                     max_workers: int) -> Iterator[Tuple[int, Any, Optional[BaseException]]]:
+    """
+    Run the function for each of the args in a pool of processes, with at most max_workers calls in flight.
+
+    A further call is only submitted as an earlier one completes, so the work queued never exceeds the workers.
+
+    Args:
+        function: The function to run, which must be picklable, such as a function at module level.
+        args_list: The args of each call.
+        max_workers: The number of processes, which is also the number of calls in flight.
+    Returns:
+        Iterator of the index of the args, the result and the exception of each call in order of completion.
+        The result is None if the call raised an exception, so one failed call does not stop the others.
+    """
+    args_iter = enumerate(args_list)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        in_flight: Dict[Future, int] = {}
+        for index, args in itertools.islice(args_iter, max_workers):
+            in_flight[executor.submit(function, *args)] = index
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = in_flight.pop(future)
+                for next_index, args in itertools.islice(args_iter, 1):
+                    in_flight[executor.submit(function, *args)] = next_index
+                error = future.exception()
+                yield index, None if error is not None else future.result(), error
+
+
+def run_in_order(function: Callable[..., Any],
+                 args_list: Sequence[Tuple[Any, ...]]) -> Iterator[Tuple[int, Any, Optional[BaseException]]]:
+    """
+    Run the function for each of the args in turn, giving the outcome of each call as run_in_processes does.
+
+    Args:
+        function: The function to run.
+        args_list: The args of each call.
+    Returns:
+        Iterator of the index of the args, the result and the exception of each call in order.
+        The result is None if the call raised an exception, so one failed call does not stop the others.
+    """
+    for index, args in enumerate(args_list):
+        try:
+            result = function(*args)
+        except Exception as e:
+            yield index, None, e
+            continue
+        yield index, result, None
+
+
+def transform_file(
+    read_transform: Callable[[pathlib.Path, Dict[str, Any], str], Tuple[Any, List[str]]],
+    ifile: pathlib.Path,
+    ofile: pathlib.Path,
+    modes: Dict[str, Any],
+    timestamp: str,
+    overwrite: bool,
+    simulate: bool
+) -> List[str]:
+    """
+    Transform one input file, writing the OSCAL results unless simulating, and return the analysis.
+
+    Args:
+        read_transform: Function that reads and transforms the input file with the modes and timestamp, giving the
+            results and the analysis; it must be picklable to run in a separate process.
+        ifile: The input file.
+        ofile: The output file.
+        modes: The modes of the transformer.
+        timestamp: The timestamp of the observations.
+        overwrite: Whether an existing output file may be replaced.
+        simulate: Whether to skip writing the output file.
+    Returns:
+        The analysis of the transformation.
+    """
+    results, analysis = read_transform(ifile, modes, timestamp)
+    if not overwrite and ofile.exists():
+        raise TrestleError(f'output: {ofile} already exists')
+    if not simulate:
+        results.oscal_write(ofile)
+    return analysis
+
+
+class TransformFilesMixin():
+    """
+    Mixin for tasks that transform each file of an input directory into an OSCAL output file.
+
+    The task sets _simulate, _verbose and _overwrite before transforming the files.
+    """
+
+    _simulate: bool
+    _verbose: bool
+    _overwrite: bool
+
+    def _transform_files(
+        self,
+        read_transform: Callable[[pathlib.Path, Dict[str, Any], str], Tuple[Any, List[str]]],
+        ifiles: List[pathlib.Path],
+        opth: pathlib.Path,
+        modes: Dict[str, Any],
+        timestamp: str,
+        parallel_files: int
+    ) -> bool:
+        """
+        Transform the input files, in a pool of processes when parallel_files is more than 1.
+
+        Each failed file is reported without stopping the others.
+
+        Returns:
+            True if all the files were transformed.
+        """
+        args_list = [
+            (read_transform, ifile, self._get_ofile(ifile, opth), modes, timestamp, self._overwrite, self._simulate)
+            for ifile in ifiles
+        ]
+        if parallel_files > 1:
+            outcomes = run_in_processes(transform_file, args_list, parallel_files)
+        else:
+            outcomes = run_in_order(transform_file, args_list)
+        failed = False
+        for index, analysis, error in outcomes:
+            ifile, ofile = args_list[index][1:3]
+            self._show_input(ifile)
+            if error is not None:
+                logger.error(f'input: {ifile} failed: {error}')
+                failed = True
+                continue
+            self._show_output(ofile)
+            self._show_analysis(analysis)
+        return not failed
+
+    def _get_ofile(self, ifile: pathlib.Path, opth: pathlib.Path) -> pathlib.Path:
+        """Get the output file for the input file."""
+        oname = ifile.stem + '.oscal' + '.json'
+        return opth / oname
+
+    def _show_input(self, ifile: pathlib.Path) -> None:
+        """Show input."""
+        if not self._simulate:
+            if self._verbose:
+                logger.info(f'input: {ifile}')
+
+    def _show_output(self, ofile: pathlib.Path) -> None:
+        """Show output."""
+        if not self._simulate:
+            if self._verbose:
+                logger.info(f'output: {ofile}')
+
+    def _show_analysis(self, analysis: List[str]) -> None:
+        """Show analysis."""
+        if not self._simulate:
+            if self._verbose:
+                for line in analysis:
+                    logger.info(line)
+
+
 class PassFail(TaskBase):
     """
     Holding pattern template for a task which does nothing and always passes.
@@ -18,17 +18,31 @@ import configparser
 import logging
 import pathlib
 import traceback
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from trestle.core import const
 from trestle.tasks.base_task import TaskBase
 from trestle.tasks.base_task import TaskOutcome
+from trestle.tasks.base_task import TransformFilesMixin
 from trestle.transforms.implementations.osco import OscoTransformer
+from trestle.transforms.results import Results
 
 logger = logging.getLogger(__name__)
 
 
-class OscoToOscal(TaskBase):
+def _read_transform(ifile: pathlib.Path, modes: Dict[str, Any], timestamp: str) -> Tuple[Results, List[str]]:
+    """Read and transform one Osco file, giving the OSCAL results and the analysis."""
+    # the timestamp is set again for when this runs in a separate process
+    OscoTransformer.set_timestamp(timestamp)
+    with open(ifile, encoding=const.FILE_ENCODING) as fp:
+        blob = fp.read()
+    osco_transformer = OscoTransformer()
+    osco_transformer.set_modes(modes)
+    results = osco_transformer.transform(blob)
+    return results, osco_transformer.analysis
+
+
+class OscoToOscal(TransformFilesMixin, TaskBase):
     """
     Task to convert Osco report to OSCAL json.
 
@@ -65,6 +79,10 @@ class OscoToOscal(TaskBase):
             '  output-dir = (required) the path of the output directory comprising synthesized OSCAL .json files.'
         )
         logger.info('  output-overwrite = (optional) true [default] or false; replace existing output when true.')
+        logger.info(
+            '  parallel-files = (optional) the number of input files to transform at a time in separate processes, '
+            + 'default is 1; a failed file is reported without stopping the others.'
+        )
         logger.info(
             '  quiet = (optional) true or false [default]; display file creations and rules analysis when false.'
         )
@@ -137,45 +155,15 @@ class OscoToOscal(TaskBase):
         modes = {
             'checking': self._config.getboolean('checking', False),
         }
+        # config optional parallelism
+        parallel_files = self._config.getint('parallel-files', 1)
         # insure output dir exists
         opth.mkdir(exist_ok=True, parents=True)
         # process
-        for ifile in sorted(ipth.iterdir()):
-            if ifile.suffix not in ['.json', '.jsn', '.yaml', '.yml', '.xml']:
-                continue
-            blob = self._read_file(ifile)
-            osco_transformer = OscoTransformer()
-            osco_transformer.set_modes(modes)
-            results = osco_transformer.transform(blob)
-            oname = ifile.stem + '.oscal' + '.json'
-            ofile = opth / oname
-            if not self._overwrite and pathlib.Path(ofile).exists():
-                logger.error(f'output: {ofile} already exists')
-                return TaskOutcome(mode + 'failure')
-            self._write_file(results, ofile)
-            self._show_analysis(osco_transformer)
+        ifiles = [
+            ifile for ifile in sorted(ipth.iterdir()) if ifile.suffix in ['.json', '.jsn', '.yaml', '.yml', '.xml']
+        ]
+        timestamp = OscoTransformer.get_timestamp()
+        if not self._transform_files(_read_transform, ifiles, opth, modes, timestamp, parallel_files):
+            return TaskOutcome(mode + 'failure')
         return TaskOutcome(mode + 'success')
-
-    def _read_file(self, ifile: str):
-        """Read raw input file."""
-        if not self._simulate:
-            if self._verbose:
-                logger.info(f'input: {ifile}')
-        with open(ifile, encoding=const.FILE_ENCODING) as fp:
-            blob = fp.read()
-        return blob
-
-    def _write_file(self, result: str, ofile: str) -> None:
-        """Write oscal results file."""
-        if not self._simulate:
-            if self._verbose:
-                logger.info(f'output: {ofile}')
-            result.oscal_write(pathlib.Path(ofile))
-
-    def _show_analysis(self, osco_transformer: OscoTransformer) -> None:
-        """Show analysis."""
-        if not self._simulate:
-            if self._verbose:
-                analysis = osco_transformer.analysis
-                for line in analysis:
-                    logger.info(line)
@@ -18,17 +18,34 @@ import configparser
 import logging
 import pathlib
 import traceback
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from trestle.core import const
 from trestle.tasks.base_task import TaskBase
 from trestle.tasks.base_task import TaskOutcome
+from trestle.tasks.base_task import TransformFilesMixin
 from trestle.transforms.implementations.tanium import TaniumTransformer
+from trestle.transforms.results import Results
 
 logger = logging.getLogger(__name__)
 
 
-class TaniumToOscal(TaskBase):
+def _read_transform(ifile: pathlib.Path, modes: Dict[str, Any], timestamp: str) -> Tuple[Results, List[str]]:
+    """Read and transform one Tanium file, giving the OSCAL results and the analysis."""
+    # the timestamp is set again for when this runs in a separate process
+    TaniumTransformer.set_timestamp(timestamp)
+    tanium_transformer = TaniumTransformer()
+    tanium_transformer.set_modes(modes)
+    with open(ifile, 'r', encoding=const.FILE_ENCODING) as fp:
+        if 'chunksize' in modes:
+            # stream the file rather than reading it whole
+            results = tanium_transformer.transform_stream(fp)
+        else:
+            results = tanium_transformer.transform(fp.read())
+    return results, tanium_transformer.analysis
+
+
+class TaniumToOscal(TransformFilesMixin, TaskBase):
     """
     Task to convert Tanium report to OSCAL json.
 
@@ -60,6 +77,10 @@ class TaniumToOscal(TaskBase):
         logger.info('  blocksize = (optional) the desired number Tanuim report input lines to process per CPU.')
         logger.info('  cpus-max  = (optional) the desired maximum number of CPUs to employ, default is 1.')
         logger.info('  cpus-min  = (optional) the desired minimum number of CPUs to employ.')
+        logger.info(
+            '  chunksize = (optional) the number of Tanium rules to read and transform at a time, streaming each input '
+            + 'file rather than reading it whole; default is to read each input file whole.'
+        )
         logger.info(
             '  checking  = (optional) True indicates perform strict checking of OSCAL properties, default is False.'
         )
@@ -68,6 +89,10 @@ class TaniumToOscal(TaskBase):
             '  output-dir = (required) the path of the output directory comprising synthesized OSCAL .json files.'
         )
         logger.info('  output-overwrite = (optional) true [default] or false; replace existing output when true.')
+        logger.info(
+            '  parallel-files = (optional) the number of input files to transform at a time in separate processes, '
+            + 'default is 1; a failed file is reported without stopping the others.'
+        )
         logger.info(
             '  quiet = (optional) true or false [default]; display file creations and rules analysis when false.'
         )
@@ -143,43 +168,17 @@ class TaniumToOscal(TaskBase):
             'cpus_min': self._config.getint('cpus-min', 1),
             'checking': self._config.getboolean('checking', False),
         }
+        # config optional streaming
+        chunksize = self._config.getint('chunksize')
+        if chunksize is not None:
+            modes['chunksize'] = chunksize
+        # config optional parallelism
+        parallel_files = self._config.getint('parallel-files', 1)
         # insure output dir exists
         opth.mkdir(exist_ok=True, parents=True)
         # process
-        for ifile in sorted(ipth.iterdir()):
-            blob = self._read_file(ifile)
-            tanium_transformer = TaniumTransformer()
-            tanium_transformer.set_modes(modes)
-            results = tanium_transformer.transform(blob)
-            oname = ifile.stem + '.oscal' + '.json'
-            ofile = opth / oname
-            if not self._overwrite and pathlib.Path(ofile).exists():
-                logger.error(f'output: {ofile} already exists')
-                return TaskOutcome(mode + 'failure')
-            self._write_file(results, ofile)
-            self._show_analysis(tanium_transformer)
+        ifiles = sorted(ipth.iterdir())
+        timestamp = TaniumTransformer.get_timestamp()
+        if not self._transform_files(_read_transform, ifiles, opth, modes, timestamp, parallel_files):
+            return TaskOutcome(mode + 'failure')
         return TaskOutcome(mode + 'success')
-
-    def _read_file(self, ifile: str):
-        """Read raw input file."""
-        if not self._simulate:
-            if self._verbose:
-                logger.info(f'input: {ifile}')
-        with open(ifile, 'r', encoding=const.FILE_ENCODING) as fp:
-            blob = fp.read()
-        return blob
-
-    def _write_file(self, result: str, ofile: str) -> None:
-        """Write oscal results file."""
-        if not self._simulate:
-            if self._verbose:
-                logger.info(f'output: {ofile}')
-            result.oscal_write(pathlib.Path(ofile))
-
-    def _show_analysis(self, tanium_transformer: TaniumTransformer) -> None:
-        """Show analysis."""
-        if not self._simulate:
-            if self._verbose:
-                analysis = tanium_transformer.analysis
-                for line in analysis:
-                    logger.info(line)
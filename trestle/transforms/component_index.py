@@ -0,0 +1,52 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2021 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Index of the components derived by a results transformer."""
+
+from typing import Dict, Hashable, List, Optional
+
+from trestle.oscal.assessment_results import SystemComponent
+
+
+class ComponentIndex():
+    """
+    Map of the components derived by a transformer by uuid, with an index of their uuids by key.
+
+    The key is whatever identifies equivalent components for the transformer, such as their type and title, so
+    finding the component for a rule is a single lookup rather than a scan of every component derived so far.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._component_map: Dict[str, SystemComponent] = {}
+        self._refs: Dict[Hashable, str] = {}
+
+    def __len__(self) -> int:
+        """Get the number of components."""
+        return len(self._component_map)
+
+    @property
+    def components(self) -> List[SystemComponent]:
+        """Get the components in the order they were added."""
+        return list(self._component_map.values())
+
+    def get_ref(self, key: Hashable) -> Optional[str]:
+        """Get the uuid of the component with the key, or None if there is none."""
+        return self._refs.get(key, None)
+
+    def add(self, key: Hashable, component: SystemComponent) -> None:
+        """Add the component with the key, replacing the index entry of any component already added with the key."""
+        self._component_map[component.uuid] = component
+        self._refs[key] = component.uuid
@@ -16,10 +16,11 @@
 
 import base64
 import bz2
+import io
 import json
 import logging
 import uuid
-from typing import Any, Dict, Iterator, List, ValuesView
+from typing import Any, Dict, Iterator, List, Optional, ValuesView
 from xml.etree.ElementTree import Element  # noqa: S405 - used for typing only
 
 from defusedxml import ElementTree
@@ -36,6 +37,7 @@ from trestle.oscal.assessment_results import Status1
 from trestle.oscal.assessment_results import SystemComponent
 from trestle.oscal.common import ImplementedComponent, InventoryItem, Property, SubjectReference
 from trestle.oscal.profile import Profile
+from trestle.transforms.component_index import ComponentIndex
 from trestle.transforms.results import Results
 from trestle.transforms.transformer_factory import FromOscalTransformer
 from trestle.transforms.transformer_factory import ResultsTransformer
@@ -168,6 +170,21 @@ class RuleUse():
         return rval
 
 
+class _StringReader():
+    """Read a string as a file in slices, since a StringIO would hold a copy of all of it."""
+
+    def __init__(self, text: str) -> None:
+        """Initialize given specified args."""
+        self._text = text
+        self._pos = 0
+
+    def read(self, size: int = -1) -> str:
+        """Read the next slice of the string, or the rest of it if size is negative."""
+        start = self._pos
+        self._pos = len(self._text) if size < 0 else min(start + size, len(self._text))
+        return self._text[start:self._pos]
+
+
 class ComplianceOperatorReport():
     """Represents one report of OSCO data."""
 
@@ -175,60 +192,13 @@ class ComplianceOperatorReport():
         """Initialize given specified args."""
         self.osco_xml = osco_xml
 
-    def _get_version(self, root: Element) -> str:
-        """Extract version from the XML."""
+    def _get_target_type(self, benchmark_href: Optional[str]) -> Optional[str]:
+        """Extract target_type from the benchmark href."""
         value = None
-        for key, val in root.attrib.items():
-            if key == 'version':
-                value = val
-                break
-        return value
-
-    def _get_id(self, root: Element) -> str:
-        """Extract id from the XML."""
-        value = None
-        for key, val in root.attrib.items():
-            if key == 'id':
-                value = val
-                break
-        return value
-
-    def _get_target(self, root: Element) -> str:
-        """Extract target from the XML."""
-        value = None
-        for lev1 in root:
-            tag = _remove_namespace(lev1.tag)
-            if tag == 'target':
-                value = root.find(lev1.tag).text
-                break
-        return value
-
-    def _get_target_type(self, root: Element) -> str:
-        """Extract target_type from the XML."""
-        value = None
-        benchmark_href = self._get_benchmark_href(root)
         if benchmark_href is not None and '-' in benchmark_href:
             value = benchmark_href.split('-')[1]
         return value
 
-    def _get_benchmark(self, root: Element, kw) -> str:
-        """Extract benchmark from the XML."""
-        value = None
-        for lev1 in root:
-            tag = _remove_namespace(lev1.tag)
-            if tag == 'benchmark':
-                value = lev1.get(kw)
-                break
-        return value
-
-    def _get_benchmark_href(self, root: Element) -> str:
-        """Extract benchmark.href from the XML."""
-        return self._get_benchmark(root, 'href')
-
-    def _get_benchmark_id(self, root: Element) -> str:
-        """Extract benchmark.id from the XML."""
-        return self._get_benchmark(root, 'id')
-
     def _get_fact(self, lev1: Element, kw: str) -> str:
         """Extract fact from the XML."""
         value = None
@@ -241,85 +211,78 @@ class ComplianceOperatorReport():
                     break
         return value
 
-    def _get_scanner_name(self, root: Element) -> str:
-        """Extract scanner:name from the XML."""
-        value = None
-        for lev1 in root:
-            tag = _remove_namespace(lev1.tag)
-            if tag == 'target-facts':
-                value = self._get_fact(lev1, 'urn:xccdf:fact:scanner:name')
-                break
-        return value
-
-    def _get_scanner_version(self, root: Element) -> str:
-        """Extract scanner:version from the XML."""
-        value = None
-        for lev1 in root:
-            tag = _remove_namespace(lev1.tag)
-            if tag == 'target-facts':
-                value = self._get_fact(lev1, 'urn:xccdf:fact:scanner:version')
-                break
-        return value
-
-    def _get_host_name(self, root: Element) -> str:
-        """Extract asset:identifier:host_name from the XML."""
-        value = None
-        for lev1 in root:
-            tag = _remove_namespace(lev1.tag)
-            if tag == 'target-facts':
-                value = self._get_fact(lev1, 'urn:xccdf:fact:asset:identifier:host_name')
-                break
-        return value
-
     def _get_result(self, lev1: Element) -> str:
         """Extract result from the XML."""
         value = None
         for lev2 in lev1:
             tag = _remove_namespace(lev2.tag)
             if tag == 'result':
-                value = lev1.find(lev2.tag).text
+                value = lev2.text
                 break
         return value
 
+    def _add_header_facts(self, header: Dict[str, Optional[str]], tag: str, lev1: Element) -> None:
+        """Add the facts held by a header element of the XML."""
+        if tag == 'target':
+            header['target'] = lev1.text
+        elif tag == 'benchmark':
+            header['benchmark_href'] = lev1.get('href')
+            header['benchmark_id'] = lev1.get('id')
+            header['target_type'] = self._get_target_type(header['benchmark_href'])
+        elif tag == 'target-facts':
+            header['host_name'] = self._get_fact(lev1, 'urn:xccdf:fact:asset:identifier:host_name')
+            header['scanner_name'] = self._get_fact(lev1, 'urn:xccdf:fact:scanner:name')
+            header['scanner_version'] = self._get_fact(lev1, 'urn:xccdf:fact:scanner:version')
+
     def _parse_xml(self) -> Iterator[RuleUse]:
-        """Parse the stringified XML."""
+        """
+        Parse the stringified XML incrementally.
+
+        The header facts precede the rule results in the XML, so each rule result is yielded as soon as it is parsed,
+        and every element directly below the root is freed once processed, so the tree is never held in full.
+        """
         results = self.osco_xml
-        root = ElementTree.fromstring(results, forbid_dtd=True)
-        version = self._get_version(root)
-        id_ = self._get_id(root)
-        target = self._get_target(root)
-        target_type = self._get_target_type(root)
-        host_name = self._get_host_name(root)
-        benchmark_href = self._get_benchmark_href(root)
-        benchmark_id = self._get_benchmark_id(root)
-        scanner_name = self._get_scanner_name(root)
-        scanner_version = self._get_scanner_version(root)
-        for lev1 in root:
-            tag = _remove_namespace(lev1.tag)
+        source = io.BytesIO(results) if isinstance(results, bytes) else _StringReader(results)
+        header: Dict[str, Optional[str]] = {
+            'id_': None,
+            'target': None,
+            'target_type': None,
+            'host_name': None,
+            'benchmark_href': None,
+            'benchmark_id': None,
+            'scanner_name': None,
+            'scanner_version': None,
+            'version': None
+        }
+        # only the first of each header element is used
+        header_tags = {'target', 'benchmark', 'target-facts'}
+        root = None
+        depth = 0
+        for event, elem in ElementTree.iterparse(source, events=('start', 'end'), forbid_dtd=True):
+            if event == 'start':
+                if root is None:
+                    root = elem
+                    header['version'] = root.get('version')
+                    header['id_'] = root.get('id')
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+            tag = _remove_namespace(elem.tag)
             if tag == 'rule-result':
-                idref = lev1.get('idref')
-                time = lev1.get('time')
-                severity = lev1.get('severity')
-                weight = lev1.get('weight')
-                result = self._get_result(lev1)
-                args = {
-                    'id_': id_,
-                    'target': target,
-                    'target_type': target_type,
-                    'host_name': host_name,
-                    'benchmark_href': benchmark_href,
-                    'benchmark_id': benchmark_id,
-                    'scanner_name': scanner_name,
-                    'scanner_version': scanner_version,
-                    'idref': idref,
-                    'version': version,
-                    'time': time,
-                    'result': result,
-                    'severity': severity,
-                    'weight': weight
-                }
-                rule_use = RuleUse(args)
-                yield rule_use
+                args = dict(header)
+                args['idref'] = elem.get('idref')
+                args['time'] = elem.get('time')
+                args['severity'] = elem.get('severity')
+                args['weight'] = elem.get('weight')
+                args['result'] = self._get_result(elem)
+                yield RuleUse(args)
+            elif tag in header_tags:
+                header_tags.remove(tag)
+                self._add_header_facts(header, tag, elem)
+            # the root attributes are already kept, so drop the processed element
+            root.clear()
 
     def rule_use_generator(self) -> Iterator[RuleUse]:
         """Generate RuleUses by way of parsing the embedded XML."""
@@ -335,7 +298,7 @@ class OscalResultsFactory():
         """Initialize."""
         self._timestamp = timestamp
         self._observation_list: List[Observation] = []
-        self._component_map: Dict[str, SystemComponent] = {}
+        self._component_index = ComponentIndex()
         self._inventory_map: Dict[str, InventoryItem] = {}
         self._ns = 'https://ibm.github.io/compliance-trestle/schemas/oscal/ar/osco'
         self._checking = checking
@@ -343,7 +306,7 @@ class OscalResultsFactory():
     @property
     def components(self) -> List[SystemComponent]:
         """OSCAL components."""
-        return list(self._component_map.values())
+        return self._component_index.components
 
     @property
     def control_selections(self) -> List[ControlSelection]:
@@ -406,21 +369,17 @@ class OscalResultsFactory():
         _type = 'Service'
         _title = f'Red Hat OpenShift Kubernetes Service Compliance Operator for {rule_use.target_type}'
         _desc = _title
-        for component in self._component_map.values():
-            if component.type == _type and component.title == _title and component.description == _desc:
-                return
+        # the type, title and description are all determined by the target type
+        if self._component_index.get_ref(rule_use.target_type) is not None:
+            return
         component_ref = str(uuid.uuid4())
         status = Status1(state='operational')
         component = SystemComponent(uuid=component_ref, type=_type, title=_title, description=_desc, status=status)
-        self._component_map[component_ref] = component
+        self._component_index.add(rule_use.target_type, component)
 
     def _get_component_ref(self, rule_use: RuleUse) -> str:
         """Get component reference for specified RuleUse."""
-        uuid = None
-        for component_ref, component in self._component_map.items():
-            if component.title.endswith(rule_use.target_type):
-                uuid = component_ref
-        return uuid
+        return self._component_index.get_ref(rule_use.target_type)
 
     def _inventory_extract(self, rule_use: RuleUse) -> None:
         """Extract inventory from RuleUse."""
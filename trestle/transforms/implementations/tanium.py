@@ -21,7 +21,7 @@ import multiprocessing
 import os
 import traceback
 import uuid
-from typing import Any, Dict, List, Optional, ValuesView
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, ValuesView
 
 from trestle.oscal.assessment_results import ControlSelection
 from trestle.oscal.assessment_results import LocalDefinitions1
@@ -31,6 +31,7 @@ from trestle.oscal.assessment_results import ReviewedControls
 from trestle.oscal.assessment_results import Status1
 from trestle.oscal.assessment_results import SystemComponent
 from trestle.oscal.common import ImplementedComponent, InventoryItem, Property, SubjectReference
+from trestle.transforms.component_index import ComponentIndex
 from trestle.transforms.results import Results
 from trestle.transforms.transformer_factory import ResultsTransformer
 
@@ -64,6 +65,11 @@ class TaniumTransformer(ResultsTransformer):
         """Return cpus_min."""
         return self._modes.get('cpus_min', 1)
 
+    @property
+    def chunksize(self):
+        """Return chunksize."""
+        return self._modes.get('chunksize', 10000)
+
     @property
     def checking(self):
         """Return checking."""
@@ -89,13 +95,35 @@ class TaniumTransformer(ResultsTransformer):
         self._analysis.append(f'transform time: {ts1-ts0}')
         return results
 
+    def transform_stream(self, lines: Iterable[str]) -> Results:
+        """
+        Transform the lines of a Tanium report into a Results, reading and transforming a chunk of rules at a time.
+
+        Only one chunk of RuleUse is held at a time, so the lines may be an open file of any size.
+        """
+        ts0 = datetime.datetime.now()
+        results = Results()
+        ru_factory = RuleUseFactory(self.get_timestamp())
+        tanium_oscal_factory = TaniumOscalFactory(
+            self.get_timestamp(), [], self.blocksize, self.cpus_max, self.cpus_min, self.checking
+        )
+        for ru_chunk in ru_factory.make_chunks(lines, self.chunksize):
+            tanium_oscal_factory.add_rule_uses(ru_chunk)
+        results.__root__.append(tanium_oscal_factory.result)
+        ts1 = datetime.datetime.now()
+        self._analysis = tanium_oscal_factory.analysis
+        self._analysis.append(f'transform time: {ts1-ts0}')
+        return results
+
 
 class RuleUse():
     """Represents one row of Tanium data."""
 
     def __init__(self, tanium_row: Dict[str, Any], comply: Dict[str, str], default_timestamp: str) -> None:
         """Initialize given specified args."""
-        logger.debug(f'tanium-row: {tanium_row}')
+        # the row holds every comply item, so only format it when it will be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f'tanium-row: {tanium_row}')
         try:
             # level 1 keys
             self.computer_name = tanium_row['Computer Name']
@@ -159,10 +187,8 @@ class RuleUseFactory():
             retval.append(rule_use)
         return retval
 
-    def make_list(self, blob: str) -> List[RuleUse]:
-        """Build RuleUse list from input data."""
-        retval = []
-        lines = blob.splitlines()
+    def iter_rule_uses(self, lines: Iterable[str]) -> Iterator[RuleUse]:
+        """Generate RuleUse items from input lines, consuming one line at a time."""
         for line in lines:
             line = line.strip()
             if len(line) > 0:
@@ -170,13 +196,29 @@ class RuleUseFactory():
                 if type(jdata) is list:
                     for item in jdata:
                         logger.debug(f'item: {item}')
-                        retval += self._make_sublist(item)
+                        yield from self._make_sublist(item)
                 else:
                     logger.debug(f'jdata: {jdata}')
-                    retval += self._make_sublist(jdata)
+                    yield from self._make_sublist(jdata)
+
+    def make_list(self, blob: str) -> List[RuleUse]:
+        """Build RuleUse list from input data."""
+        retval = list(self.iter_rule_uses(blob.splitlines()))
         logger.debug(f'ru_list: {len(retval)}')
         return retval
 
+    def make_chunks(self, lines: Iterable[str], chunksize: int) -> Iterator[List[RuleUse]]:
+        """Build RuleUse lists of at most chunksize items from input lines, consuming the lines as needed."""
+        chunksize = max(chunksize, 1)
+        chunk = []
+        for rule_use in self.iter_rule_uses(lines):
+            chunk.append(rule_use)
+            if len(chunk) == chunksize:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
 
 def _uuid() -> str:
     """Create uuid."""
@@ -203,6 +245,75 @@ def _uuid_result() -> str:
     return _uuid()
 
 
+class ObservationRow(NamedTuple):
+    """Fields of a RuleUse needed for its observation, compact to send to a batch worker."""
+
+    rule_id: str
+    collected: str
+    inventory_ref: str
+    check_id: str
+    check_id_benchmark: str
+    check_id_version: str
+    check_id_level: str
+    state: str
+    timestamp: str
+
+
+def _get_observation_properties_checked(row: ObservationRow, ns: str) -> List[Property]:
+    """Get observation properties, with checking."""
+    props = [
+        Property(name='Check_ID', value=row.check_id, ns=ns),
+        Property(name='Check_ID_Benchmark', value=row.check_id_benchmark, ns=ns, class_='scc_predefined_profile'),
+        Property(name='Check_ID_Version', value=row.check_id_version, ns=ns, class_='scc_predefined_profile_version'),
+        Property(name='Check_ID_Level', value=row.check_id_level, ns=ns),
+        Property(name='Rule_ID', value=row.rule_id, ns=ns, class_='scc_goal_description'),
+        Property(name='Rule_ID', value=row.rule_id, ns=ns, class_='scc_check_name_id'),
+        Property(name='State', value=row.state, ns=ns, class_='scc_result'),
+        Property(name='Timestamp', value=row.timestamp, ns=ns, class_='scc_timestamp'),
+    ]
+    return props
+
+
+def _get_observation_properties_unchecked(row: ObservationRow, ns: str) -> List[Property]:
+    """Get observation properties, without checking."""
+    props = [
+        Property.construct(name='Check_ID', value=row.check_id, ns=ns),
+        Property.construct(
+            name='Check_ID_Benchmark', value=row.check_id_benchmark, ns=ns, class_='scc_predefined_profile'
+        ),
+        Property.construct(
+            name='Check_ID_Version', value=row.check_id_version, ns=ns, class_='scc_predefined_profile_version'
+        ),
+        Property.construct(name='Check_ID_Level', value=row.check_id_level, ns=ns),
+        Property.construct(name='Rule_ID', value=row.rule_id, ns=ns, class_='scc_goal_description'),
+        Property.construct(name='Rule_ID', value=row.rule_id, ns=ns, class_='scc_check_name_id'),
+        Property.construct(name='State', value=row.state, ns=ns, class_='scc_result'),
+        Property.construct(name='Timestamp', value=row.timestamp, ns=ns, class_='scc_timestamp'),
+    ]
+    return props
+
+
+def _make_observation(row: ObservationRow, ns: str, checking: bool) -> Observation:
+    """Make the observation for one row."""
+    observation = Observation(
+        uuid=_uuid_observation(), description=row.rule_id, methods=['TEST-AUTOMATED'], collected=row.collected
+    )
+    subject_reference = SubjectReference(subject_uuid=row.inventory_ref, type='inventory-item')
+    observation.subjects = [subject_reference]
+    if checking:
+        observation.props = _get_observation_properties_checked(row, ns)
+    else:
+        observation.props = _get_observation_properties_unchecked(row, ns)
+    return observation
+
+
+# parallel process to process one shard of entire data set
+def _batch_observations(rows: List[ObservationRow], ns: str, checking: bool) -> List[Observation]:
+    """Make the observations for a shard of rows."""
+    logger.debug(f'shard: {len(rows)}')
+    return [_make_observation(row, ns, checking) for row in rows]
+
+
 class TaniumOscalFactory():
     """Build Tanium OSCAL entities."""
 
@@ -218,13 +329,14 @@ class TaniumOscalFactory():
         """Initialize given specified args."""
         self._rule_use_list = rule_use_list
         self._timestamp = timestamp
-        self._component_map = {}
+        self._component_index = ComponentIndex()
         self._inventory_map = {}
         self._observation_list = []
         self._ns = 'https://ibm.github.io/compliance-trestle/schemas/oscal/ar/tanium'
         self._cpus = None
         self._checking = checking
         self._result = None
+        self._streaming = False
         # blocksize: default, min
         self._blocksize = blocksize
         if self._blocksize < 1:
@@ -239,58 +351,52 @@ class TaniumOscalFactory():
         if self._cpus_min < 1:
             self._cpus_min = 1
 
-    def _is_duplicate_component(self, rule_use: RuleUse) -> bool:
-        """Check for duplicate component."""
-        retval = False
-        component_type = rule_use.component_type
-        component_title = rule_use.component
-        for component in self._component_map.values():
-            if component.type != component_type:
-                continue
-            if component.title != component_title:
-                continue
-            retval = True
-            break
-        return retval
+    def _get_component_key(self, rule_use: RuleUse) -> Tuple[str, str]:
+        """Get the key identifying the component of the specified rule use."""
+        return rule_use.component_type, rule_use.component
 
     def _derive_components(self) -> Dict[str, ValuesView[InventoryItem]]:
         """Derive components from RuleUse list."""
-        self._component_map = {}
+        self._component_index = ComponentIndex()
+        self._add_components()
+
+    def _make_component(self, rule_use: RuleUse) -> SystemComponent:
+        """Make the component for specified rule use."""
+        component_type = rule_use.component_type
+        component_title = rule_use.component
+        # See Note in _get_component_ref.
+        component_description = rule_use.component
+        component_ref = _uuid_component()
+        status = Status1(state='operational')
+        component = SystemComponent(
+            uuid=component_ref,
+            type=component_type,
+            title=component_title,
+            description=component_description,
+            status=status
+        )
+        return component
+
+    def _add_components(self) -> None:
+        """Add components not yet present from RuleUse list."""
         for rule_use in self._rule_use_list:
-            if self._is_duplicate_component(rule_use):
-                continue
-            component_type = rule_use.component_type
-            component_title = rule_use.component
-            # See Note in _get_component_ref.
-            component_description = rule_use.component
-            component_ref = _uuid_component()
-            status = Status1(state='operational')
-            component = SystemComponent(
-                uuid=component_ref,
-                type=component_type,
-                title=component_title,
-                description=component_description,
-                status=status
-            )
-            self._component_map[component_ref] = component
+            component_key = self._get_component_key(rule_use)
+            if self._component_index.get_ref(component_key) is None:
+                self._component_index.add(component_key, self._make_component(rule_use))
 
     def _get_component_ref(self, rule_use: RuleUse) -> Optional[str]:
         """Get component reference for specified rule use."""
-        uuid = None
-        for component_ref, component in self._component_map.items():
-            if component.type != rule_use.component_type:
-                continue
-            if component.title != rule_use.component:
-                continue
-            # Note: currently title and description are the same,
-            # therefore checking description is not necessary.
-            uuid = component_ref
-            break
-        return uuid
+        # Note: currently title and description are the same,
+        # therefore checking description is not necessary.
+        return self._component_index.get_ref(self._get_component_key(rule_use))
 
     def _derive_inventory(self) -> Dict[str, InventoryItem]:
         """Derive inventory from RuleUse list."""
         self._inventory_map = {}
+        self._add_inventory()
+
+    def _add_inventory(self) -> None:
+        """Add inventory not yet present from RuleUse list."""
         if self._checking:
             self._derive_inventory_checked()
         else:
@@ -298,7 +404,6 @@ class TaniumOscalFactory():
 
     def _derive_inventory_checked(self) -> Dict[str, InventoryItem]:
         """Derive inventory from RuleUse list, properties checked."""
-        self._inventory_map = {}
         for rule_use in self._rule_use_list:
             if rule_use.tanium_client_ip_address in self._inventory_map:
                 continue
@@ -321,7 +426,6 @@ class TaniumOscalFactory():
 
     def _derive_inventory_unchecked(self) -> Dict[str, InventoryItem]:
         """Derive inventory from RuleUse list, properties unchecked."""
-        self._inventory_map = {}
         for rule_use in self._rule_use_list:
             if rule_use.tanium_client_ip_address in self._inventory_map:
                 continue
@@ -346,85 +450,19 @@ class TaniumOscalFactory():
         """Get inventory reference for specified rule use."""
         return self._inventory_map[rule_use.tanium_client_ip_address].uuid
 
-    def _get_observtion_properties(self, rule_use):
-        """Get observation properties."""
-        if self._checking:
-            return self._get_observtion_properties_checked(rule_use)
-        else:
-            return self._get_observtion_properties_unchecked(rule_use)
-
-    def _get_observtion_properties_checked(self, rule_use):
-        """Get observation properties, with checking."""
-        props = [
-            Property(name='Check_ID', value=rule_use.check_id, ns=self._ns),
-            Property(
-                name='Check_ID_Benchmark',
-                value=rule_use.check_id_benchmark,
-                ns=self._ns,
-                class_='scc_predefined_profile'
-            ),
-            Property(
-                name='Check_ID_Version',
-                value=rule_use.check_id_version,
-                ns=self._ns,
-                class_='scc_predefined_profile_version'
-            ),
-            Property(name='Check_ID_Level', value=rule_use.check_id_level, ns=self._ns),
-            Property(name='Rule_ID', value=rule_use.rule_id, ns=self._ns, class_='scc_goal_description'),
-            Property(name='Rule_ID', value=rule_use.rule_id, ns=self._ns, class_='scc_check_name_id'),
-            Property(name='State', value=rule_use.state, ns=self._ns, class_='scc_result'),
-            Property(name='Timestamp', value=rule_use.timestamp, ns=self._ns, class_='scc_timestamp'),
-        ]
-        return props
-
-    def _get_observtion_properties_unchecked(self, rule_use):
-        """Get observation properties, without checking."""
-        props = [
-            Property.construct(name='Check_ID', value=rule_use.check_id, ns=self._ns),
-            Property.construct(
-                name='Check_ID_Benchmark',
-                value=rule_use.check_id_benchmark,
-                ns=self._ns,
-                class_='scc_predefined_profile'
-            ),
-            Property.construct(
-                name='Check_ID_Version',
-                value=rule_use.check_id_version,
-                ns=self._ns,
-                class_='scc_predefined_profile_version'
-            ),
-            Property.construct(name='Check_ID_Level', value=rule_use.check_id_level, ns=self._ns),
-            Property.construct(name='Rule_ID', value=rule_use.rule_id, ns=self._ns, class_='scc_goal_description'),
-            Property.construct(name='Rule_ID', value=rule_use.rule_id, ns=self._ns, class_='scc_check_name_id'),
-            Property.construct(name='State', value=rule_use.state, ns=self._ns, class_='scc_result'),
-            Property.construct(name='Timestamp', value=rule_use.timestamp, ns=self._ns, class_='scc_timestamp'),
-        ]
-        return props
-
-    # parallel process to process one chuck of entire data set
-    def _batch_observations(self, index: int):
-        """Derive batch of observations from RuleUse list."""
-        observation_partial_list = []
-        # determine which chunk to process
-        batch_size = (len(self._rule_use_list) // self._batch_workers) + 1
-        start = index * batch_size
-        end = (index + 1) * batch_size
-        end = min(end, len(self._rule_use_list))
-        logger.debug(f'start: {start} end: {end-1}')
-        # process just the one chunk
-        for i in range(start, end):
-            rule_use = self._rule_use_list[i]
-            observation = Observation(
-                uuid=_uuid_observation(),
-                description=rule_use.rule_id,
-                methods=['TEST-AUTOMATED'],
-                collected=rule_use.collected
-            )
-            subject_reference = SubjectReference(subject_uuid=self._get_inventory_ref(rule_use), type='inventory-item')
-            observation.subjects = [subject_reference]
-            observation.props = self._get_observtion_properties(rule_use)
-            observation_partial_list.append(observation)
-        return observation_partial_list
+    def _get_observation_row(self, rule_use: RuleUse) -> ObservationRow:
+        """Get the compact row of the fields of the rule use needed for its observation."""
+        return ObservationRow(
+            rule_use.rule_id,
+            rule_use.collected,
+            self._get_inventory_ref(rule_use),
+            rule_use.check_id,
+            rule_use.check_id_benchmark,
+            rule_use.check_id_version,
+            rule_use.check_id_level,
+            rule_use.state,
+            rule_use.timestamp
+        )
 
     @property
     def _batch_workers(self) -> int:
@@ -438,21 +476,44 @@ class TaniumOscalFactory():
     def _derive_observations(self) -> List[Observation]:
         """Derive observations from RuleUse list."""
         self._observation_list = []
+        self._add_observations()
+
+    def _add_observations(self) -> None:
+        """Add observations from RuleUse list."""
+        rows = [self._get_observation_row(rule_use) for rule_use in self._rule_use_list]
         if self._batch_workers == 1:
             # no need for multiprocessing
-            self._observation_list = self._batch_observations(0)
+            self._observation_list += _batch_observations(rows, self._ns, self._checking)
         else:
-            # use multiprocessing to perform observations creation in parallel
-            pool = multiprocessing.Pool(processes=self._batch_workers)
-            rval_list = pool.map(self._batch_observations, range(self._batch_workers))
+            # use multiprocessing to perform observations creation in parallel, each worker given just its shard
+            batch_size = (len(rows) // self._batch_workers) + 1
+            shards = [(rows[i:i + batch_size], self._ns, self._checking) for i in range(0, len(rows), batch_size)]
+            with multiprocessing.Pool(processes=self._batch_workers) as pool:
+                rval_list = pool.starmap(_batch_observations, shards)
             # gather observations from the sundry batch workers
             for observations_partial_list in rval_list:
                 self._observation_list += observations_partial_list
 
+    def add_rule_uses(self, rule_use_list: List[RuleUse]) -> None:
+        """
+        Derive the OSCAL entities for one more chunk of RuleUse, adding to those derived so far.
+
+        The chunk is not kept once its components, inventory and observations have been derived.
+        Once a chunk is added the result comprises the chunks added, rather than the RuleUse list given at creation.
+        """
+        self._streaming = True
+        self._rule_use_list = rule_use_list
+        # workers are estimated for each chunk
+        self._cpus = None
+        self._add_components()
+        self._add_inventory()
+        self._add_observations()
+        self._rule_use_list = []
+
     @property
     def components(self) -> List[SystemComponent]:
         """OSCAL components."""
-        return list(self._component_map.values())
+        return self._component_index.components
 
     @property
     def inventory(self) -> ValuesView[InventoryItem]:
@@ -498,9 +559,10 @@ class TaniumOscalFactory():
     def result(self) -> Result:
         """OSCAL result."""
         if self._result is None:
-            self._derive_components()
-            self._derive_inventory()
-            self._derive_observations()
+            if not self._streaming:
+                self._derive_components()
+                self._derive_inventory()
+                self._derive_observations()
             self._result = Result(
                 uuid=_uuid_result(),
                 title='Tanium',
@@ -15,20 +15,16 @@
 # limitations under the License.
 """Common file system utilities."""
 
-import json
+import hashlib
 import logging
 import os
 import pathlib
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union, cast
-
-from pydantic import create_model
-
-from ruamel.yaml import YAML
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 from trestle.core import const
 from trestle.core import err
 from trestle.core import utils
-from trestle.core.base_model import OscalBaseModel
+from trestle.core.base_model import OscalBaseModel, get_collection_wrapper_type, json_load, yaml_load
 from trestle.core.common_types import TopLevelOscalModel
 from trestle.core.err import TrestleError
 from trestle.core.models.file_content_type import FileContentType
@@ -156,9 +152,8 @@ def get_stripped_model_type(
         malias = model_alias.split('.')[-1]
         class_name = utils.alias_to_classname(malias, 'json')
         logger.debug(f'collection field type class name {class_name} and alias {malias}')
-        model_type = create_model(class_name, __base__=OscalBaseModel, __root__=(singular_model_type, ...))
-        logger.debug(f'model_type created: {model_type}')
-        model_type = cast(Type[OscalBaseModel], model_type)
+        model_type = get_collection_wrapper_type(class_name, singular_model_type)
+        logger.debug(f'model_type: {model_type}')
         return model_type, model_alias
 
     malias = model_alias.split('.')[-1]
@@ -228,12 +223,19 @@ def load_file(file_path: pathlib.Path) -> Dict[str, Any]:
     if a OSCAL object type is unknown but the context a user is in.
     """
     content_type = FileContentType.to_content_type(file_path.suffix)
-    with file_path.open('r', encoding=const.FILE_ENCODING) as f:
-        if content_type == FileContentType.YAML:
-            yaml = YAML(typ='safe')
-            return yaml.load(f)
-        if content_type == FileContentType.JSON:
-            return json.load(f)
+    if content_type == FileContentType.YAML:
+        return yaml_load(file_path)
+    if content_type == FileContentType.JSON:
+        return json_load(file_path)
+
+
+def get_file_hash(file_path: pathlib.Path) -> str:
+    """Get the sha256 hash of the file content, reading it in chunks."""
+    hasher = hashlib.sha256()
+    with file_path.open('rb') as f:
+        for chunk in iter(lambda: f.read(const.HASH_CHUNK_SIZE), b''):
+            hasher.update(chunk)
+    return hasher.hexdigest()
 
 
 def get_singular_alias(alias_path: str, relative_path: Optional[pathlib.Path] = None) -> str:
@@ -15,26 +15,152 @@
 # limitations under the License.
 """Module to load distributed model."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Set, Tuple, Type, Union
 
+import orjson
+
+from trestle.core import const
 from trestle.core.base_model import OscalBaseModel
-from trestle.core.err import TrestleNotFoundError
+from trestle.core.err import TrestleError, TrestleNotFoundError
 from trestle.core.models.file_content_type import FileContentType
 from trestle.utils import fs
 
 
-def _load_list(abs_path: Path, abs_trestle_root: Path) -> Tuple[Type[OscalBaseModel], str, List[OscalBaseModel]]:
+class _LoadPlan():
+    """
+    Plan for loading a decomposed model, gathered before the model is assembled.
+
+    The decomposed directory tree is scanned once, the files in it are read in parallel, and the stripped model types
+    of sibling files with the same alias and decomposition are computed once and shared.
+    """
+
+    def __init__(self, abs_trestle_root: Path) -> None:
+        """Initialize an empty plan."""
+        self._abs_trestle_root = abs_trestle_root
+        # paths are keyed by string since hashing Path objects is slow for thousands of files
+        self._listings: Dict[str, List[Path]] = {}
+        self._files: Set[str] = set()
+        self._raw: Dict[str, Tuple[Optional[Dict[str, Any]], Optional[TrestleError]]] = {}
+        self._stripped_types: Dict[Tuple[Any, ...], Tuple[Type[OscalBaseModel], str]] = {}
+
+    def scan(self, abs_dir: Path) -> None:
+        """Record the visible entries of the directory and of every directory under it."""
+        stack = [abs_dir]
+        while stack:
+            dir_path = stack.pop()
+            entries = []
+            with os.scandir(dir_path) as dir_entries:
+                for dir_entry in dir_entries:
+                    path = dir_path / dir_entry.name
+                    if dir_entry.is_dir():
+                        # hidden directories are listed, matching fs.iterdir_without_hidden_files
+                        entries.append(path)
+                        stack.append(path)
+                    elif not fs.is_hidden(path):
+                        entries.append(path)
+                        self._files.add(str(path))
+            self._listings[str(dir_path)] = sorted(entries)
+
+    def read_files(self, extra_files: List[Path]) -> None:
+        """Read the raw content of the readable files found by the scan, and the extra files, in parallel."""
+        paths = [
+            path for path in [Path(file_) for file_ in self._files] + extra_files
+            if FileContentType.is_readable_file(FileContentType.path_to_content_type(path))
+        ]
+        if len(paths) < 2:
+            return
+        # give each thread one chunk of the files to avoid the overhead of a task per small file
+        n_workers = min(const.LOAD_DISTRIBUTED_MAX_WORKERS, len(paths))
+        chunks = [paths[index::n_workers] for index in range(n_workers)]
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            for chunk, results in zip(chunks, executor.map(_read_raw_files, chunks)):
+                for path, result in zip(chunk, results):
+                    self._raw[str(path)] = result
+
+    def exists(self, path: Path) -> bool:
+        """Determine if the path exists, using the scan if it covers the path."""
+        if str(path.parent) in self._listings:
+            path_str = str(path)
+            return path_str in self._files or path_str in self._listings
+        return path.exists()
+
+    def is_dir(self, path: Path) -> bool:
+        """Determine if the path is a directory, using the scan if it covers the path."""
+        if str(path.parent) in self._listings:
+            return str(path) in self._listings
+        return path.is_dir()
+
+    def iterdir(self, dir_path: Path) -> List[Path]:
+        """List the visible entries of the directory in sorted order."""
+        listing = self._listings.get(str(dir_path), None)
+        if listing is not None:
+            return listing
+        return sorted(fs.iterdir_without_hidden_files(dir_path))
+
+    def read(self, model_type: Type[OscalBaseModel], path: Path) -> OscalBaseModel:
+        """Parse the model from the content read in advance, or read it now if it was not."""
+        path_str = str(path)
+        if path_str not in self._raw:
+            return model_type.oscal_read(path)
+        obj, error = self._raw.pop(path_str)
+        if error is not None:
+            raise error
+        return model_type.oscal_parse_raw(obj, path)
+
+    def get_stripped_model_type(
+        self,
+        abs_path: Path,
+        aliases_not_to_be_stripped: Optional[List[str]] = None
+    ) -> Tuple[Type[OscalBaseModel], str]:
+        """Get the stripped model type and alias of the path, sharing the result among equivalent sibling files."""
+        if str(abs_path) not in self._files:
+            return fs.get_stripped_model_type(abs_path, self._abs_trestle_root, aliases_not_to_be_stripped)
+        # the type of a file only depends on its directory, its alias and the aliases split out of it
+        split_listing = self._listings.get(str(abs_path.with_suffix('')), None)
+        split_aliases = None
+        if split_listing is not None:
+            split_aliases = frozenset(fs.extract_alias(path.name) for path in split_listing)
+        key = (
+            str(abs_path.parent),
+            fs.extract_alias(abs_path.name),
+            split_aliases,
+            tuple(aliases_not_to_be_stripped or [])
+        )
+        if key not in self._stripped_types:
+            self._stripped_types[key] = fs.get_stripped_model_type(
+                abs_path, self._abs_trestle_root, aliases_not_to_be_stripped
+            )
+        return self._stripped_types[key]
+
+
+def _read_raw_files(paths: List[Path]) -> List[Tuple[Optional[Dict[str, Any]], Optional[TrestleError]]]:
+    """Read the raw content of the files, deferring any error until the file is actually loaded."""
+    results = []
+    for path in paths:
+        try:
+            results.append((OscalBaseModel.oscal_read_raw(path), None))
+        except TrestleError as e:
+            results.append((None, e))
+    return results
+
+
+def _load_list(abs_path: Path,
+               abs_trestle_root: Path,
+               plan: Optional[_LoadPlan] = None) -> Tuple[Type[OscalBaseModel], str, List[OscalBaseModel]]:
     """Given path to a directory of list(array) models, load the distributed models."""
+    plan = plan if plan is not None else _LoadPlan(abs_trestle_root)
     aliases_not_to_be_stripped = []
     instances_to_be_merged: List[OscalBaseModel] = []
-    collection_model_type, collection_model_alias = fs.get_stripped_model_type(abs_path, abs_trestle_root)
-    for path in sorted(fs.iterdir_without_hidden_files(abs_path)):
+    collection_model_type, collection_model_alias = plan.get_stripped_model_type(abs_path)
+    for path in plan.iterdir(abs_path):
 
         # ASSUMPTION HERE: if it is a directory, there's a file that can not be decomposed further.
-        if path.is_dir():
+        if plan.is_dir(path):
             continue
-        _, model_alias, model_instance = load_distributed(path, abs_trestle_root)
+        _, model_alias, model_instance = _load_distributed(path, abs_trestle_root, None, plan)
 
         instances_to_be_merged.append(model_instance)
         aliases_not_to_be_stripped.append(model_alias.split('.')[-1])
@@ -42,12 +168,15 @@ def _load_list(abs_path: Path, abs_trestle_root: Path) -> Tuple[Type[OscalBaseMo
     return collection_model_type, collection_model_alias, instances_to_be_merged
 
 
-def _load_dict(abs_path: Path, abs_trestle_root: Path) -> Tuple[Type[OscalBaseModel], str, Dict[str, OscalBaseModel]]:
+def _load_dict(abs_path: Path,
+               abs_trestle_root: Path,
+               plan: Optional[_LoadPlan] = None) -> Tuple[Type[OscalBaseModel], str, Dict[str, OscalBaseModel]]:
     """Given path to a directory of additionalProperty(dict) models, load the distributed models."""
+    plan = plan if plan is not None else _LoadPlan(abs_trestle_root)
     model_dict: Dict[str, OscalBaseModel] = {}
-    collection_model_type, collection_model_alias = fs.get_stripped_model_type(abs_path, abs_trestle_root)
-    for path in sorted(fs.iterdir_without_hidden_files(abs_path)):
-        model_type, model_alias, model_instance = load_distributed(path, abs_trestle_root)
+    collection_model_type, collection_model_alias = plan.get_stripped_model_type(abs_path)
+    for path in plan.iterdir(abs_path):
+        model_type, model_alias, model_instance = _load_distributed(path, abs_trestle_root, None, plan)
         field_name = path.parts[-1].split('__')[0].split('.')[0]
         model_dict[field_name] = model_instance
 
@@ -63,6 +192,8 @@ def load_distributed(
     Given path to a model, load the model.
 
     If the model is decomposed/split/distributed,the decomposed models are loaded recursively.
+    The decomposed directory tree is first scanned once and all its files are read in parallel, then the model is
+    assembled from them.
 
     Args:
         abs_path: The path to the file/directory to be loaded.
@@ -76,45 +207,58 @@ def load_distributed(
         and Instance of the Model. If the model is decomposed/split/distributed, the instance of the model contains
         the decomposed models loaded recursively.
     """
+    plan = _LoadPlan(abs_trestle_root)
+    # if trying to load file that does not exist, the decomposed directory is loaded instead
+    decomposed_dir = abs_path if abs_path.is_dir() else abs_path.with_name(abs_path.stem)
+    if decomposed_dir.is_dir():
+        plan.scan(decomposed_dir)
+        plan.read_files([abs_path] if abs_path.is_file() else [])
+    return _load_distributed(abs_path, abs_trestle_root, collection_type, plan)
+
+
+def _load_distributed(
+    abs_path: Path, abs_trestle_root: Path, collection_type: Optional[Type[Any]], plan: _LoadPlan
+) -> Tuple[Type[OscalBaseModel], str, Union[OscalBaseModel, List[OscalBaseModel], Dict[str, OscalBaseModel]]]:
+    """Load the model at the path using the listings and content gathered in the plan."""
     # if trying to load file that does not exist, load path instead
-    if not abs_path.exists():
+    if not plan.exists(abs_path):
         abs_path = abs_path.with_name(abs_path.stem)
 
-    if not abs_path.exists():
+    if not plan.exists(abs_path):
         raise TrestleNotFoundError(f'File {abs_path} not found for load.')
 
     # If the path contains a list type model
     if collection_type is list:
-        return _load_list(abs_path, abs_trestle_root)
+        return _load_list(abs_path, abs_trestle_root, plan)
 
     # If the path contains a dict type model
     if collection_type is dict:
-        return _load_dict(abs_path, abs_trestle_root)
+        return _load_dict(abs_path, abs_trestle_root, plan)
 
     # Get current model
-    primary_model_type, primary_model_alias = fs.get_stripped_model_type(abs_path, abs_trestle_root)
+    primary_model_type, primary_model_alias = plan.get_stripped_model_type(abs_path)
     primary_model_instance: OscalBaseModel = None
 
     # is this an attempt to load an actual json or yaml file?
     content_type = FileContentType.path_to_content_type(abs_path)
     # if file is sought but it doesn't exist, ignore and load as decomposed model
-    if FileContentType.is_readable_file(content_type) and abs_path.exists():
-        primary_model_instance = primary_model_type.oscal_read(abs_path)
+    if FileContentType.is_readable_file(content_type) and plan.exists(abs_path):
+        primary_model_instance = plan.read(primary_model_type, abs_path)
     # Is model decomposed?
     decomposed_dir = abs_path.with_name(abs_path.stem)
 
-    if decomposed_dir.exists():
+    if plan.exists(decomposed_dir):
         aliases_not_to_be_stripped = []
         instances_to_be_merged: List[OscalBaseModel] = []
 
-        for local_path in sorted(fs.iterdir_without_hidden_files(decomposed_dir)):
-            if local_path.is_file():
-                model_type, model_alias, model_instance = load_distributed(local_path, abs_trestle_root)
+        for local_path in plan.iterdir(decomposed_dir):
+            if not plan.is_dir(local_path):
+                model_type, model_alias, model_instance = _load_distributed(local_path, abs_trestle_root, None, plan)
                 aliases_not_to_be_stripped.append(model_alias.split('.')[-1])
                 instances_to_be_merged.append(model_instance)
 
-            elif local_path.is_dir():
-                model_type, model_alias = fs.get_stripped_model_type(local_path, abs_trestle_root)
+            else:
+                model_type, model_alias = plan.get_stripped_model_type(local_path)
                 # Only load the directory if it is a collection model. Otherwise do nothing - it gets loaded when
                 # iterating over the model file
 
@@ -128,16 +272,16 @@ def load_distributed(
                 if model_type.is_collection_container():
                     # This directory is a decomposed List or Dict
                     collection_type = model_type.get_collection_type()
-                    model_type, model_alias, model_instance = load_distributed(local_path, abs_trestle_root,
-                                                                               collection_type)
+                    model_type, model_alias, model_instance = _load_distributed(
+                        local_path, abs_trestle_root, collection_type, plan
+                    )
                     aliases_not_to_be_stripped.append(model_alias.split('.')[-1])
                     instances_to_be_merged.append(model_instance)
         primary_model_dict = {}
         if primary_model_instance is not None:
             primary_model_dict = primary_model_instance.__dict__
 
-        merged_model_type, merged_model_alias = fs.get_stripped_model_type(abs_path, abs_trestle_root,
-                                                                           aliases_not_to_be_stripped)
+        merged_model_type, merged_model_alias = plan.get_stripped_model_type(abs_path, aliases_not_to_be_stripped)
 
         # The following use of top_level is to allow loading of a top level model by name only, e.g. MyCatalog
         # There may be a better overall way to approach this.
@@ -157,3 +301,136 @@ def load_distributed(
         merged_model_instance = merged_model_type(**primary_model_dict)  # type: ignore
         return merged_model_type, merged_model_alias, merged_model_instance
     return primary_model_type, primary_model_alias, primary_model_instance
+
+
+def stream_distributed(
+    abs_path: Path,
+    abs_trestle_root: Path,
+    out_path: Path,
+    wrapper_alias: str,
+    collection_type: Optional[Type[Any]] = None,
+    validate: bool = True
+) -> Type[OscalBaseModel]:
+    """
+    Given path to a model, write the model as a single json file without loading it into memory.
+
+    The json is written incrementally while walking the decomposed directory tree, and the content of each file that
+    is not decomposed further is spliced into the output as is, so only one file is held in memory at a time.
+    The output is written to a temporary file that replaces the output file once it is complete.
+    The structure between the spliced values is written compactly, so the output holds the same model as a file
+    written from the loaded model but is not indented like one.
+
+    Args:
+        abs_path: The path to the file/directory to be loaded.
+        abs_trestle_root: The trestle project root directory.
+        out_path: The path of the json file to write, which may be the file being loaded.
+        wrapper_alias: The top level key wrapping the model in the output.
+        collection_type: The type of collection model, if it is a collection model.
+        validate: Whether to parse the output into the model once written, which does load it into memory.
+
+    Returns:
+        The model type of the output.
+    """
+    plan = _LoadPlan(abs_trestle_root)
+    decomposed_dir = abs_path if abs_path.is_dir() else abs_path.with_name(abs_path.stem)
+    if decomposed_dir.is_dir():
+        plan.scan(decomposed_dir)
+    tmp_path = out_path.with_name(f'.{out_path.stem}.tmp{out_path.suffix}')
+    try:
+        with tmp_path.open('wb') as out:
+            out.write(b'{' + orjson.dumps(wrapper_alias) + b':')
+            model_type, _ = _stream_distributed(abs_path, collection_type, plan, out)
+            out.write(b'}')
+        if validate:
+            obj = OscalBaseModel.oscal_read_raw(tmp_path)
+            try:
+                model_type.parse_obj(obj[wrapper_alias])
+            except Exception as e:
+                raise TrestleError(f'Merged model in {out_path} is not valid: {e}')
+        os.replace(tmp_path, out_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return model_type
+
+
+def _write_raw_value(abs_path: Path, out: BinaryIO) -> None:
+    """Write the json value wrapped by the top level key of the file, splicing the raw bytes of json files."""
+    if FileContentType.path_to_content_type(abs_path) == FileContentType.JSON:
+        data = abs_path.read_bytes().strip()
+        # a model file is an object with a single key, so its value lies between the first colon and the last brace
+        colon = data.find(b':')
+        if not data.startswith(b'{') or not data.endswith(b'}') or colon < 0:
+            raise TrestleError(f'Invalid OSCAL file structure in {abs_path}')
+        out.write(data[colon + 1:-1].strip())
+        return
+    obj = OscalBaseModel.oscal_read_raw(abs_path)
+    if not isinstance(obj, dict) or len(obj) != 1:
+        raise TrestleError(f'Invalid OSCAL file structure in {abs_path}')
+    out.write(orjson.dumps(next(iter(obj.values()))))
+
+
+def _stream_distributed(abs_path: Path, collection_type: Optional[Type[Any]], plan: _LoadPlan,
+                        out: BinaryIO) -> Tuple[Type[OscalBaseModel], str]:
+    """Write the json value of the model at the path, following the same walk as _load_distributed."""
+    if not plan.exists(abs_path):
+        abs_path = abs_path.with_name(abs_path.stem)
+
+    if not plan.exists(abs_path):
+        raise TrestleNotFoundError(f'File {abs_path} not found for load.')
+
+    if collection_type is list or collection_type is dict:
+        model_type, model_alias = plan.get_stripped_model_type(abs_path)
+        out.write(b'[' if collection_type is list else b'{')
+        first = True
+        for path in plan.iterdir(abs_path):
+            if collection_type is list and plan.is_dir(path):
+                continue
+            if not first:
+                out.write(b',')
+            first = False
+            if collection_type is dict:
+                out.write(orjson.dumps(path.parts[-1].split('__')[0].split('.')[0]) + b':')
+            _stream_distributed(path, None, plan, out)
+        out.write(b']' if collection_type is list else b'}')
+        return model_type, model_alias
+
+    content_type = FileContentType.path_to_content_type(abs_path)
+    is_file = FileContentType.is_readable_file(content_type) and plan.exists(abs_path)
+    decomposed_dir = abs_path.with_name(abs_path.stem)
+    if not plan.exists(decomposed_dir):
+        model_type, model_alias = plan.get_stripped_model_type(abs_path)
+        _write_raw_value(abs_path, out)
+        return model_type, model_alias
+
+    # the stripped primary file is small, so it is loaded and its fields are interleaved with the split ones
+    primary_dict: Dict[str, Any] = {}
+    if is_file:
+        obj = OscalBaseModel.oscal_read_raw(abs_path)
+        primary_dict = next(iter(obj.values())) if isinstance(obj, dict) and len(obj) == 1 else {}
+    sub_paths: Dict[str, Tuple[Path, Optional[Type[Any]]]] = {}
+    for local_path in plan.iterdir(decomposed_dir):
+        if not plan.is_dir(local_path):
+            sub_paths[fs.extract_alias(local_path.name)] = (local_path, None)
+        else:
+            model_type, _ = plan.get_stripped_model_type(local_path)
+            if model_type.is_collection_container():
+                sub_paths[fs.extract_alias(local_path.name)] = (local_path, model_type.get_collection_type())
+
+    merged_model_type, merged_model_alias = plan.get_stripped_model_type(abs_path, list(sub_paths.keys()))
+    # write the fields in the order of the model, as serializing the loaded model would
+    field_order = {field.alias: index for index, field in enumerate(merged_model_type.__fields__.values())}
+    keys = sorted(
+        set(primary_dict.keys()) | set(sub_paths.keys()), key=lambda key: (field_order.get(key, len(field_order)), key)
+    )
+    out.write(b'{')
+    for index, key in enumerate(keys):
+        if index > 0:
+            out.write(b',')
+        out.write(orjson.dumps(key) + b':')
+        if key in sub_paths:
+            _stream_distributed(sub_paths[key][0], sub_paths[key][1], plan, out)
+        else:
+            out.write(orjson.dumps(primary_dict[key]))
+    out.write(b'}')
+    return merged_model_type, merged_model_alias
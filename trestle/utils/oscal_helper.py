@@ -17,6 +17,7 @@
 
 import logging
 import pathlib
+from typing import Dict, Optional, Tuple
 
 from trestle.oscal.catalog import Catalog
 from trestle.oscal.catalog import Control
@@ -37,6 +38,7 @@ class CatalogHelper():
     def __init__(self, catalog_file) -> None:
         """Initialize."""
         self._catalog = Catalog.oscal_read(pathlib.Path(catalog_file))
+        self._control_ids: Optional[Dict[str, Tuple[t_control_id, t_status]]] = None
         logger.debug(f'catalog: {catalog_file}')
 
     def exists(self) -> bool:
@@ -45,29 +47,28 @@ class CatalogHelper():
 
     def find_control_id(self, control_name: t_control_name) -> (t_control_id, t_status):
         """Find control_id for given control_name."""
-        for group in self._catalog.groups:
-            for control in group.controls:
-                control_id, status = self._find_control_id(control, control_name)
-                if control_id is not None:
-                    return control_id, status
-        return None, None
+        # map every label to its control on first use rather than searching the catalog for each name
+        if self._control_ids is None:
+            self._control_ids = {}
+            for group in self._catalog.groups:
+                for control in group.controls:
+                    self._add_control_ids(control)
+        return self._control_ids.get(control_name.strip().upper(), (None, None))
 
     def _find_control_prop(self, control: t_control, prop_name: t_prop_name) -> t_control_prop:
-        for prop in control.props:
+        for prop in control.props or []:
             if prop.name == prop_name:
                 return prop.value
         return None
 
-    def _find_control_id(self, control: t_control, control_name: t_control_name) -> (t_control_id, t_status):
+    def _add_control_ids(self, control: t_control) -> None:
+        """Add the control and its embedded controls to the map of labels, keeping the first control with a label."""
         label = self._find_control_prop(control, 'label')
-        if label.strip().upper() == control_name.strip().upper():
-            control_id = control.id
-            status = self._find_control_prop(control, 'status')
-            return control_id, status
+        if label is not None:
+            self._control_ids.setdefault(
+                label.strip().upper(), (control.id, self._find_control_prop(control, 'status'))
+            )
         if hasattr(control, 'controls'):
             if control.controls is not None:
                 for embedded_control in control.controls:
-                    control_id, status = self._find_control_id(embedded_control, control_name)
-                    if control_id is not None:
-                        return control_id, status
-        return None, None
+                    self._add_control_ids(embedded_control)